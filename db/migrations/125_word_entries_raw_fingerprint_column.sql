@@ -0,0 +1,128 @@
+-- Persist the importer's stored-raw fingerprint next to word_entries.raw so
+-- drift checks, reconciliation and no-op detection compare 64-char hashes
+-- instead of transferring and re-serializing whole payloads.
+-- The column is added without a default, so the ACCESS EXCLUSIVE lock stays
+-- metadata-only; existing rows are filled by the next migration.
+
+BEGIN;
+
+ALTER TABLE public.word_entries
+    ADD COLUMN IF NOT EXISTS raw_fingerprint text;
+
+-- Canonical JSON as the importer hashes it: keys sorted by code point, no
+-- whitespace, strings escaped as json.dumps(ensure_ascii=False) escapes them.
+-- Numbers print as jsonb keeps them, so a float the importer wrote in
+-- exponent form (1e-05) hashes differently here; readers recheck mismatches.
+CREATE OR REPLACE FUNCTION private.canonical_jsonb_text(p_value jsonb)
+RETURNS text
+LANGUAGE plpgsql
+IMMUTABLE
+STRICT
+PARALLEL SAFE
+SET search_path = pg_catalog, pg_temp
+AS $$
+DECLARE
+    v_parts text[];
+BEGIN
+    CASE jsonb_typeof(p_value)
+    WHEN 'object' THEN
+        SELECT array_agg(
+            to_jsonb(member.key)::text || ':' || CASE
+                WHEN jsonb_typeof(member.value) IN ('object', 'array')
+                    THEN private.canonical_jsonb_text(member.value)
+                ELSE member.value::text
+            END
+            ORDER BY member.key COLLATE "C"
+        )
+        INTO v_parts
+        FROM jsonb_each(p_value) AS member;
+        RETURN '{' || coalesce(array_to_string(v_parts, ','), '') || '}';
+    WHEN 'array' THEN
+        SELECT array_agg(
+            CASE
+                WHEN jsonb_typeof(element.value) IN ('object', 'array')
+                    THEN private.canonical_jsonb_text(element.value)
+                ELSE element.value::text
+            END
+            ORDER BY element.ordinality
+        )
+        INTO v_parts
+        FROM jsonb_array_elements(p_value)
+            WITH ORDINALITY AS element(value, ordinality);
+        RETURN '[' || coalesce(array_to_string(v_parts, ','), '') || ']';
+    ELSE
+        RETURN p_value::text;
+    END CASE;
+END;
+$$;
+
+-- SQL counterpart of importer.source_manifest.stored_raw_fingerprint.
+-- Source artifacts are JSON objects; any other raw has no fingerprint.
+CREATE OR REPLACE FUNCTION private.word_entry_raw_fingerprint(p_raw jsonb)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+STRICT
+PARALLEL SAFE
+SET search_path = pg_catalog, pg_temp
+AS $$
+    SELECT CASE
+        WHEN jsonb_typeof(p_raw) = 'object' THEN encode(
+            sha256(convert_to(
+                private.canonical_jsonb_text(p_raw - '_raw_html'),
+                'UTF8'
+            )),
+            'hex'
+        )
+    END
+$$;
+
+-- The importer writes raw_fingerprint with raw. Any other writer that sets
+-- a source row's raw without a matching fingerprint gets one computed here,
+-- so the column never vouches for content it was not derived from. Only
+-- source rows are fingerprinted; user entries skip the canonicalization.
+-- trg_word_entries_management sorts first, so management_kind is resolved.
+CREATE OR REPLACE FUNCTION private.assign_word_entry_raw_fingerprint()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = public, private, pg_temp
+AS $$
+BEGIN
+    IF NEW.raw IS NULL OR NEW.management_kind IS DISTINCT FROM 'source' THEN
+        NEW.raw_fingerprint := NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        NEW.raw_fingerprint := COALESCE(
+            NEW.raw_fingerprint,
+            private.word_entry_raw_fingerprint(NEW.raw)
+        );
+    ELSIF (
+            NEW.raw IS DISTINCT FROM OLD.raw
+            OR OLD.management_kind IS DISTINCT FROM 'source'
+          )
+          AND NEW.raw_fingerprint IS NOT DISTINCT FROM OLD.raw_fingerprint THEN
+        NEW.raw_fingerprint := private.word_entry_raw_fingerprint(NEW.raw);
+    END IF;
+
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_word_entries_raw_fingerprint
+    ON public.word_entries;
+CREATE TRIGGER trg_word_entries_raw_fingerprint
+BEFORE INSERT OR UPDATE OF raw, raw_fingerprint, management_kind
+ON public.word_entries
+FOR EACH ROW
+EXECUTE FUNCTION private.assign_word_entry_raw_fingerprint();
+
+REVOKE ALL ON FUNCTION private.canonical_jsonb_text(jsonb)
+    FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION private.word_entry_raw_fingerprint(jsonb)
+    FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION private.assign_word_entry_raw_fingerprint()
+    FROM PUBLIC, anon, authenticated;
+
+COMMENT ON COLUMN public.word_entries.raw_fingerprint IS
+'sha256 of raw without _raw_html in importer canonical JSON for source rows; written by the source importer, computed by trigger for other writers, NULL for user entries.';
+
+COMMIT;
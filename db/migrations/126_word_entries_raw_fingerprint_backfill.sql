@@ -0,0 +1,26 @@
+-- Backfill raw_fingerprint for source rows written before migration 125.
+-- Large tables must run db/scripts/run_word_entries_raw_fingerprint_backfill.sh
+-- first; it commits in id-ordered batches, after which this file is a no-op.
+
+DO $$
+DECLARE
+    v_pending_rows bigint;
+BEGIN
+    SELECT count(*)
+      INTO v_pending_rows
+      FROM public.word_entries
+     WHERE management_kind = 'source'
+       AND raw_fingerprint IS NULL
+       AND jsonb_typeof(raw) = 'object';
+
+    IF v_pending_rows > 100000 THEN
+        RAISE EXCEPTION 'word_entries_raw_fingerprint_backfill_requires_batches: % rows', v_pending_rows;
+    END IF;
+END;
+$$;
+
+UPDATE public.word_entries
+   SET raw_fingerprint = private.word_entry_raw_fingerprint(raw)
+ WHERE management_kind = 'source'
+   AND raw_fingerprint IS NULL
+   AND jsonb_typeof(raw) = 'object';
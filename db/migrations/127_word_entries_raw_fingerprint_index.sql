@@ -0,0 +1,6 @@
+-- Look up stored payloads by fingerprint within a dictionary, for drift
+-- checks and reconciliation matching.
+
+CREATE INDEX IF NOT EXISTS word_entries_dictionary_raw_fingerprint_idx
+ON public.word_entries (dictionary_id, raw_fingerprint)
+WHERE raw_fingerprint IS NOT NULL;
@@ -369,3 +369,8 @@
 
 -- Browser-safe recent Training review history projection
 \i db/migrations/124_recent_training_review_history_projection.sql
+
+-- Persisted stored-raw fingerprint on word_entries
+\i db/migrations/125_word_entries_raw_fingerprint_column.sql
+\i db/migrations/126_word_entries_raw_fingerprint_backfill.sql
+\i db/migrations/127_word_entries_raw_fingerprint_index.sql
@@ -0,0 +1,62 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+repo_root="$(cd "$script_dir/../.." && pwd)"
+psql_script="$repo_root/db/scripts/psql_supabase.sh"
+
+usage() {
+  cat <<'EOF'
+Usage:
+  db/scripts/run_word_entries_raw_fingerprint_backfill.sh [batch-size] [after-id]
+
+Fills word_entries.raw_fingerprint for source rows after migration 125. Each
+batch is a separate psql command/transaction and walks the primary key past
+the last id it updated. After an interruption, rerun with the last printed id.
+EOF
+}
+
+case "${1:-}" in
+  -h|--help|help)
+    usage
+    exit 0
+    ;;
+esac
+
+batch_size="${1:-1000}"
+after_id="${2:-00000000-0000-0000-0000-000000000000}"
+
+if [[ ! "$batch_size" =~ ^[0-9]+$ ]] || [[ "$batch_size" -eq 0 ]]; then
+  echo "batch-size must be a positive integer: $batch_size" >&2
+  exit 1
+fi
+if [[ ! "$after_id" =~ ^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$ ]]; then
+  echo "after-id must be a UUID: $after_id" >&2
+  exit 1
+fi
+
+while true; do
+  last_id="$("$psql_script" -v ON_ERROR_STOP=1 -At -c "
+    with batch as (
+      select id
+        from public.word_entries
+       where id > '${after_id}'::uuid
+         and management_kind = 'source'
+         and raw_fingerprint is null
+         and jsonb_typeof(raw) = 'object'
+       order by id
+       limit ${batch_size}
+    ), updated as (
+      update public.word_entries as entry
+         set raw_fingerprint = private.word_entry_raw_fingerprint(entry.raw)
+        from batch
+       where entry.id = batch.id
+      returning entry.id
+    )
+    select coalesce(max(id::text), '') from updated;")"
+  if [[ -z "$last_id" ]]; then
+    break
+  fi
+  echo "$last_id"
+  after_id="$last_id"
+done
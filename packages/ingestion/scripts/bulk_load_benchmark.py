@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Compare execute_values and COPY staging for source entry and binding writes.
+
+Each mode inserts N synthetic source entries, updates all of them, and
+upserts their bindings inside one transaction that is rolled back, so the
+target database is left unchanged.
+
+Usage:
+    DATABASE_URL=postgresql://... \\
+        python packages/ingestion/scripts/bulk_load_benchmark.py --rows 50000
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import psycopg2
+
+INGESTION_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(INGESTION_ROOT / "src"))
+
+from importer.db import ensure_dictionary, ensure_language  # noqa: E402
+from importer.import_phases import CountingCursor, PhaseTimer  # noqa: E402
+from importer.source_import import (  # noqa: E402
+    BULK_LOAD_MODES,
+    _bulk_insert_entries,
+    _bulk_update_entries,
+    _upsert_bindings,
+)
+from importer.source_manifest import stored_raw_fingerprint  # noqa: E402
+
+TEMPLATE_ARTIFACT = (
+    INGESTION_ROOT / "tests" / "fixtures" / "legacy_words" / "aanbranden_ww_1.json"
+)
+
+
+def _entry_rows(dictionary_id, count):
+    template = json.loads(TEMPLATE_ARTIFACT.read_text(encoding="utf-8"))[0]
+    rows = [
+        {
+            "id": str(uuid4()),
+            "dictionary_id": dictionary_id,
+            "language_code": "nl",
+            "headword": f"benchmark{number}",
+            "meaning_id": 1,
+            "part_of_speech": template.get("part_of_speech"),
+            "gender": None,
+            "is_nt2_2000": number % 10 == 0,
+            "vandale_id": None,
+            "raw": template | {"headword": f"benchmark{number}"},
+            "normalized_pos_status": "known",
+        }
+        for number in range(count)
+    ]
+    for row in rows:
+        row["raw_fingerprint"] = stored_raw_fingerprint(row["raw"])
+    return rows
+
+
+def _binding_rows(dictionary_id, run_id, entries):
+    return [
+        (
+            dictionary_id,
+            "bulk-load-benchmark-v1",
+            f"benchmark:{entry['headword']}:1",
+            f"benchmark:{entry['headword']}",
+            1,
+            entry["id"],
+            "active",
+            run_id,
+            run_id,
+            "benchmark-manifest",
+            "vandale-semantic-v1",
+            "0" * 64,
+            {"headword_raw": entry["headword"], "source_index": number},
+            {"action": "insert-new", "method": "benchmark"},
+        )
+        for number, entry in enumerate(entries)
+    ]
+
+
+def _measure(database_url, bulk_load, rows):
+    timer = PhaseTimer()
+    connection = psycopg2.connect(database_url)
+    try:
+        with connection.cursor(cursor_factory=CountingCursor) as cursor:
+            ensure_language(cursor, "nl", "Dutch")
+            dictionary_id = ensure_dictionary(
+                cursor,
+                "nl",
+                f"bulk-load-benchmark-{uuid4().hex}",
+                "Bulk load benchmark",
+                None,
+                "nl-vandale-v2",
+                1,
+            )
+            cursor.execute(
+                """
+                insert into private.dictionary_import_runs (
+                    dictionary_id, identity_scheme_version,
+                    artifact_format_version, manifest_checksum,
+                    input_checksum, source_record_count, artifact_count,
+                    status, actor, reason
+                )
+                values (%s, 'bulk-load-benchmark-v1', 'benchmark', 'benchmark',
+                        'benchmark', %s, %s, 'running', 'benchmark', 'benchmark')
+                returning id::text
+                """,
+                (dictionary_id, rows, rows),
+            )
+            run_id = cursor.fetchone()[0]
+            entries = _entry_rows(dictionary_id, rows)
+            bindings = _binding_rows(dictionary_id, run_id, entries)
+
+            cursor.timer = timer
+            timer.start("insert_entries")
+            _bulk_insert_entries(cursor, entries, bulk_load)
+            timer.start("update_entries")
+            _bulk_update_entries(cursor, entries, bulk_load)
+            timer.start("upsert_bindings")
+            _upsert_bindings(cursor, bindings, bulk_load)
+            timer.stop()
+    finally:
+        connection.rollback()
+        connection.close()
+    phases = timer.as_dict()
+    return {
+        "seconds": round(sum(phase["seconds"] for phase in phases.values()), 3),
+        "phases": phases,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="Postgres connection string (env DATABASE_URL).",
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=BULK_LOAD_MODES,
+        default=list(BULK_LOAD_MODES),
+    )
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("database URL must be provided either through --database-url or DATABASE_URL")
+
+    report = {"rows": args.rows}
+    for bulk_load in args.modes:
+        report[bulk_load] = _measure(args.database_url, bulk_load, args.rows)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
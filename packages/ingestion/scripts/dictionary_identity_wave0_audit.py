@@ -13,24 +13,30 @@ from pathlib import Path
 from typing import Any, Iterable
 
 
-def _load_dictionary_parser():
-    parser_path = (
+def _load_importer_module(module_name: str):
+    # Loaded by path so the audit does not import the importer package and
+    # its database dependencies.
+    module_path = (
         Path(__file__).resolve().parents[1]
-        / "src/importer/dictionary_entry_parser.py"
+        / "src/importer"
+        / f"{module_name}.py"
     )
     spec = importlib.util.spec_from_file_location(
-        "dictionary_identity_wave0_parser",
-        parser_path,
+        f"dictionary_identity_wave0_{module_name}",
+        module_path,
     )
     if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load dictionary parser from {parser_path}")
+        raise RuntimeError(f"Unable to load {module_name} from {module_path}")
     module = importlib.util.module_from_spec(spec)
     sys.modules[spec.name] = module
     spec.loader.exec_module(module)
-    return module.parse_dictionary_file
+    return module
 
 
-parse_dictionary_file = _load_dictionary_parser()
+parse_dictionary_file = _load_importer_module(
+    "dictionary_entry_parser"
+).parse_dictionary_file
+file_sha256 = _load_importer_module("hashing").file_sha256
 
 
 GENERATOR_VERSION = "dictionary-identity-wave0-audit-v0.1"
@@ -112,8 +118,7 @@ def build_audit(source_dir: Path) -> AuditResult:
 
     for path in _relative_json_paths(source_dir):
         relative_path = path.relative_to(source_dir).as_posix()
-        artifact_bytes = path.read_bytes()
-        artifact_sha = _sha256(artifact_bytes)
+        artifact_sha = file_sha256(path)
         tree_hash.update(relative_path.encode("utf-8"))
         tree_hash.update(b"\0")
         tree_hash.update(artifact_sha.encode("ascii"))
@@ -15,6 +15,7 @@ import psycopg2
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from importer.source_manifest import (  # noqa: E402
+    default_manifest_cache_dir,
     load_source_manifest,
     stored_raw_fingerprint,
 )
@@ -70,8 +71,16 @@ def generate_plan(
     dictionary_slug: str,
     output: Path,
     metadata_fallback_reason: str | None,
+    manifest_cache_dir: Path | None = None,
+    verify_manifest: bool = False,
 ) -> Counter:
-    manifest = load_source_manifest(data_dir)
+    # Only matched targets' headwords are read, so payloads load on demand.
+    manifest = load_source_manifest(
+        data_dir,
+        cache_dir=manifest_cache_dir,
+        verify=verify_manifest,
+        lazy_payloads=True,
+    )
     legacy_by_fingerprint, legacy_by_index_sense = _load_legacy_artifacts(
         legacy_data_dir
     )
@@ -89,7 +98,8 @@ def generate_plan(
         cursor.execute(
             """
             select entry.id::text, entry.headword, entry.meaning_id,
-                   entry.vandale_id, entry.raw
+                   entry.vandale_id, entry.raw ->> 'headword',
+                   entry.raw_fingerprint
             from public.word_entries as entry
             join public.dictionaries as dictionary
               on dictionary.id = entry.dictionary_id
@@ -99,6 +109,26 @@ def generate_plan(
             (dictionary_slug,),
         )
         existing_rows = cursor.fetchall()
+        # A fingerprint that matches no legacy payload may be NULL or the
+        # migration trigger's jsonb spelling of a float; those rows are
+        # fingerprinted from raw before they count as unmatched.
+        unmatched_ids = [
+            row[0]
+            for row in existing_rows
+            if row[5] not in legacy_by_fingerprint
+        ]
+        cursor.execute(
+            """
+            select id::text, raw
+            from public.word_entries
+            where id = any(%s::uuid[])
+            """,
+            (unmatched_ids,),
+        )
+        exact_fingerprints = {
+            word_entry_id: stored_raw_fingerprint(raw)
+            for word_entry_id, raw in cursor.fetchall()
+        }
 
     stats = Counter(existing_rows=len(existing_rows))
     decisions_by_key = {}
@@ -106,8 +136,15 @@ def generate_plan(
     fallback_rows = []
     ambiguities = []
 
-    for word_entry_id, headword, meaning_id, vandale_id, raw in existing_rows:
-        raw_fingerprint = stored_raw_fingerprint(raw)
+    for (
+        word_entry_id,
+        headword,
+        meaning_id,
+        vandale_id,
+        raw_headword,
+        raw_fingerprint,
+    ) in existing_rows:
+        raw_fingerprint = exact_fingerprints.get(word_entry_id, raw_fingerprint)
         legacy_matches = legacy_by_fingerprint.get(raw_fingerprint, [])
         method = None
         reason = None
@@ -179,8 +216,8 @@ def generate_plan(
                 }
             )
             continue
-        if (raw.get("headword") or headword).strip() != (
-            target.payload.get("headword") or ""
+        if (raw_headword or headword).strip() != (
+            target.load_payload().get("headword") or ""
         ).strip():
             ambiguities.append(
                 {
@@ -277,6 +314,16 @@ def main() -> None:
             "can only be matched by source index/sense after semantic review."
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the verified-manifest cache.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Fully re-verify every artifact even if the manifest cache is fresh.",
+    )
     arguments = parser.parse_args()
     if not arguments.database_url:
         parser.error("--database-url or DATABASE_URL is required")
@@ -290,6 +337,10 @@ def main() -> None:
         metadata_fallback_reason=(
             arguments.approve_metadata_fallback_reason
         ),
+        manifest_cache_dir=(
+            None if arguments.no_cache else default_manifest_cache_dir()
+        ),
+        verify_manifest=arguments.verify,
     )
     print(json.dumps(stats, sort_keys=True))
 
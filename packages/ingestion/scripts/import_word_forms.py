@@ -13,7 +13,10 @@ import psycopg2.extras
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from importer.db import refresh_dictionary_search_documents
-from importer.source_manifest import load_source_manifest
+from importer.source_manifest import (
+    default_manifest_cache_dir,
+    load_source_manifest,
+)
 from importer.word_forms import extract_word_forms
 
 
@@ -23,6 +26,8 @@ DEFAULT_DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "words_content
 
 def collect_source_forms(
     data_dir: Path,
+    cache_dir: Path | None = None,
+    verify: bool = False,
 ) -> Tuple[str, str, Dict[str, Tuple[str, List[str]]]]:
     """
     Return versioned source-entry keys mapped to their headword and forms.
@@ -31,7 +36,7 @@ def collect_source_forms(
     restored senses separate even when their headword and meaning number are
     identical.
     """
-    manifest = load_source_manifest(data_dir)
+    manifest = load_source_manifest(data_dir, cache_dir=cache_dir, verify=verify)
     output: Dict[str, Tuple[str, List[str]]] = {}
     for artifact in manifest.artifacts:
         headword = artifact.payload.get("headword")
@@ -171,6 +176,16 @@ def main() -> None:
         action="store_true",
         help="Refresh dictionary_search_documents after importing forms. For full imports, prefer a controlled backfill job.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the verified-manifest cache.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Fully re-verify every artifact even if the manifest cache is fresh.",
+    )
     args = parser.parse_args()
     data_dir = Path(args.data_dir)
 
@@ -211,7 +226,11 @@ def main() -> None:
                 identity_scheme,
                 manifest_checksum,
                 forms_by_source_key,
-            ) = collect_source_forms(data_dir)
+            ) = collect_source_forms(
+                data_dir,
+                cache_dir=None if args.no_cache else default_manifest_cache_dir(),
+                verify=args.verify,
+            )
             source_bindings = load_source_binding_ids(
                 cursor,
                 dictionary_id,
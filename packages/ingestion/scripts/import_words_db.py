@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import os
 import sys
@@ -10,6 +11,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from importer.core import import_entries
+from importer.source_import import BULK_LOAD_MODES
+from importer.source_manifest import default_manifest_cache_dir
 
 # Try to load .env.local if python-dotenv is installed
 try:
@@ -102,6 +105,59 @@ def main() -> None:
             "already contains source rows."
         ),
     )
+    parser.add_argument(
+        "--manifest-workers",
+        type=int,
+        default=1,
+        help="Threads used to read, checksum and validate manifest artifacts.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the verified-manifest cache.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Fully re-verify every artifact even if the manifest cache is fresh.",
+    )
+    parser.add_argument(
+        "--bulk-load",
+        choices=BULK_LOAD_MODES,
+        default="values",
+        help=(
+            "How entry and binding rows reach Postgres: execute_values pages, "
+            "or COPY into temporary staging tables applied set-based."
+        ),
+    )
+    parser.add_argument(
+        "--delta-writes",
+        action="store_true",
+        help=(
+            "On re-import, rewrite only entries whose raw content, derived "
+            "columns or content nodes changed; refresh the run id of the rest."
+        ),
+    )
+    parser.add_argument(
+        "--resumable",
+        action="store_true",
+        help=(
+            "Commit entries in batches of whole source groups and checkpoint "
+            "the import run; rerunning the same manifest resumes after the "
+            "last committed batch."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Artifacts per committed batch with --resumable.",
+    )
+    parser.add_argument(
+        "--report-json",
+        type=Path,
+        help="Also write the import counts and per-phase timings to this JSON file.",
+    )
     args = parser.parse_args()
 
     if not args.database_url:
@@ -130,6 +186,13 @@ def main() -> None:
         dictionary_schema_version=args.dictionary_schema_version,
         refresh_search_documents=args.refresh_search_documents,
         reconciliation_plan=args.reconciliation_plan,
+        manifest_workers=args.manifest_workers,
+        manifest_cache_dir=None if args.no_cache else default_manifest_cache_dir(),
+        verify_manifest=args.verify,
+        bulk_load=args.bulk_load,
+        delta_writes=args.delta_writes,
+        resumable=args.resumable,
+        batch_size=args.batch_size,
     )
 
     if getattr(stats, "no_op", False):
@@ -147,6 +210,27 @@ def main() -> None:
             stats.nt2_skipped,
         )
 
+    report = json.dumps(
+        {
+            "run_id": stats.run_id,
+            "no_op": stats.no_op,
+            "total_files": stats.total_files,
+            "matched": stats.matched,
+            "inserted": stats.inserted,
+            "changed": stats.changed,
+            "untouched": stats.untouched,
+            "batches": stats.batches,
+            "resumed_batches": stats.resumed_batches,
+            "nt2_linked": stats.nt2_linked,
+            "nt2_skipped": stats.nt2_skipped,
+            "phases": stats.phases,
+        },
+        indent=2,
+    )
+    logging.info("Import report:\n%s", report)
+    if args.report_json:
+        args.report_json.write_text(report + "\n", encoding="utf-8")
+
 
 if __name__ == "__main__":
     main()
@@ -3,11 +3,13 @@
 Process raw words from data/word_list.json and save parsed content to data/words_content/.
 """
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
+from itertools import islice
 import json
+import os
 import re
 import sys
-from copy import deepcopy
 from pathlib import Path
 
 sys.path.insert(
@@ -16,7 +18,16 @@ sys.path.insert(
 )
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from vandale_html_parser import parse_vandale_entry_fixed
+import vandale_html_parser
+from vandale_html_parser import (
+    DEFAULT_PARSER_BACKEND,
+    PARSER_BACKENDS,
+    VandaleParseContext,
+    parse_vandale_entry_fixed,
+    resolve_parser_backend,
+)
+from importer.canonical_json import canonical_json
+from importer.hashing import file_sha256
 from importer.pointer_meanings import promote_resolvable_pointer_only_meaning
 
 INPUT_FILE = Path("data/word_list.json")
@@ -28,6 +39,51 @@ ARTIFACT_FORMAT_VERSION = "vandale-structured-v2"
 # browsed one definition at a time.
 SPLIT_MEANINGS = True
 
+# Sidecar cache mapping each raw record's sha256 to its parse result, so an
+# --incremental run only re-parses records whose source changed. Bump the
+# version when the cached shape changes; parser source edits invalidate it
+# through the header written by _parse_cache_header. A run first spills parse
+# results to PARSE_SPILL_FILE; an --incremental run promotes it to the cache
+# when it completes, and any other run deletes it, so plain output carries
+# no cache next to the artifacts.
+PARSE_CACHE_FILE = "_parse_cache.jsonl"
+PARSE_SPILL_FILE = "_parse_cache.jsonl.tmp"
+PARSE_CACHE_VERSION = "vandale-parse-cache-v2"
+
+# The default "files" layout writes one JSON file per sense. "packed" appends
+# the same bytes to one container and records each artifact's offset and
+# length in the manifest, which keeps the directory small to list and sync.
+OUTPUT_FORMATS = ("files", "packed")
+ARTIFACT_PACK_FILE = "_artifacts.pack"
+ARTIFACT_PACK_SPILL_FILE = "_artifacts.pack.tmp"
+
+# Names of artifact files a run is about to create outside the previous
+# manifest: new artifacts and the temporary files replacements go through.
+# The run removes the journal once its manifest is in place, so a journal
+# left behind marks an interrupted run whose files the next one deletes.
+PENDING_ARTIFACTS_FILE = "_artifacts.pending"
+MANIFEST_SPILL_FILE = "_manifest.jsonl.tmp"
+
+MANIFEST_FILES = {
+    "_manifest.jsonl",
+    "_manifest.summary.json",
+    MANIFEST_SPILL_FILE,
+    PENDING_ARTIFACTS_FILE,
+    PARSE_CACHE_FILE,
+    PARSE_SPILL_FILE,
+    ARTIFACT_PACK_FILE,
+    ARTIFACT_PACK_SPILL_FILE,
+}
+
+# Input is streamed in chunks of this many characters and parsed in batches of
+# this many records, which bounds memory regardless of corpus size.
+READ_CHUNK_SIZE = 1 << 20
+PARSE_BATCH_SIZE = 1024
+
+# Upper bound on records sent to a parse worker per round trip; small inputs
+# use smaller chunks so every worker gets a share.
+PARSE_CHUNK_SIZE = 64
+
 def sanitize_filename(name):
     """Sanitize filename to avoid issues with special characters."""
     # Replace slashes and other dangerous chars
@@ -52,21 +108,18 @@ def normalize_headword_and_pronunciation(entry: dict) -> dict:
     return entry
 
 
-def extract_clean_filename(headword, parsed_pos):
+def extract_clean_filename(headword, parsed_pos, context=None):
     """
     Extract a clean filename from headword.
     For entries like "aan<sup>1</sup> <i>(bw)</i>", extract base word and POS.
+    Pass the parser's VandaleParseContext to reuse its headword tree.
     Returns: (base_word, pos_suffix)
     """
-    # Remove HTML tags to get clean text
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(headword, 'html.parser')
-    
-    # Remove superscript tags (they contain variant numbers like 1, 2, etc.)
-    for sup in soup.find_all('sup'):
-        sup.decompose()
-    
-    clean = soup.get_text()
+    if context is None:
+        context = VandaleParseContext("", headword)
+
+    # Drop superscript tags (they contain variant numbers like 1, 2, etc.)
+    clean = context.headword_text(("sup",))
     
     # Pattern: "word word (pos)" or just "word word"
     # Extract base word (which may contain spaces) and POS if present
@@ -93,6 +146,26 @@ def extract_clean_filename(headword, parsed_pos):
     # Fallback: sanitize the whole thing
     return sanitize_filename(clean.replace(' ', '_')), None
 
+def split_entry_senses(parsed: dict):
+    """Yield ``(meaning_id, entry)`` for each artifact written from ``parsed``.
+
+    Each entry is a shallow copy with its own ``meanings`` list, so article
+    data such as ``_raw_html`` and conjugation tables is shared rather than
+    copied per sense. Callers may rebind top-level keys, as pointer promotion
+    does, but must not mutate shared nested values in place.
+    """
+    meanings = parsed.get("meanings") or []
+    if SPLIT_MEANINGS and len(meanings) > 1:
+        senses = [[] if meaning is None else [meaning] for meaning in meanings]
+    else:
+        senses = [list(meanings)]
+    for meaning_id, sense_meanings in enumerate(senses, 1):
+        entry = dict(parsed)
+        entry["meanings"] = sense_meanings
+        entry["meaning_id"] = meaning_id
+        yield meaning_id, entry
+
+
 def _source_identity(parsed: dict, raw_data: dict, meaning_id: int) -> dict:
     evidence = parsed.get("source_identity") or {}
     pos_evidence = parsed.get("part_of_speech_evidence") or {
@@ -130,12 +203,7 @@ def _source_identity(parsed: dict, raw_data: dict, meaning_id: int) -> dict:
     homograph_number = evidence.get("homograph_number")
     if homograph_number is not None:
         identity_evidence["homograph_number"] = homograph_number
-    evidence_bytes = json.dumps(
-        identity_evidence,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
+    evidence_bytes = canonical_json(identity_evidence)
     evidence_digest = hashlib.sha256(evidence_bytes).hexdigest()[:32]
     source_group_key = (
         f"{dictionary_id}:{IDENTITY_SCHEME_VERSION}:{evidence_digest}"
@@ -156,119 +224,419 @@ def _source_identity(parsed: dict, raw_data: dict, meaning_id: int) -> dict:
     return identity
 
 
-def _manifest_record(output_file: Path, output_dir: Path, source: dict) -> dict:
+def _manifest_record(
+    output_file: Path,
+    output_dir: Path,
+    source: dict,
+    content_sha256: str,
+) -> dict:
     return {
         "artifact_path": output_file.relative_to(output_dir).as_posix(),
-        "content_sha256": hashlib.sha256(output_file.read_bytes()).hexdigest(),
+        "content_sha256": content_sha256,
         "identity_scheme_version": source["identity_scheme_version"],
         "source_entry_key": source["source_entry_key"],
         "source_group_key": source["source_group_key"],
     }
 
 
-def process_words(input_file: Path = INPUT_FILE, output_dir: Path = OUTPUT_DIR):
-    if not input_file.exists():
-        raise FileNotFoundError(f"Input file {input_file} not found")
-    if output_dir.exists() and any(output_dir.iterdir()):
-        raise ValueError(f"Output directory {output_dir} must be empty")
-    output_dir.mkdir(parents=True, exist_ok=True)
+def _iter_json_array(text_file):
+    """Yield the items of a top-level JSON array without loading all of it."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def next_char():
+        nonlocal buffer, position, eof
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer) or eof:
+                return buffer[position:position + 1]
+            chunk = text_file.read(READ_CHUNK_SIZE)
+            buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+
+    if next_char() != "[":
+        raise ValueError("Input must be a JSON array of raw records")
+    position += 1
+    if next_char() == "]":
+        position += 1
+    else:
+        while True:
+            next_char()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    item, end = None, None
+                # A value that ends exactly at the buffer edge may continue.
+                if end is not None and (end < len(buffer) or eof):
+                    break
+                chunk = text_file.read(READ_CHUNK_SIZE)
+                buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+            yield item
+            position = end
+            separator = next_char()
+            position += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                raise ValueError(
+                    f"Expected ',' or ']' in JSON array, found {separator!r}"
+                )
+            buffer, position = buffer[position:], 0
+    if next_char():
+        raise ValueError("Unexpected data after the JSON array")
+
+
+def iter_raw_records(input_file: Path):
+    """Stream raw records from a JSON array or, for ``.jsonl``, one per line."""
+    with open(input_file, "r", encoding="utf-8") as text_file:
+        if input_file.suffix == ".jsonl":
+            for line in text_file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(text_file)
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        word_list = json.load(f)
-    
-    print(f"Loaded {len(word_list)} words from {input_file}")
-    
-    parsed_records = []
-    for i, raw_data in enumerate(word_list):
-        headword = raw_data.get('headword')
-        content = raw_data.get('content')
 
-        if not headword or not content:
-            print(f"Skipping index {i}: missing headword or content")
-            continue
+def _has_parse_input(raw_data: dict) -> bool:
+    return bool(raw_data.get('headword') and raw_data.get('content'))
+
 
-        parsed = normalize_headword_and_pronunciation(
-            parse_vandale_entry_fixed(content, headword)
+def _raw_record_sha256(raw_data: dict) -> str:
+    record = {
+        key: raw_data.get(key)
+        for key in ("content", "dictionaryId", "headword", "index")
+    }
+    return hashlib.sha256(
+        json.dumps(
+            record,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _parse_cache_header(parser_backend: str) -> str:
+    parser_sha256 = hashlib.sha256()
+    for source_file in (vandale_html_parser.__file__, __file__):
+        parser_sha256.update(Path(source_file).read_bytes())
+    return json.dumps(
+        {
+            "cache_version": PARSE_CACHE_VERSION,
+            "parser_backend": parser_backend,
+            "parser_sha256": parser_sha256.hexdigest(),
+        },
+        sort_keys=True,
+    )
+
+
+class _ParseCache:
+    """Previous parse results, indexed by record digest and read on demand.
+
+    Each entry line is a record sha256 and its JSON parse result separated by
+    a tab, so indexing only keeps file offsets in memory. A header from
+    another parser version yields no hits.
+    """
+
+    def __init__(self, cache_path: Path, header: str):
+        self._offsets = {}
+        self._file = None
+        if not cache_path.is_file():
+            return
+        self._file = open(cache_path, "rb")
+        if self._file.readline().decode("utf-8").rstrip("\n") != header:
+            return
+        offset = self._file.tell()
+        for line in self._file:
+            self._offsets[line[:64].decode("ascii")] = offset
+            offset += len(line)
+
+    def get(self, record_sha256: str):
+        offset = self._offsets.get(record_sha256)
+        if offset is None:
+            return None
+        self._file.seek(offset)
+        line = self._file.readline().decode("utf-8").rstrip("\n")
+        return line.split("\t", 1)[1]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def _previous_artifacts(output_dir: Path) -> dict:
+    """Map artifacts of an existing manifest to their checksums.
+
+    Files an interrupted run journaled in PENDING_ARTIFACTS_FILE that the
+    manifest does not list are deleted first. Refuses directories holding
+    any other file the previous run did not write.
+    """
+    manifest_path = output_dir / "_manifest.jsonl"
+    listed = {}
+    if manifest_path.is_file():
+        for line in manifest_path.read_text(encoding="utf-8").splitlines():
+            record = json.loads(line)
+            listed[record["artifact_path"]] = record["content_sha256"]
+    pending_path = output_dir / PENDING_ARTIFACTS_FILE
+    if pending_path.is_file():
+        for name in pending_path.read_text(encoding="utf-8").splitlines():
+            if name not in listed:
+                (output_dir / name).unlink(missing_ok=True)
+            # The replacement may already have been renamed into place, so
+            # the listed checksum no longer vouches for the file.
+            replaced = name.removesuffix(".tmp")
+            if replaced != name and replaced in listed:
+                listed[replaced] = ""
+        pending_path.unlink()
+    present = {path.name for path in output_dir.iterdir()}
+    if not manifest_path.is_file():
+        if present - MANIFEST_FILES:
+            raise ValueError(
+                f"Output directory {output_dir} has no _manifest.jsonl; "
+                "incremental mode needs the output of a previous run"
+            )
+        return {}
+    unknown = sorted(present - listed.keys() - MANIFEST_FILES)
+    if unknown:
+        raise ValueError(
+            f"Output directory {output_dir} has files outside its manifest: "
+            + ", ".join(unknown[:5])
         )
-        parsed['_metadata'] = {
-            'search_term': headword,
-            'headword_raw': headword,
-            'index': raw_data.get('index'),
-            'dictionaryId': raw_data.get('dictionaryId')
-        }
-        parsed['_raw_html'] = content
-        parsed_records.append((raw_data, headword, parsed))
+    return {name: listed[name] for name in present & listed.keys()}
+
+
+def _artifact_bytes(entry: dict) -> bytes:
+    return json.dumps([entry], indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _journal_pending(pending_file, path: Path) -> None:
+    if pending_file is not None:
+        pending_file.write(path.name + "\n")
+        pending_file.flush()
+
+
+def _write_artifact(
+    output_file: Path,
+    entry: dict,
+    previous_sha256: str | None = None,
+    pending_file=None,
+) -> tuple[str, bool]:
+    """Serialize, hash and write one artifact in a single pass.
 
-    available_headwords = {
-        parsed["headword"].strip()
-        for _, _, parsed in parsed_records
-        if isinstance(parsed.get("headword"), str) and parsed["headword"].strip()
+    Returns the content sha256 and whether the file was written. The checksum
+    comes from the in-memory bytes, so the manifest never re-reads the file.
+    An artifact a previous run wrote with the same checksum and size is left
+    alone; a changed one is replaced through an atomic rename. Files created
+    outside the previous manifest are journaled to ``pending_file`` first.
+    """
+    data = _artifact_bytes(entry)
+    content_sha256 = hashlib.sha256(data).hexdigest()
+    if previous_sha256 is None:
+        _journal_pending(pending_file, output_file)
+        output_file.write_bytes(data)
+        return content_sha256, True
+    if (
+        previous_sha256 == content_sha256
+        and output_file.stat().st_size == len(data)
+    ):
+        return content_sha256, False
+    temporary_file = output_file.with_name(output_file.name + ".tmp")
+    _journal_pending(pending_file, temporary_file)
+    temporary_file.write_bytes(data)
+    os.replace(temporary_file, output_file)
+    return content_sha256, True
+
+
+def _append_artifact(pack_file, entry: dict) -> tuple[str, dict]:
+    """Append one artifact to the pack; return its sha256 and manifest span."""
+    data = _artifact_bytes(entry)
+    span = {"pack_length": len(data), "pack_offset": pack_file.tell()}
+    pack_file.write(data)
+    return hashlib.sha256(data).hexdigest(), span
+
+
+def _parse_raw_record(task):
+    """Parse one raw record; runs in a worker process when --workers > 1."""
+    raw_data, parser_backend = task
+    headword = raw_data['headword']
+    content = raw_data['content']
+    context = VandaleParseContext(content, headword, parser_backend)
+    parsed = normalize_headword_and_pronunciation(
+        parse_vandale_entry_fixed(content, headword, context=context)
+    )
+    filename_parts = extract_clean_filename(
+        headword,
+        parsed.get('part_of_speech'),
+        context=context,
+    )
+    parsed['_metadata'] = {
+        'search_term': headword,
+        'headword_raw': headword,
+        'index': raw_data.get('index'),
+        'dictionaryId': raw_data.get('dictionaryId')
     }
+    return json.dumps(
+        {"filename_parts": filename_parts, "parsed": parsed},
+        ensure_ascii=False,
+    )
+
+
+def _parse_into_spill(
+    input_file, spill_file, parse_cache, parser_backend, pool, workers
+):
+    """First pass: parse (or reuse) every record into the spill file.
+
+    Records are read in bounded batches and parse results go straight to disk,
+    so only the headword set needed for pointer promotion stays in memory.
+    """
+    available_headwords = set()
+    record_count = 0
+    reused_count = 0
+    records = iter_raw_records(input_file)
+    while batch := list(islice(records, PARSE_BATCH_SIZE)):
+        entries = []
+        misses = []
+        for raw_data in batch:
+            record_index = record_count
+            record_count += 1
+            if not _has_parse_input(raw_data):
+                print(f"Skipping index {record_index}: missing headword or content")
+                continue
+            digest = _raw_record_sha256(raw_data)
+            cached = parse_cache.get(digest)
+            if cached is None:
+                misses.append((raw_data, parser_backend))
+            else:
+                reused_count += 1
+            entries.append((digest, cached))
+
+        if pool is None:
+            fresh = map(_parse_raw_record, misses)
+        else:
+            chunksize = max(1, min(PARSE_CHUNK_SIZE, len(misses) // (workers * 4)))
+            fresh = pool.map(_parse_raw_record, misses, chunksize=chunksize)
+
+        for digest, payload in entries:
+            if payload is None:
+                payload = next(fresh)
+            headword = json.loads(payload)["parsed"].get("headword")
+            if isinstance(headword, str) and headword.strip():
+                available_headwords.add(headword.strip())
+            spill_file.write(f"{digest}\t{payload}\n")
+    return available_headwords, record_count, reused_count
+
+
+def _spilled_records(input_file, spill_path):
+    """Second pass: pair each raw record with its spilled parse result."""
+    with open(spill_path, "r", encoding="utf-8") as spill_file:
+        spill_file.readline()
+        for raw_data in iter_raw_records(input_file):
+            if not _has_parse_input(raw_data):
+                continue
+            digest, payload = spill_file.readline().rstrip("\n").split("\t", 1)
+            if digest != _raw_record_sha256(raw_data):
+                raise ValueError(f"Input file {input_file} changed during processing")
+            result = json.loads(payload)
+            parsed = result["parsed"]
+            parsed['_raw_html'] = raw_data['content']
+            yield raw_data, tuple(result["filename_parts"]), parsed
+
+
+def process_words(
+    input_file: Path = INPUT_FILE,
+    output_dir: Path = OUTPUT_DIR,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+    workers: int = 1,
+    incremental: bool = False,
+    output_format: str = "files",
+):
+    parser_backend = resolve_parser_backend(parser_backend)
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {output_format!r}")
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file {input_file} not found")
+    previous_artifacts = {}
+    if incremental and output_dir.exists():
+        previous_artifacts = _previous_artifacts(output_dir)
+    elif output_dir.exists() and any(output_dir.iterdir()):
+        raise ValueError(
+            f"Output directory {output_dir} must be empty; "
+            "pass --incremental to update a previous run"
+        )
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = output_dir / PARSE_CACHE_FILE
+    spill_path = output_dir / PARSE_SPILL_FILE
+    cache_header = _parse_cache_header(parser_backend)
+    input_sha256 = file_sha256(input_file)
+
+    # A fresh run has an empty output directory, so only --incremental can hit.
+    parse_cache = _ParseCache(cache_path, cache_header)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        with open(spill_path, "w", encoding="utf-8") as spill_file:
+            spill_file.write(cache_header + "\n")
+            available_headwords, source_record_count, reused_count = (
+                _parse_into_spill(
+                    input_file,
+                    spill_file,
+                    parse_cache,
+                    parser_backend,
+                    pool,
+                    workers,
+                )
+            )
+    finally:
+        parse_cache.close()
+        if pool is not None:
+            pool.shutdown()
+
+    print(f"Loaded {source_record_count} words from {input_file}")
 
     saved_count = 0
+    written_count = 0
     seen_source_entry_keys = set()
     seen_output_paths = set()
     manifest_records = []
 
-    for raw_data, headword, parsed in parsed_records:
+    pack_path = output_dir / ARTIFACT_PACK_FILE
+    pack_spill_path = output_dir / ARTIFACT_PACK_SPILL_FILE
+    pack_file = None
+    pending_file = None
+    if output_format == "packed":
+        pack_file = open(pack_spill_path, "wb")
+    else:
+        pending_file = open(
+            output_dir / PENDING_ARTIFACTS_FILE, "w", encoding="utf-8"
+        )
+
+    parsed_records = _spilled_records(input_file, spill_path)
+    for raw_data, (base_word, pos_suffix), parsed in parsed_records:
         # Save
-        base_word, pos_suffix = extract_clean_filename(headword, parsed.get('part_of_speech'))
         pos_label = sanitize_filename(pos_suffix or parsed.get('part_of_speech') or "nopos")
 
-        meanings = parsed.get("meanings") or []
-        if not meanings:
-            meanings = [None]
-
-        if SPLIT_MEANINGS and len(meanings) > 1:
-            for meaning_id, meaning in enumerate(meanings, 1):
-                entry_copy = deepcopy(parsed)
-                entry_copy["meanings"] = [] if meaning is None else [meaning]
-                entry_copy["meaning_id"] = meaning_id
-                promote_resolvable_pointer_only_meaning(
-                    entry_copy,
-                    available_headwords,
-                )
-                entry_copy["_source"] = _source_identity(
-                    parsed,
-                    raw_data,
-                    meaning_id,
-                )
-
-                article_id = entry_copy["_source"]["provider_article_id"]
-                source_index = entry_copy["_source"]["source_index"]
-                filename = (
-                    f"{source_index:06d}_{sanitize_filename(article_id)}_"
-                    f"{base_word}_{pos_label}_{meaning_id}.json"
-                )
-                output_file = output_dir / filename
-                source_entry_key = entry_copy["_source"]["source_entry_key"]
-                if source_entry_key in seen_source_entry_keys:
-                    raise ValueError(f"Duplicate source entry key: {source_entry_key}")
-                if output_file in seen_output_paths:
-                    raise ValueError(f"Duplicate output path: {output_file}")
-                seen_source_entry_keys.add(source_entry_key)
-                seen_output_paths.add(output_file)
-                with open(output_file, 'w', encoding='utf-8') as out_f:
-                    json.dump([entry_copy], out_f, indent=2, ensure_ascii=False)
-                manifest_records.append(
-                    _manifest_record(output_file, output_dir, entry_copy["_source"])
-                )
-                saved_count += 1
-        else:
-            entry_copy = deepcopy(parsed)
-            entry_copy["meanings"] = meanings if meanings != [None] else []
-            entry_copy["meaning_id"] = 1
+        for meaning_id, entry_copy in split_entry_senses(parsed):
             promote_resolvable_pointer_only_meaning(
                 entry_copy,
                 available_headwords,
             )
-            entry_copy["_source"] = _source_identity(parsed, raw_data, 1)
+            entry_copy["_source"] = _source_identity(
+                parsed,
+                raw_data,
+                meaning_id,
+            )
 
             article_id = entry_copy["_source"]["provider_article_id"]
             source_index = entry_copy["_source"]["source_index"]
             filename = (
                 f"{source_index:06d}_{sanitize_filename(article_id)}_"
-                f"{base_word}_{pos_label}_1.json"
+                f"{base_word}_{pos_label}_{meaning_id}.json"
             )
             output_file = output_dir / filename
             source_entry_key = entry_copy["_source"]["source_entry_key"]
@@ -278,15 +646,51 @@ def process_words(input_file: Path = INPUT_FILE, output_dir: Path = OUTPUT_DIR):
                 raise ValueError(f"Duplicate output path: {output_file}")
             seen_source_entry_keys.add(source_entry_key)
             seen_output_paths.add(output_file)
-            with open(output_file, 'w', encoding='utf-8') as out_f:
-                json.dump([entry_copy], out_f, indent=2, ensure_ascii=False)
+            if pack_file is None:
+                content_sha256, written = _write_artifact(
+                    output_file,
+                    entry_copy,
+                    previous_artifacts.get(filename),
+                    pending_file,
+                )
+                pack_span = {}
+            else:
+                content_sha256, pack_span = _append_artifact(pack_file, entry_copy)
+                written = True
+            written_count += written
             manifest_records.append(
-                _manifest_record(output_file, output_dir, entry_copy["_source"])
+                _manifest_record(
+                    output_file,
+                    output_dir,
+                    entry_copy["_source"],
+                    content_sha256,
+                )
+                | pack_span
             )
             saved_count += 1
 
+    if pack_file is not None:
+        pack_file.close()
+    if pending_file is not None:
+        pending_file.close()
+
+    if file_sha256(input_file) != input_sha256:
+        raise ValueError(f"Input file {input_file} changed during processing")
+
+    if output_format == "packed":
+        os.replace(pack_spill_path, pack_path)
+        stale_artifact_paths = set(previous_artifacts)
+    else:
+        pack_path.unlink(missing_ok=True)
+        stale_artifact_paths = previous_artifacts.keys() - {
+            path.name for path in seen_output_paths
+        }
+    for artifact_path in sorted(stale_artifact_paths):
+        (output_dir / artifact_path).unlink(missing_ok=True)
+
     manifest_path = output_dir / "_manifest.jsonl"
-    manifest_path.write_text(
+    manifest_spill_path = output_dir / MANIFEST_SPILL_FILE
+    manifest_spill_path.write_text(
         "".join(
             json.dumps(
                 record,
@@ -302,14 +706,17 @@ def process_words(input_file: Path = INPUT_FILE, output_dir: Path = OUTPUT_DIR):
         ),
         encoding="utf-8",
     )
+    os.replace(manifest_spill_path, manifest_path)
     summary = {
         "artifact_count": saved_count,
         "artifact_format_version": ARTIFACT_FORMAT_VERSION,
         "identity_scheme_version": IDENTITY_SCHEME_VERSION,
-        "input_sha256": hashlib.sha256(input_file.read_bytes()).hexdigest(),
-        "manifest_sha256": hashlib.sha256(manifest_path.read_bytes()).hexdigest(),
-        "source_record_count": len(word_list),
+        "input_sha256": input_sha256,
+        "manifest_sha256": file_sha256(manifest_path),
+        "source_record_count": source_record_count,
     }
+    if output_format == "packed":
+        summary["artifact_pack"] = ARTIFACT_PACK_FILE
     (output_dir / "_manifest.summary.json").write_text(
         json.dumps(
             summary,
@@ -321,10 +728,22 @@ def process_words(input_file: Path = INPUT_FILE, output_dir: Path = OUTPUT_DIR):
         encoding="utf-8",
     )
 
+    if incremental:
+        os.replace(spill_path, cache_path)
+    else:
+        spill_path.unlink()
+    (output_dir / PENDING_ARTIFACTS_FILE).unlink(missing_ok=True)
+
     print(
-        f"Processed {len(word_list)} items. "
+        f"Processed {source_record_count} items. "
         f"Saved/Updated {saved_count} entries in {output_dir}"
     )
+    if incremental:
+        print(
+            f"Incremental: reused {reused_count} parsed records, "
+            f"wrote {written_count} changed artifacts, "
+            f"removed {len(stale_artifact_paths)} stale artifacts"
+        )
 
 def main():
     parser = argparse.ArgumentParser(
@@ -332,8 +751,38 @@ def main():
     )
     parser.add_argument("--input", type=Path, default=INPUT_FILE)
     parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument(
+        "--parser-backend",
+        choices=PARSER_BACKENDS + ("auto",),
+        default=DEFAULT_PARSER_BACKEND,
+        help="HTML tree builder; 'auto' uses lxml when it is installed.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parse records across this many processes; output is identical.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Update a previous run's output, re-parsing only changed records.",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="files",
+        help="Write one JSON file per artifact, or one packed container.",
+    )
     arguments = parser.parse_args()
-    process_words(arguments.input, arguments.output_dir)
+    process_words(
+        arguments.input,
+        arguments.output_dir,
+        parser_backend=arguments.parser_backend,
+        workers=arguments.workers,
+        incremental=arguments.incremental,
+        output_format=arguments.output_format,
+    )
 
 
 if __name__ == "__main__":
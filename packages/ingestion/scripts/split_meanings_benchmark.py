@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Compare per-sense deepcopy against split_entry_senses on a high-sense article.
+
+Usage:
+    python packages/ingestion/scripts/split_meanings_benchmark.py --senses 80
+"""
+import argparse
+from copy import deepcopy
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from process_raw_words import split_entry_senses  # noqa: E402
+
+
+def _synthetic_article(sense_count: int) -> dict:
+    meanings = [
+        {
+            "definition": f"betekenis {number} " + "toelichting " * 20,
+            "context": "",
+            "examples": [f"voorbeeldzin {number}.{example}" for example in range(6)],
+            "idioms": [
+                {
+                    "expression": f"uitdrukking {number}",
+                    "explanation": "uitleg " * 10,
+                    "examples": ["gebruik in een zin"],
+                }
+            ],
+        }
+        for number in range(1, sense_count + 1)
+    ]
+    return {
+        "headword": "slaan",
+        "conjugation_table": {
+            tense: {person: f"{tense}-{person}" for person in ("ik", "jij", "wij")}
+            for tense in ("present", "past")
+        },
+        "meanings": meanings,
+        "_raw_html": "<span class='f1m'>" + "x" * 400 + "</span>" * sense_count,
+    }
+
+
+def _deepcopy_senses(parsed: dict):
+    for meaning_id, meaning in enumerate(parsed["meanings"], 1):
+        entry = deepcopy(parsed)
+        entry["meanings"] = [meaning]
+        entry["meaning_id"] = meaning_id
+        yield meaning_id, entry
+
+
+def _write_all(split, parsed: dict) -> None:
+    for _, entry in split(parsed):
+        json.dumps([entry], indent=2, ensure_ascii=False)
+
+
+def _measure(split, parsed: dict, repeat: int) -> dict:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        _write_all(split, parsed)
+    elapsed = time.perf_counter() - started
+
+    # Measured separately because tracing slows the timed loop down.
+    tracemalloc.start()
+    _write_all(split, parsed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ms_per_article": round(elapsed * 1000 / repeat, 2),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--senses", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    parsed = _synthetic_article(args.senses)
+    expected = [
+        json.dumps([entry], indent=2, ensure_ascii=False)
+        for _, entry in _deepcopy_senses(parsed)
+    ]
+    actual = [
+        json.dumps([entry], indent=2, ensure_ascii=False)
+        for _, entry in split_entry_senses(parsed)
+    ]
+    if actual != expected:
+        raise SystemExit("split_entry_senses output differs from deepcopy")
+
+    report = {
+        "senses": args.senses,
+        "deepcopy": _measure(_deepcopy_senses, parsed, args.repeat),
+        "shallow": _measure(split_entry_senses, parsed, args.repeat),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+CANONICAL_JSON_BACKENDS = ("orjson", "stdlib")
+
+# orjson spells some floats differently from json.dumps: 1e16 vs 1e+16,
+# 1e-6 vs 1e-06, and 0.00001 vs 1e-05. Output that might hold such a number is
+# re-encoded with the stdlib; a string that merely looks like one only costs
+# the fallback. Exponents are matched where a number token ends, so the scan
+# keeps a literal prefix and stays cheap next to the encode itself.
+_EXPONENT_TOKEN_RE = re.compile(rb"e-?[0-9]+(?:[,\]}]|\Z)")
+_SMALL_DECIMAL = b"0.0000"
+
+
+def _stdlib_canonical_json(value: Any) -> bytes:
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _orjson_canonical_json(value: Any) -> bytes:
+    # NaN and Infinity would come out as null here, but such payloads never
+    # reach stored fingerprints: PostgreSQL jsonb rejects them.
+    try:
+        encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        # Integers past 64 bits and non-string keys.
+        return _stdlib_canonical_json(value)
+    if _SMALL_DECIMAL in encoded or _EXPONENT_TOKEN_RE.search(encoded):
+        return _stdlib_canonical_json(value)
+    return encoded
+
+
+def available_canonical_json_backends() -> tuple[str, ...]:
+    """Return the usable encoders, in ``CANONICAL_JSON_BACKENDS`` order."""
+    if orjson is None:
+        return ("stdlib",)
+    return CANONICAL_JSON_BACKENDS
+
+
+def canonical_json_encoder(backend: str = "auto") -> Callable[[Any], bytes]:
+    """Return an encoder producing the canonical bytes every fingerprint hashes.
+
+    Canonical JSON is UTF-8 with sorted keys and no whitespace, byte for
+    byte what ``json.dumps(sort_keys=True, ensure_ascii=False,
+    separators=(",", ":"))`` writes. ``"auto"`` picks orjson when it is
+    installed and the stdlib otherwise; both return identical bytes.
+    """
+    if backend == "auto":
+        backend = available_canonical_json_backends()[0]
+    if backend not in CANONICAL_JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown canonical JSON backend {backend!r}; "
+            f"expected one of {', '.join(CANONICAL_JSON_BACKENDS + ('auto',))}"
+        )
+    if backend not in available_canonical_json_backends():
+        raise ValueError(f"Canonical JSON backend {backend!r} is not installed")
+    if backend == "orjson":
+        return _orjson_canonical_json
+    return _stdlib_canonical_json
+
+
+canonical_json = canonical_json_encoder()
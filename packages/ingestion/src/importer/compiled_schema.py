@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+Check = Callable[[Any], bool]
+
+# Keywords that never affect a verdict ($defs only holds $ref targets).
+_ANNOTATIONS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "$defs",
+        "title",
+        "description",
+        "default",
+        "examples",
+    }
+)
+_TYPE_CHECKS: dict[str, Check] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "number": lambda value: isinstance(value, (int, float))
+    and not isinstance(value, bool),
+    # Draft 2020-12 counts 1.0 as an integer.
+    "integer": lambda value: (
+        isinstance(value, int) and not isinstance(value, bool)
+    )
+    or (isinstance(value, float) and value.is_integer()),
+}
+
+
+class UnsupportedSchemaError(ValueError):
+    """The schema uses a keyword or form the compiler does not translate."""
+
+
+def compile_schema(schema: dict[str, Any]) -> Check:
+    """Compile a JSON Schema (2020-12 subset) into a pass/fail predicate.
+
+    The predicate only answers "is this instance valid"; callers that need
+    error messages and locations re-run the generic validator on failures.
+    Any keyword outside the supported subset raises
+    ``UnsupportedSchemaError`` so the caller can keep the generic validator.
+    """
+    return _SchemaCompiler(schema).compile(schema)
+
+
+class _SchemaCompiler:
+    def __init__(self, root: dict[str, Any]):
+        self.root = root
+        self.refs: dict[str, Check] = {}
+
+    def compile(self, schema: Any) -> Check:
+        if schema is True:
+            return lambda value: True
+        if schema is False:
+            return lambda value: False
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"schema must be an object: {schema!r}")
+        if "$id" in schema and schema is not self.root:
+            # A nested $id would move the base URI that $ref resolves against.
+            raise UnsupportedSchemaError("nested $id is not supported")
+
+        checks: list[Check] = []
+        for keyword, argument in schema.items():
+            if keyword in _ANNOTATIONS:
+                continue
+            compile_keyword = _KEYWORDS.get(keyword)
+            if compile_keyword is None:
+                raise UnsupportedSchemaError(f"unsupported keyword: {keyword}")
+            checks.append(compile_keyword(self, argument, schema))
+
+        if not checks:
+            return lambda value: True
+        if len(checks) == 1:
+            return checks[0]
+        checks_tuple = tuple(checks)
+
+        def check_all(value: Any) -> bool:
+            for check in checks_tuple:
+                if not check(value):
+                    return False
+            return True
+
+        return check_all
+
+    def _type(self, argument: Any, schema: dict[str, Any]) -> Check:
+        names = [argument] if isinstance(argument, str) else list(argument)
+        try:
+            type_checks = tuple(_TYPE_CHECKS[name] for name in names)
+        except (KeyError, TypeError):
+            raise UnsupportedSchemaError(f"unsupported type: {argument!r}")
+        if len(type_checks) == 1:
+            return type_checks[0]
+        return lambda value: any(check(value) for check in type_checks)
+
+    def _enum(self, argument: Any, schema: dict[str, Any]) -> Check:
+        # Restricted to strings, where == matches the generic validator's
+        # equality (it keeps True and 1 apart, for example).
+        if not all(isinstance(option, str) for option in argument):
+            raise UnsupportedSchemaError("only string enums are supported")
+        options = frozenset(argument)
+        return lambda value: isinstance(value, str) and value in options
+
+    def _required(self, argument: Any, schema: dict[str, Any]) -> Check:
+        names = tuple(argument)
+        return lambda value: not isinstance(value, dict) or all(
+            name in value for name in names
+        )
+
+    def _properties(self, argument: Any, schema: dict[str, Any]) -> Check:
+        checks = tuple(
+            (name, self.compile(subschema)) for name, subschema in argument.items()
+        )
+
+        def check(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return True
+            for name, check_property in checks:
+                if name in value and not check_property(value[name]):
+                    return False
+            return True
+
+        return check
+
+    def _additional_properties(self, argument: Any, schema: dict[str, Any]) -> Check:
+        if "patternProperties" in schema:
+            raise UnsupportedSchemaError("patternProperties is not supported")
+        if argument is True:
+            return lambda value: True
+        known = frozenset(schema.get("properties", ()))
+        check_extra = self.compile(argument)
+        return lambda value: not isinstance(value, dict) or all(
+            check_extra(item)
+            for name, item in value.items()
+            if name not in known
+        )
+
+    def _items(self, argument: Any, schema: dict[str, Any]) -> Check:
+        if "prefixItems" in schema:
+            raise UnsupportedSchemaError("prefixItems is not supported")
+        check_item = self.compile(argument)
+        return lambda value: not isinstance(value, list) or all(
+            check_item(item) for item in value
+        )
+
+    def _one_of(self, argument: Any, schema: dict[str, Any]) -> Check:
+        checks = tuple(self.compile(subschema) for subschema in argument)
+
+        def check(value: Any) -> bool:
+            matched = 0
+            for check_branch in checks:
+                if check_branch(value):
+                    matched += 1
+                    if matched > 1:
+                        return False
+            return matched == 1
+
+        return check
+
+    def _min_length(self, argument: Any, schema: dict[str, Any]) -> Check:
+        return lambda value: not isinstance(value, str) or len(value) >= argument
+
+    def _min_items(self, argument: Any, schema: dict[str, Any]) -> Check:
+        return lambda value: not isinstance(value, list) or len(value) >= argument
+
+    def _max_items(self, argument: Any, schema: dict[str, Any]) -> Check:
+        return lambda value: not isinstance(value, list) or len(value) <= argument
+
+    def _minimum(self, argument: Any, schema: dict[str, Any]) -> Check:
+        return lambda value: (
+            not isinstance(value, (int, float))
+            or isinstance(value, bool)
+            or value >= argument
+        )
+
+    def _ref(self, argument: Any, schema: dict[str, Any]) -> Check:
+        if not isinstance(argument, str) or not argument.startswith("#"):
+            raise UnsupportedSchemaError(f"only local $ref is supported: {argument}")
+        if argument not in self.refs:
+            # Resolved lazily so recursive references terminate.
+            self.refs[argument] = lambda value: True
+            self.refs[argument] = self.compile(self._resolve(argument))
+        return lambda value: self.refs[argument](value)
+
+    def _resolve(self, reference: str) -> Any:
+        target: Any = self.root
+        pointer = reference[1:]
+        if not pointer:
+            return target
+        if not pointer.startswith("/"):
+            raise UnsupportedSchemaError(f"unsupported $ref: {reference}")
+        for token in pointer[1:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            try:
+                target = target[int(token) if isinstance(target, list) else token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise UnsupportedSchemaError(f"unresolvable $ref: {reference}")
+        return target
+
+
+_KEYWORDS: dict[str, Callable[..., Check]] = {
+    "type": _SchemaCompiler._type,
+    "enum": _SchemaCompiler._enum,
+    "required": _SchemaCompiler._required,
+    "properties": _SchemaCompiler._properties,
+    "additionalProperties": _SchemaCompiler._additional_properties,
+    "items": _SchemaCompiler._items,
+    "oneOf": _SchemaCompiler._one_of,
+    "minLength": _SchemaCompiler._min_length,
+    "minItems": _SchemaCompiler._min_items,
+    "maxItems": _SchemaCompiler._max_items,
+    "minimum": _SchemaCompiler._minimum,
+    "$ref": _SchemaCompiler._ref,
+}
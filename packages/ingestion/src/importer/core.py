@@ -30,6 +30,13 @@ def import_entries(
     dictionary_schema_version: int = 1,
     refresh_search_documents: bool = False,
     reconciliation_plan: Path | str | None = None,
+    manifest_workers: int = 1,
+    manifest_cache_dir: Path | str | None = None,
+    verify_manifest: bool = False,
+    bulk_load: str = "values",
+    delta_writes: bool = False,
+    resumable: bool = False,
+    batch_size: int = 1000,
 ) -> SourceImportStats:
     path = Path(data_dir)
     if not path.exists():
@@ -55,4 +62,11 @@ def import_entries(
         dictionary_schema_key=dictionary_schema_key,
         dictionary_schema_version=dictionary_schema_version,
         refresh_search_documents=refresh_search_documents,
+        manifest_workers=manifest_workers,
+        manifest_cache_dir=manifest_cache_dir,
+        verify_manifest=verify_manifest,
+        bulk_load=bulk_load,
+        delta_writes=delta_writes,
+        resumable=resumable,
+        batch_size=batch_size,
     )
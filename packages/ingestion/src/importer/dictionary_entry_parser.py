@@ -103,6 +103,11 @@ def _extract_meaning_id(payload: dict[str, Any], path: Path) -> int:
 
 def parse_dictionary_file(path: Path) -> ParsedEntry:
     content = json.loads(path.read_text(encoding="utf-8"))
+    return parse_dictionary_content(content, path)
+
+
+def parse_dictionary_content(content: Any, path: Path) -> ParsedEntry:
+    """Parse decoded artifact JSON; ``path`` names the artifact in errors."""
     if not isinstance(content, list) or not content:
         raise ValueError(f"{path} must contain a non-empty array")
 
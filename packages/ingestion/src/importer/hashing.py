@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+def file_sha256(path: Path | str) -> str:
+    """Return the hex sha256 of a file, streamed through a fixed-size buffer.
+
+    Inputs such as ``word_list.json`` or an artifact pack can be far larger
+    than anything the pipeline keeps in memory, so the file is never read
+    into one bytes object.
+    """
+    with open(path, "rb") as source:
+        return hashlib.file_digest(source, "sha256").hexdigest()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import time
+from typing import Any
+
+import psycopg2.extensions
+
+
+@dataclass
+class PhaseStats:
+    seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    round_trips: int = 0
+
+
+class PhaseTimer:
+    """Accumulate wall time and database traffic per named import phase.
+
+    Phases run one after another: ``start`` closes the running phase and opens
+    the next, ``stop`` closes the last. ``rows`` counts rows affected or
+    returned, ``bytes`` the statement bytes sent, and ``round_trips`` the
+    statements executed. Phases that never touch the database can add their
+    own row and byte counts through ``record``.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+        self._active: PhaseStats | None = None
+        self._started = 0.0
+
+    def start(self, name: str) -> None:
+        self.stop()
+        self._active = self.phases.setdefault(name, PhaseStats())
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._active is not None:
+            self._active.seconds += time.perf_counter() - self._started
+            self._active = None
+
+    def record(self, *, rows: int = 0, bytes: int = 0, round_trips: int = 0) -> None:
+        if self._active is None:
+            return
+        self._active.rows += rows
+        self._active.bytes += bytes
+        self._active.round_trips += round_trips
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: asdict(stats) | {"seconds": round(stats.seconds, 6)}
+            for name, stats in self.phases.items()
+        }
+
+
+class CountingCursor(psycopg2.extensions.cursor):
+    """Cursor that reports each statement to ``timer`` when one is attached.
+
+    ``execute_values`` and the other batch helpers go through ``execute``, so
+    every page they send counts as one round trip. A ``copy_expert`` counts
+    as one round trip carrying the statement and the UTF-8 bytes of the
+    streamed data, but no rows: COPY only fills staging tables, and the
+    statement that applies them reports the rows.
+    """
+
+    timer: PhaseTimer | None = None
+
+    def execute(self, query, vars=None):
+        try:
+            return super().execute(query, vars)
+        finally:
+            if self.timer is not None:
+                self.timer.record(
+                    rows=max(self.rowcount, 0),
+                    bytes=len(self.query or b""),
+                    round_trips=1,
+                )
+
+    def copy_expert(self, sql, file, size=8192):
+        reader = _CountingReader(file)
+        try:
+            return super().copy_expert(sql, reader, size)
+        finally:
+            if self.timer is not None:
+                self.timer.record(
+                    bytes=len(sql.encode("utf-8")) + reader.bytes,
+                    round_trips=1,
+                )
+
+
+class _CountingReader:
+    """File wrapper that counts the UTF-8 bytes ``read`` hands to COPY."""
+
+    def __init__(self, file) -> None:
+        self._file = file
+        self.bytes = 0
+
+    def read(self, size=-1):
+        chunk = self._file.read(size)
+        self.bytes += len(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        return chunk
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import closing
+from dataclasses import dataclass, field
 import hashlib
+import io
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from uuid import uuid4
 
 import psycopg2
@@ -16,17 +18,23 @@ from importer.db import (
     ensure_word_list,
     refresh_dictionary_search_documents,
 )
-from importer.dictionary_entry_parser import parse_dictionary_file
+from importer.canonical_json import canonical_json
+from importer.dictionary_entry_parser import parse_dictionary_content
+from importer.import_phases import CountingCursor, PhaseTimer
 from importer.reconciliation import load_reconciliation_plan
 from importer.source_manifest import (
     SourceArtifact,
     load_source_manifest,
-    platform_v2_content_node_inputs,
-    semantic_content_fingerprint,
+    ordinal_independent_fingerprint,
     stored_raw_fingerprint,
 )
 
 
+# "values" sends execute_values pages; "copy" streams rows into temporary
+# staging tables and applies each write as one set-based statement.
+BULK_LOAD_MODES = ("values", "copy")
+
+
 @dataclass
 class SourceImportStats:
     total_files: int
@@ -39,8 +47,15 @@ class SourceImportStats:
     nt2_linked: int = 0
     nt2_skipped: int = 0
     processed: int = 0
+    # Matched entries that delta writes left in place.
+    untouched: int = 0
+    # Batches committed by this call and by the earlier attempt it resumed.
+    batches: int = 0
+    resumed_batches: int = 0
     no_op: bool = False
     run_id: Optional[str] = None
+    # Per-phase seconds, rows, bytes and round trips; see PhaseTimer.
+    phases: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     @property
     def updated(self) -> int:
@@ -52,12 +67,6 @@ def _uuid_set_checksum(values: set[str]) -> str:
     return hashlib.sha256(canonical).hexdigest()
 
 
-def _ordinal_independent_fingerprint(payload: dict) -> str:
-    content = dict(payload)
-    content.pop("meaning_id", None)
-    return semantic_content_fingerprint(content)
-
-
 def _verify_source_schema(cursor) -> None:
     cursor.execute(
         """
@@ -82,6 +91,13 @@ def _verify_source_schema(cursor) -> None:
                 where table_schema = 'public'
                   and table_name = 'word_entries'
                   and column_name = 'management_kind'
+            ),
+            exists (
+                select 1
+                from information_schema.columns
+                where table_schema = 'public'
+                  and table_name = 'word_entries'
+                  and column_name = 'raw_fingerprint'
             )
         """
     )
@@ -93,6 +109,7 @@ def _verify_source_schema(cursor) -> None:
         reconcile_nodes,
         report_atom_columns,
         management_column,
+        raw_fingerprint_column,
     ) = cursor.fetchone()
     if (
         import_runs is None
@@ -102,9 +119,11 @@ def _verify_source_schema(cursor) -> None:
         or reconcile_nodes is None
         or not report_atom_columns
         or not management_column
+        or not raw_fingerprint_column
     ):
         raise RuntimeError(
-            "Platform V2 identity migrations 102, 105, 106, and 120 are not applied"
+            "Platform V2 identity migrations 102, 105, 106, 120, and 125 "
+            "are not applied"
         )
 
 
@@ -114,7 +133,7 @@ def _load_active_bindings(cursor, dictionary_id: str, scheme: str):
         select source_entry_key, word_entry_id::text,
                source_group_key, sense_ordinal,
                content_fingerprint_version, content_fingerprint,
-               manifest_checksum
+               manifest_checksum, identity_evidence
         from private.source_entry_bindings
         where dictionary_id = %s
           and identity_scheme_version = %s
@@ -130,15 +149,16 @@ def _load_active_bindings(cursor, dictionary_id: str, scheme: str):
             "content_fingerprint_version": row[4],
             "content_fingerprint": row[5],
             "manifest_checksum": row[6],
+            "identity_evidence": row[7],
         }
         for row in cursor.fetchall()
     }
 
 
-def _load_source_rows(cursor, dictionary_id: str):
+def _load_source_fingerprints(cursor, dictionary_id: str):
     cursor.execute(
         """
-        select id::text, raw
+        select id::text, raw_fingerprint
         from public.word_entries
         where dictionary_id = %s
           and management_kind = 'source'
@@ -149,6 +169,178 @@ def _load_source_rows(cursor, dictionary_id: str):
     return {row[0]: row[1] for row in cursor.fetchall()}
 
 
+def _resolve_raw_fingerprints(cursor, stored, expected):
+    """Return exact stored-raw fingerprints and the raws that were rechecked.
+
+    A stored ``raw_fingerprint`` equal to the expected value is taken as is.
+    Any other row, including one fingerprinted by the migration 125 trigger
+    with jsonb float spelling, is fetched and fingerprinted in Python.
+    """
+    fingerprints = {}
+    suspects = []
+    for word_entry_id, fingerprint in expected.items():
+        if stored.get(word_entry_id) == fingerprint:
+            fingerprints[word_entry_id] = fingerprint
+        else:
+            suspects.append(word_entry_id)
+    raws = {}
+    if suspects:
+        cursor.execute(
+            """
+            select id::text, raw
+            from public.word_entries
+            where id = any(%s::uuid[])
+            """,
+            (suspects,),
+        )
+        raws = {row[0]: row[1] for row in cursor.fetchall()}
+        for word_entry_id, raw in raws.items():
+            fingerprints[word_entry_id] = stored_raw_fingerprint(raw)
+    return fingerprints, raws
+
+
+def _load_derived_columns(cursor, dictionary_id: str):
+    """Return ``_DERIVED_COLUMNS`` of active source rows by id."""
+    cursor.execute(
+        f"""
+        select id::text, {", ".join(_DERIVED_COLUMNS)}
+        from public.word_entries
+        where dictionary_id = %s
+          and management_kind = 'source'
+          and source_lifecycle = 'active'
+        """,
+        (dictionary_id,),
+    )
+    return {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+
+
+def _load_active_content_nodes(cursor, word_entry_ids: list[str]):
+    """Return active content-node report atoms grouped by entry id."""
+    cursor.execute(
+        """
+        select entry_id::text, kind, source_text_fingerprint,
+               canonical_source_text, source_order
+        from private.platform_v2_content_nodes
+        where entry_id = any(%s::uuid[])
+          and binding_state = 'active'
+        """,
+        (word_entry_ids,),
+    )
+    actual_nodes: dict[
+        str,
+        list[tuple[str, str, str | None, int | None]],
+    ] = {}
+    for (
+        entry_id,
+        kind,
+        fingerprint,
+        source_text,
+        source_order,
+    ) in cursor.fetchall():
+        actual_nodes.setdefault(entry_id, []).append(
+            (kind, fingerprint, source_text, source_order)
+        )
+    return actual_nodes
+
+
+def _report_atoms_digest(atoms) -> str:
+    """Digest report atoms exactly as ``_SOURCE_DIGEST_MISMATCHES`` does."""
+    lines = sorted(
+        "\t".join(
+            (
+                kind,
+                fingerprint,
+                "-"
+                if source_text is None
+                else hashlib.sha256(source_text.encode("utf-8")).hexdigest(),
+                "-" if source_order is None else str(source_order),
+            )
+        )
+        for kind, fingerprint, source_text, source_order in atoms
+    )
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+# Compares the expected raw fingerprints and report-atom digests with the
+# stored rows of a dictionary and returns only the entries that differ or lack
+# a counterpart, so neither raw payloads nor content nodes cross the wire.
+_SOURCE_DIGEST_MISMATCHES = """
+    with expected as (
+        select *
+        from unnest(
+            %(entry_ids)s::uuid[],
+            %(raw_fingerprints)s::text[],
+            %(node_digests)s::text[]
+        ) as expected (entry_id, raw_fingerprint, node_digest)
+    ),
+    active as (
+        select id, raw_fingerprint
+        from public.word_entries
+        where dictionary_id = %(dictionary_id)s
+          and management_kind = 'source'
+          and source_lifecycle = 'active'
+    ),
+    node_lines as (
+        select
+            node.entry_id,
+            concat_ws(
+                E'\t',
+                node.kind,
+                node.source_text_fingerprint,
+                coalesce(
+                    encode(
+                        sha256(convert_to(node.canonical_source_text, 'UTF8')),
+                        'hex'
+                    ),
+                    '-'
+                ),
+                coalesce(node.source_order::text, '-')
+            ) as line
+        from private.platform_v2_content_nodes as node
+        join active
+          on active.id = node.entry_id
+        where node.binding_state = 'active'
+    ),
+    nodes as (
+        select
+            entry_id,
+            encode(
+                sha256(convert_to(
+                    string_agg(line, E'\n' order by line collate "C"),
+                    'UTF8'
+                )),
+                'hex'
+            ) as node_digest
+        from node_lines
+        group by entry_id
+    ),
+    compared as (
+        select
+            coalesce(expected.entry_id, active.id) as entry_id,
+            expected.entry_id is null or active.id is null as uncovered,
+            active.raw_fingerprint is distinct from expected.raw_fingerprint
+                as raw_differs,
+            coalesce(nodes.node_digest, %(empty_digest)s)
+                is distinct from expected.node_digest as nodes_differ
+        from expected
+        full join active
+          on active.id = expected.entry_id
+        left join nodes
+          on nodes.entry_id = coalesce(expected.entry_id, active.id)
+    )
+    select entry_id::text, uncovered, raw_differs, nodes_differ
+    from compared
+    where uncovered or raw_differs or nodes_differ
+"""
+
+
+def _content_nodes_match(actual_nodes, expected_nodes) -> bool:
+    return (
+        len(actual_nodes) == len(expected_nodes)
+        and set(actual_nodes) == set(expected_nodes)
+    )
+
+
 def _completed_manifest_is_noop(
     cursor,
     *,
@@ -206,82 +398,49 @@ def _completed_manifest_is_noop(
                 "Completed manifest exists but active bindings do not match it"
             )
 
-    word_entry_ids = [
-        binding["word_entry_id"]
-        for binding in bindings.values()
-    ]
+    artifacts_by_entry_id = {
+        bindings[source_entry_key]["word_entry_id"]: artifact
+        for source_entry_key, artifact in artifacts_by_key.items()
+    }
     cursor.execute(
-        """
-        select id::text, raw
-        from public.word_entries
-        where dictionary_id = %s
-          and management_kind = 'source'
-          and source_lifecycle = 'active'
-        """,
-        (dictionary_id,),
+        _SOURCE_DIGEST_MISMATCHES,
+        {
+            "dictionary_id": dictionary_id,
+            "entry_ids": list(artifacts_by_entry_id),
+            "raw_fingerprints": [
+                artifact.stored_raw_fingerprint
+                for artifact in artifacts_by_entry_id.values()
+            ],
+            "node_digests": [
+                _report_atoms_digest(
+                    artifact.content_node_columns.report_atoms()
+                )
+                for artifact in artifacts_by_entry_id.values()
+            ],
+            "empty_digest": _report_atoms_digest([]),
+        },
     )
-    active_rows = {row[0]: row[1] for row in cursor.fetchall()}
-    if set(active_rows) != set(word_entry_ids):
+    mismatches = cursor.fetchall()
+    if any(uncovered for _, uncovered, _, _ in mismatches):
         raise RuntimeError(
             "Completed manifest exists but active source rows and bindings "
             "do not have exact coverage"
         )
 
-    for source_entry_key, binding in bindings.items():
-        actual_fingerprint = stored_raw_fingerprint(
-            active_rows[binding["word_entry_id"]]
+    # A differing raw_fingerprint may only be the trigger's jsonb spelling of
+    # a float, so it selects the rows to fingerprint exactly.
+    expected_suspects = {
+        entry_id: artifacts_by_entry_id[entry_id].stored_raw_fingerprint
+        for entry_id, _, raw_differs, _ in mismatches
+        if raw_differs
+    }
+    fingerprints, _ = _resolve_raw_fingerprints(cursor, {}, expected_suspects)
+    if fingerprints != expected_suspects:
+        raise RuntimeError(
+            "Completed manifest exists but stored source content drifted"
         )
-        artifact = artifacts_by_key[source_entry_key]
-        if actual_fingerprint != stored_raw_fingerprint(artifact.payload):
-            raise RuntimeError(
-                "Completed manifest exists but stored source content drifted"
-            )
 
-    cursor.execute(
-        """
-        select entry_id::text, kind, source_text_fingerprint,
-               canonical_source_text, source_order
-        from private.platform_v2_content_nodes
-        where entry_id = any(%s::uuid[])
-          and binding_state = 'active'
-        """,
-        (word_entry_ids,),
-    )
-    actual_nodes: dict[
-        str,
-        list[tuple[str, str, str | None, int | None]],
-    ] = {}
-    for (
-        entry_id,
-        kind,
-        fingerprint,
-        source_text,
-        source_order,
-    ) in cursor.fetchall():
-        actual_nodes.setdefault(entry_id, []).append(
-            (kind, fingerprint, source_text, source_order)
-        )
-    for source_entry_key, artifact in artifacts_by_key.items():
-        entry_id = bindings[source_entry_key]["word_entry_id"]
-        expected_nodes = [
-            (
-                node["kind"],
-                node["sourceTextFingerprint"],
-                node["sourceText"],
-                source_order,
-            )
-            for source_order, node in enumerate(
-                platform_v2_content_node_inputs(artifact.payload),
-                start=1,
-            )
-        ]
-        actual_entry_nodes = actual_nodes.get(entry_id, [])
-        if (
-            len(actual_entry_nodes) != len(expected_nodes)
-            or set(actual_entry_nodes) != set(expected_nodes)
-        ):
-            return False
-    return True
+    return not any(nodes_differ for _, _, _, nodes_differ in mismatches)
 
 
 def _artifact_row(
@@ -291,7 +450,11 @@ def _artifact_row(
     dictionary_id: str,
     language_code: str,
 ):
-    entry = parse_dictionary_file(artifact.path)
+    # The manifest loader already checksummed and decoded these bytes.
+    entry = parse_dictionary_content(
+        [artifact.load_payload()],
+        Path(artifact.artifact_path),
+    )
     if entry.source_entry_key != artifact.source_entry_key:
         raise ValueError(
             f"{artifact.artifact_path} parsed source identity mismatch"
@@ -307,15 +470,186 @@ def _artifact_row(
         "is_nt2_2000": entry.is_nt2_2000,
         "vandale_id": entry.vandale_id,
         "raw": entry.raw,
+        "raw_fingerprint": artifact.stored_raw_fingerprint,
         "normalized_pos_status": (
             entry.normalized_pos_status or "unresolved"
         ),
     }
 
 
-def _bulk_update_entries(cursor, rows) -> None:
+_ENTRY_COLUMNS = (
+    "id",
+    "dictionary_id",
+    "language_code",
+    "headword",
+    "meaning_id",
+    "part_of_speech",
+    "gender",
+    "is_nt2_2000",
+    "vandale_id",
+    "raw",
+    "raw_fingerprint",
+    "normalized_pos_status",
+)
+# Columns the parser derives from ``raw``. Delta writes compare them as well
+# as the raw fingerprint, so a parser change still rewrites the rows.
+_DERIVED_COLUMNS = (
+    "headword",
+    "meaning_id",
+    "part_of_speech",
+    "gender",
+    "is_nt2_2000",
+    "vandale_id",
+    "normalized_pos_status",
+)
+_ENTRY_STAGING_COLUMNS = """
+    id uuid,
+    dictionary_id uuid,
+    language_code text,
+    headword text,
+    meaning_id integer,
+    part_of_speech text,
+    gender text,
+    is_nt2_2000 boolean,
+    vandale_id integer,
+    raw jsonb,
+    raw_fingerprint text,
+    normalized_pos_status text
+"""
+_BINDING_STAGING_COLUMNS = """
+    dictionary_id uuid,
+    identity_scheme_version text,
+    source_entry_key text,
+    source_group_key text,
+    sense_ordinal integer,
+    word_entry_id uuid,
+    binding_state text,
+    first_seen_run_id uuid,
+    last_seen_run_id uuid,
+    manifest_checksum text,
+    content_fingerprint_version text,
+    content_fingerprint text,
+    identity_evidence jsonb,
+    reconciliation_decision jsonb
+"""
+_BINDING_INSERT = """
+    insert into private.source_entry_bindings (
+        dictionary_id,
+        identity_scheme_version,
+        source_entry_key,
+        source_group_key,
+        sense_ordinal,
+        word_entry_id,
+        binding_state,
+        first_seen_run_id,
+        last_seen_run_id,
+        manifest_checksum,
+        content_fingerprint_version,
+        content_fingerprint,
+        identity_evidence,
+        reconciliation_decision
+    )
+"""
+_BINDING_CONFLICT = """
+    on conflict (
+        dictionary_id,
+        identity_scheme_version,
+        source_entry_key
+    )
+    do update set
+        source_group_key = excluded.source_group_key,
+        sense_ordinal = excluded.sense_ordinal,
+        word_entry_id = excluded.word_entry_id,
+        binding_state = 'active',
+        last_seen_run_id = excluded.last_seen_run_id,
+        manifest_checksum = excluded.manifest_checksum,
+        content_fingerprint_version =
+            excluded.content_fingerprint_version,
+        content_fingerprint = excluded.content_fingerprint,
+        identity_evidence = excluded.identity_evidence,
+        reconciliation_decision =
+            excluded.reconciliation_decision,
+        updated_at = now()
+"""
+_COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def _binding_identity_evidence(artifact: SourceArtifact) -> dict[str, Any]:
+    source = artifact.load_payload()["_source"]
+    return source.get("identity_evidence", {}) | {
+        "source_index": artifact.source_index,
+        "pos_evidence": source.get("pos_evidence", {}),
+    }
+
+
+def _copy_text(value: Any) -> str:
+    """Render one field for COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = canonical_json(value).decode("utf-8")
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _copy_into_staging(cursor, table: str, columns: str, rows) -> None:
+    """Create ``table`` as a transaction-scoped temp table and COPY rows in."""
+    cursor.execute(
+        f"create temporary table {table} ({columns}) on commit drop"
+    )
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_text(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    cursor.copy_expert(f"copy {table} from stdin", buffer)
+
+
+def _entry_values(row) -> tuple:
+    return tuple(row[column] for column in _ENTRY_COLUMNS)
+
+
+def _adapt_json(values: tuple) -> tuple:
+    return tuple(
+        psycopg2.extras.Json(value) if isinstance(value, dict) else value
+        for value in values
+    )
+
+
+def _bulk_update_entries(cursor, rows, bulk_load: str = "values") -> None:
     if not rows:
         return
+    if bulk_load == "copy":
+        _copy_into_staging(
+            cursor,
+            "source_entry_updates",
+            _ENTRY_STAGING_COLUMNS,
+            (_entry_values(row) for row in rows),
+        )
+        cursor.execute(
+            """
+            update public.word_entries as target
+            set dictionary_id = source.dictionary_id,
+                language_code = source.language_code,
+                headword = source.headword,
+                meaning_id = source.meaning_id,
+                part_of_speech = source.part_of_speech,
+                gender = source.gender,
+                is_nt2_2000 = source.is_nt2_2000,
+                vandale_id = source.vandale_id,
+                raw = source.raw,
+                raw_fingerprint = source.raw_fingerprint,
+                management_kind = 'source',
+                source_lifecycle = 'active',
+                normalized_pos_status = source.normalized_pos_status
+            from source_entry_updates as source
+            where target.id = source.id
+            """
+        )
+        return
     psycopg2.extras.execute_values(
         cursor,
         """
@@ -329,71 +663,261 @@ def _bulk_update_entries(cursor, rows) -> None:
             is_nt2_2000 = source.is_nt2_2000,
             vandale_id = source.vandale_id::integer,
             raw = source.raw::jsonb,
+            raw_fingerprint = source.raw_fingerprint,
             management_kind = 'source',
             source_lifecycle = 'active',
             normalized_pos_status = source.normalized_pos_status
         from (values %s) as source (
             id, dictionary_id, language_code, headword, meaning_id,
             part_of_speech, gender, is_nt2_2000, vandale_id, raw,
-            normalized_pos_status
+            raw_fingerprint, normalized_pos_status
         )
         where target.id = source.id::uuid
         """,
-        [
-            (
-                row["id"],
-                row["dictionary_id"],
-                row["language_code"],
-                row["headword"],
-                row["meaning_id"],
-                row["part_of_speech"],
-                row["gender"],
-                row["is_nt2_2000"],
-                row["vandale_id"],
-                psycopg2.extras.Json(row["raw"]),
-                row["normalized_pos_status"],
-            )
-            for row in rows
-        ],
+        [_adapt_json(_entry_values(row)) for row in rows],
         page_size=500,
     )
 
 
-def _bulk_insert_entries(cursor, rows) -> None:
+def _bulk_insert_entries(cursor, rows, bulk_load: str = "values") -> None:
     if not rows:
         return
+    if bulk_load == "copy":
+        _copy_into_staging(
+            cursor,
+            "source_entry_inserts",
+            _ENTRY_STAGING_COLUMNS,
+            (_entry_values(row) for row in rows),
+        )
+        cursor.execute(
+            """
+            insert into public.word_entries (
+                id, dictionary_id, language_code, headword, meaning_id,
+                part_of_speech, gender, is_nt2_2000, vandale_id, raw,
+                raw_fingerprint, management_kind, source_lifecycle,
+                normalized_pos_status
+            )
+            select
+                id, dictionary_id, language_code, headword, meaning_id,
+                part_of_speech, gender, is_nt2_2000, vandale_id, raw,
+                raw_fingerprint, 'source', 'active', normalized_pos_status
+            from source_entry_inserts
+            """
+        )
+        return
     psycopg2.extras.execute_values(
         cursor,
         """
         insert into public.word_entries (
             id, dictionary_id, language_code, headword, meaning_id,
             part_of_speech, gender, is_nt2_2000, vandale_id, raw,
-            management_kind, source_lifecycle, normalized_pos_status
+            raw_fingerprint, management_kind, source_lifecycle,
+            normalized_pos_status
         )
         values %s
         """,
         [
-            (
-                row["id"],
-                row["dictionary_id"],
-                row["language_code"],
-                row["headword"],
-                row["meaning_id"],
-                row["part_of_speech"],
-                row["gender"],
-                row["is_nt2_2000"],
-                row["vandale_id"],
-                psycopg2.extras.Json(row["raw"]),
-                "source",
-                "active",
-                row["normalized_pos_status"],
-            )
+            _adapt_json(_entry_values(row))[:-1]
+            + ("source", "active", row["normalized_pos_status"])
             for row in rows
         ],
         page_size=500,
     )
 
 
+def _upsert_bindings(cursor, rows, bulk_load: str = "values") -> None:
+    """Insert or refresh binding rows given in ``_BINDING_INSERT`` order."""
+    if not rows:
+        return
+    if bulk_load == "copy":
+        _copy_into_staging(
+            cursor,
+            "source_binding_rows",
+            _BINDING_STAGING_COLUMNS,
+            rows,
+        )
+        cursor.execute(
+            _BINDING_INSERT
+            + "select * from source_binding_rows"
+            + _BINDING_CONFLICT
+        )
+        return
+    psycopg2.extras.execute_values(
+        cursor,
+        _BINDING_INSERT + "values %s" + _BINDING_CONFLICT,
+        [_adapt_json(row) for row in rows],
+        page_size=500,
+    )
+
+
+def _source_batches(artifacts, batch_size: int):
+    """Split artifacts into resumable batches of whole source groups.
+
+    Groups keep their first-appearance order and a batch closes once it holds
+    at least ``batch_size`` artifacts, so the senses of a group commit
+    together and every attempt over one manifest sees the same batches.
+    """
+    groups = {}
+    for artifact in artifacts:
+        groups.setdefault(artifact.source_group_key, []).append(artifact)
+    batches = []
+    batch = []
+    for group in groups.values():
+        batch.extend(group)
+        if len(batch) >= batch_size:
+            batches.append(batch)
+            batch = []
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _lock_dictionary_imports(cursor, dictionary_id: str) -> None:
+    # Batches commit one by one, so a second writer would interleave with
+    # this one; the session lock spans them all.
+    cursor.execute(
+        "select pg_try_advisory_lock(hashtextextended(%s, 0))",
+        (f"source-import:{dictionary_id}",),
+    )
+    if not cursor.fetchone()[0]:
+        raise RuntimeError(
+            "Another resumable import is writing this dictionary"
+        )
+
+
+def _claim_unfinished_run(
+    cursor,
+    *,
+    dictionary_id: str,
+    manifest,
+    resumable: bool,
+):
+    """Return the unfinished resumable run this import must continue.
+
+    Resumable imports take the dictionary lock first. Any unfinished run
+    blocks imports that cannot resume it.
+    """
+    if resumable:
+        _lock_dictionary_imports(cursor, dictionary_id)
+    unfinished = _load_unfinished_run(cursor, dictionary_id)
+    if unfinished is None:
+        return None
+    if not resumable or unfinished[1:3] != (
+        manifest.identity_scheme_version,
+        manifest.manifest_sha256,
+    ):
+        raise RuntimeError(
+            f"Resumable import run {unfinished[0]} is unfinished; "
+            "resume it with the same manifest or mark it failed"
+        )
+    return unfinished
+
+
+def _load_unfinished_run(cursor, dictionary_id: str):
+    cursor.execute(
+        """
+        select id::text, identity_scheme_version, manifest_checksum, counts
+        from private.dictionary_import_runs
+        where dictionary_id = %s
+          and status = 'running'
+          and counts ? 'checkpoint'
+        order by started_at desc
+        limit 1
+        """,
+        (dictionary_id,),
+    )
+    return cursor.fetchone()
+
+
+def _insert_import_run(cursor, *, dictionary_id: str, manifest, actor, reason):
+    cursor.execute(
+        """
+        insert into private.dictionary_import_runs (
+            dictionary_id,
+            identity_scheme_version,
+            artifact_format_version,
+            manifest_checksum,
+            input_checksum,
+            source_record_count,
+            artifact_count,
+            status,
+            actor,
+            reason
+        )
+        values (%s,%s,%s,%s,%s,%s,%s,'running',%s,%s)
+        returning id::text
+        """,
+        (
+            dictionary_id,
+            manifest.identity_scheme_version,
+            manifest.artifact_format_version,
+            manifest.manifest_sha256,
+            manifest.input_sha256,
+            manifest.source_record_count,
+            len(manifest.artifacts),
+            actor,
+            reason,
+        ),
+    )
+    return cursor.fetchone()[0]
+
+
+def _run_counts(stats: SourceImportStats) -> dict[str, Any]:
+    return {
+        "matched": stats.matched,
+        "new": stats.inserted,
+        "changed": stats.changed,
+        "untouched": stats.untouched,
+        "retired": stats.retired,
+        "ambiguous": stats.ambiguous,
+        "rejected": stats.rejected,
+    }
+
+
+def _record_checkpoint(cursor, run_id: str, stats, checkpoint) -> None:
+    cursor.execute(
+        """
+        update private.dictionary_import_runs
+        set counts = %s
+        where id = %s
+        """,
+        (
+            psycopg2.extras.Json(
+                _run_counts(stats) | {"checkpoint": checkpoint}
+            ),
+            run_id,
+        ),
+    )
+
+
+def _committed_nt2_rows(cursor, list_id, dictionary_id, scheme, artifacts):
+    """Return NT2 list rows for artifacts an earlier attempt committed."""
+    source_indexes = {
+        artifact.source_entry_key: artifact.source_index
+        for artifact in artifacts
+    }
+    if not source_indexes:
+        return []
+    cursor.execute(
+        """
+        select binding.source_entry_key, entry.id::text
+        from private.source_entry_bindings as binding
+        join public.word_entries as entry
+          on entry.id = binding.word_entry_id
+        where binding.dictionary_id = %s
+          and binding.identity_scheme_version = %s
+          and binding.binding_state = 'active'
+          and binding.source_entry_key = any(%s::text[])
+          and entry.is_nt2_2000
+        """,
+        (dictionary_id, scheme, list(source_indexes)),
+    )
+    return [
+        (list_id, word_entry_id, source_indexes[source_entry_key])
+        for source_entry_key, word_entry_id in cursor.fetchall()
+    ]
+
+
 def import_source_manifest(
     *,
     data_dir: Path | str,
@@ -412,13 +936,38 @@ def import_source_manifest(
     actor: str = "vandale-source-importer",
     reason: str = "Approved versioned source manifest import",
     refresh_search_documents: bool = False,
+    manifest_workers: int = 1,
+    manifest_cache_dir: Path | str | None = None,
+    verify_manifest: bool = False,
+    bulk_load: str = "values",
+    delta_writes: bool = False,
+    resumable: bool = False,
+    batch_size: int = 1000,
 ) -> SourceImportStats:
-    manifest = load_source_manifest(data_dir)
+    if bulk_load not in BULK_LOAD_MODES:
+        raise ValueError(
+            f"Unknown bulk load mode {bulk_load!r}; "
+            f"expected one of {', '.join(BULK_LOAD_MODES)}"
+        )
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    timer = PhaseTimer()
+    timer.start("manifest_load")
+    manifest = load_source_manifest(
+        data_dir,
+        workers=manifest_workers,
+        cache_dir=manifest_cache_dir,
+        verify=verify_manifest,
+    )
+    timer.record(rows=len(manifest.artifacts))
     stats = SourceImportStats(total_files=len(manifest.artifacts))
+    timer.start("connect")
     connection = psycopg2.connect(database_url)
 
-    with connection as conn:
-        with conn.cursor() as cursor:
+    with closing(connection), connection as conn:
+        with conn.cursor(cursor_factory=CountingCursor) as cursor:
+            cursor.timer = timer
+            timer.start("schema_check")
             _verify_source_schema(cursor)
             cursor.execute(
                 """
@@ -430,16 +979,34 @@ def import_source_manifest(
                 (language_code, dictionary_slug),
             )
             existing_dictionary = cursor.fetchone()
-            if existing_dictionary is not None and _completed_manifest_is_noop(
-                cursor,
-                dictionary_id=existing_dictionary[0],
-                manifest=manifest,
+            timer.start("noop_check")
+            # An unfinished resumable run outranks the no-op check: its
+            # batches may already have made a completed manifest match again.
+            resume = None
+            if existing_dictionary is not None:
+                resume = _claim_unfinished_run(
+                    cursor,
+                    dictionary_id=existing_dictionary[0],
+                    manifest=manifest,
+                    resumable=resumable,
+                )
+            if (
+                resume is None
+                and existing_dictionary is not None
+                and _completed_manifest_is_noop(
+                    cursor,
+                    dictionary_id=existing_dictionary[0],
+                    manifest=manifest,
+                )
             ):
+                timer.stop()
                 stats.matched = len(manifest.artifacts)
                 stats.processed = len(manifest.artifacts)
                 stats.no_op = True
+                stats.phases = timer.as_dict()
                 return stats
 
+            timer.start("binding_load")
             ensure_language(cursor, language_code, language_name)
             dictionary_id = ensure_dictionary(
                 cursor,
@@ -459,19 +1026,118 @@ def import_source_manifest(
                 True,
             )
 
+            if resumable and existing_dictionary is None:
+                _lock_dictionary_imports(cursor, dictionary_id)
+
             active_bindings = _load_active_bindings(
                 cursor,
                 dictionary_id,
                 manifest.identity_scheme_version,
             )
-            source_rows = _load_source_rows(cursor, dictionary_id)
+            source_fingerprints = _load_source_fingerprints(
+                cursor,
+                dictionary_id,
+            )
+            derived_columns = {}
+            active_nodes = {}
+            if delta_writes and active_bindings:
+                derived_columns = _load_derived_columns(cursor, dictionary_id)
+                active_nodes = _load_active_content_nodes(
+                    cursor,
+                    list(source_fingerprints),
+                )
             artifacts_by_key = {
                 artifact.source_entry_key: artifact
                 for artifact in manifest.artifacts
             }
 
+            timer.start("plan_validation")
             plan = None
-            if not active_bindings and source_rows:
+            current_fingerprints = {}
+            mode = "empty"
+            if resume is not None:
+                # The first attempt validated this manifest; committed
+                # batches now fail those checks, so only the remaining
+                # artifacts are rechecked.
+                run_id, _, _, run_counts = resume
+                checkpoint = run_counts["checkpoint"]
+                mode = checkpoint["mode"]
+                batches = _source_batches(
+                    manifest.artifacts,
+                    checkpoint["batch_size"],
+                )
+                committed = checkpoint["batches"]
+                cursor.execute(
+                    """
+                    select count(*)
+                    from private.source_entry_bindings
+                    where dictionary_id = %s
+                      and last_seen_run_id = %s
+                    """,
+                    (dictionary_id, run_id),
+                )
+                if cursor.fetchone()[0] != sum(
+                    len(batch) for batch in batches[:committed]
+                ):
+                    raise RuntimeError(
+                        f"Import run {run_id} checkpoint does not match its "
+                        "committed bindings"
+                    )
+                remaining = [
+                    artifact
+                    for batch in batches[committed:]
+                    for artifact in batch
+                ]
+                expected_fingerprints = {}
+                if mode == "plan":
+                    if reconciliation_plan is None:
+                        raise RuntimeError(
+                            "Resuming a first-binding import requires its "
+                            "reconciliation plan"
+                        )
+                    plan = load_reconciliation_plan(
+                        reconciliation_plan,
+                        manifest_sha256=manifest.manifest_sha256,
+                        identity_scheme_version=(
+                            manifest.identity_scheme_version
+                        ),
+                        dictionary_slug=dictionary_slug,
+                        source_entry_keys=set(artifacts_by_key),
+                    )
+                    for artifact in remaining:
+                        decision = plan.decisions[artifact.source_entry_key]
+                        if decision.action == "bind-existing":
+                            expected_fingerprints[decision.word_entry_id] = (
+                                decision.expected_raw_fingerprint
+                            )
+                elif mode == "active":
+                    expected_fingerprints = {
+                        active_bindings[artifact.source_entry_key][
+                            "word_entry_id"
+                        ]: artifact.stored_raw_fingerprint
+                        for artifact in remaining
+                    }
+                current_fingerprints, _ = _resolve_raw_fingerprints(
+                    cursor,
+                    source_fingerprints,
+                    expected_fingerprints,
+                )
+                if mode == "plan":
+                    for word_entry_id, fingerprint in (
+                        expected_fingerprints.items()
+                    ):
+                        if current_fingerprints[word_entry_id] != fingerprint:
+                            raise RuntimeError(
+                                f"Stored entry changed after reconciliation: "
+                                f"{word_entry_id}"
+                            )
+                stats.matched = run_counts["matched"]
+                stats.inserted = run_counts["new"]
+                stats.changed = run_counts["changed"]
+                stats.untouched = run_counts["untouched"]
+                stats.resumed_batches = committed
+            elif not active_bindings and source_fingerprints:
+                mode = "plan"
                 if reconciliation_plan is None:
                     raise RuntimeError(
                         "Existing source rows require an approved "
@@ -485,7 +1151,7 @@ def import_source_manifest(
                     source_entry_keys=set(artifacts_by_key),
                 )
                 if plan.existing_uuid_set_sha256 != _uuid_set_checksum(
-                    set(source_rows)
+                    set(source_fingerprints)
                 ):
                     raise RuntimeError(
                         "Existing UUID set changed after reconciliation"
@@ -495,17 +1161,27 @@ def import_source_manifest(
                     for decision in plan.decisions.values()
                     if decision.action == "bind-existing"
                 }
-                if planned_existing_ids != set(source_rows):
+                if planned_existing_ids != set(source_fingerprints):
                     raise RuntimeError(
                         "Reconciliation plan does not account for every "
                         "existing source UUID"
                     )
+                current_fingerprints, _ = _resolve_raw_fingerprints(
+                    cursor,
+                    source_fingerprints,
+                    {
+                        decision.word_entry_id: (
+                            decision.expected_raw_fingerprint
+                        )
+                        for decision in plan.decisions.values()
+                        if decision.action == "bind-existing"
+                    },
+                )
                 for decision in plan.decisions.values():
                     if decision.action != "bind-existing":
                         continue
-                    current_raw = source_rows[decision.word_entry_id]
                     if (
-                        stored_raw_fingerprint(current_raw)
+                        current_fingerprints[decision.word_entry_id]
                         != decision.expected_raw_fingerprint
                     ):
                         raise RuntimeError(
@@ -513,11 +1189,12 @@ def import_source_manifest(
                             f"{decision.word_entry_id}"
                         )
             elif active_bindings:
+                mode = "active"
                 bound_word_ids = {
                     binding["word_entry_id"]
                     for binding in active_bindings.values()
                 }
-                if set(source_rows) != bound_word_ids:
+                if set(source_fingerprints) != bound_word_ids:
                     raise RuntimeError(
                         "Active source rows and bindings do not have exact "
                         "coverage"
@@ -547,34 +1224,50 @@ def import_source_manifest(
                         != artifact.sense_ordinal
                     )
                 }
+                current_fingerprints, source_raws = _resolve_raw_fingerprints(
+                    cursor,
+                    source_fingerprints,
+                    {
+                        binding["word_entry_id"]: artifacts_by_key[
+                            source_entry_key
+                        ].stored_raw_fingerprint
+                        for source_entry_key, binding in active_bindings.items()
+                    },
+                )
+                # Only rows whose content changed need their stored raw
+                # re-fingerprinted; the rest match their artifact.
+                previous_fingerprints = {
+                    source_entry_key: (
+                        ordinal_independent_fingerprint(
+                            source_raws[binding["word_entry_id"]]
+                        )
+                        if binding["word_entry_id"] in source_raws
+                        else artifacts_by_key[
+                            source_entry_key
+                        ].ordinal_independent_fingerprint
+                    )
+                    for source_entry_key, binding in active_bindings.items()
+                }
                 previous_fingerprints_by_group = {}
                 for source_entry_key, binding in active_bindings.items():
                     previous_fingerprints_by_group.setdefault(
                         binding["source_group_key"],
                         {},
                     ).setdefault(
-                        _ordinal_independent_fingerprint(
-                            source_rows[binding["word_entry_id"]]
-                        ),
+                        previous_fingerprints[source_entry_key],
                         set(),
                     ).add(source_entry_key)
                 moved_fingerprint_groups = {
                     artifact.source_group_key
                     for artifact in manifest.artifacts
                     if (
-                        _ordinal_independent_fingerprint(artifact.payload)
-                        != _ordinal_independent_fingerprint(
-                            source_rows[
-                                active_bindings[
-                                    artifact.source_entry_key
-                                ]["word_entry_id"]
-                            ]
-                        )
+                        artifact.ordinal_independent_fingerprint
+                        != previous_fingerprints[artifact.source_entry_key]
                         and previous_fingerprints_by_group.get(
                             artifact.source_group_key,
                             {},
                         ).get(
-                            _ordinal_independent_fingerprint(artifact.payload),
+                            artifact.ordinal_independent_fingerprint,
                             set(),
                         )
                         - {artifact.source_entry_key}
@@ -598,210 +1291,232 @@ def import_source_manifest(
                     "Reconciliation plan supplied for an empty dictionary"
                 )
 
-            cursor.execute(
-                """
-                insert into private.dictionary_import_runs (
-                    dictionary_id,
-                    identity_scheme_version,
-                    artifact_format_version,
-                    manifest_checksum,
-                    input_checksum,
-                    source_record_count,
-                    artifact_count,
-                    status,
-                    actor,
-                    reason
+            if resume is None:
+                run_id = _insert_import_run(
+                    cursor,
+                    dictionary_id=dictionary_id,
+                    manifest=manifest,
+                    actor=actor,
+                    reason=reason,
                 )
-                values (%s,%s,%s,%s,%s,%s,%s,'running',%s,%s)
-                returning id::text
-                """,
-                (
-                    dictionary_id,
-                    manifest.identity_scheme_version,
-                    manifest.artifact_format_version,
-                    manifest.manifest_sha256,
-                    manifest.input_sha256,
-                    manifest.source_record_count,
-                    len(manifest.artifacts),
-                    actor,
-                    reason,
-                ),
-            )
-            run_id = cursor.fetchone()[0]
+                committed = 0
+                if resumable:
+                    batches = _source_batches(manifest.artifacts, batch_size)
+                    checkpoint = {
+                        "mode": mode,
+                        "batch_size": batch_size,
+                        "batches": 0,
+                    }
+                    timer.start("checkpoint")
+                    _record_checkpoint(cursor, run_id, stats, checkpoint)
+                    conn.commit()
+                else:
+                    batches = [manifest.artifacts]
             stats.run_id = run_id
 
-            updates = []
-            inserts = []
             resolved = []
-            for artifact in manifest.artifacts:
-                if plan is not None:
-                    decision = plan.decisions[artifact.source_entry_key]
-                    if decision.action == "bind-existing":
-                        word_entry_id = decision.word_entry_id
+            for batch_number, batch in enumerate(
+                batches[committed:],
+                start=committed + 1,
+            ):
+                timer.start("entry_writes")
+                updates = []
+                inserts = []
+                written = []
+                untouched_keys = []
+                for artifact in batch:
+                    unchanged = False
+                    if mode == "plan":
+                        decision = plan.decisions[artifact.source_entry_key]
+                        if decision.action == "bind-existing":
+                            word_entry_id = decision.word_entry_id
+                            stats.matched += 1
+                            if (
+                                current_fingerprints[word_entry_id]
+                                != artifact.stored_raw_fingerprint
+                            ):
+                                stats.changed += 1
+                            target = updates
+                        else:
+                            word_entry_id = str(uuid4())
+                            stats.inserted += 1
+                            target = inserts
+                        decision_payload = {
+                            "action": decision.action,
+                            "method": decision.method,
+                            "reason": decision.reason,
+                        }
+                    elif mode == "active":
+                        binding = active_bindings[artifact.source_entry_key]
+                        word_entry_id = binding["word_entry_id"]
                         stats.matched += 1
                         if (
-                            stored_raw_fingerprint(
-                                source_rows[word_entry_id]
-                            )
-                            != stored_raw_fingerprint(artifact.payload)
+                            current_fingerprints[word_entry_id]
+                            != artifact.stored_raw_fingerprint
                         ):
                             stats.changed += 1
+                        elif delta_writes:
+                            # A row refetched above has a stale raw_fingerprint
+                            # and is rewritten to refresh it.
+                            unchanged = (
+                                source_fingerprints[word_entry_id]
+                                == artifact.stored_raw_fingerprint
+                                and binding["content_fingerprint_version"]
+                                == artifact.fingerprint_version
+                                and binding["content_fingerprint"]
+                                == artifact.content_fingerprint
+                                and binding["identity_evidence"]
+                                == _binding_identity_evidence(artifact)
+                                and _content_nodes_match(
+                                    active_nodes.get(word_entry_id, []),
+                                    artifact.content_node_columns
+                                    .report_atoms(),
+                                )
+                            )
                         target = updates
+                        decision_payload = {
+                            "action": "bind-existing",
+                            "method": "existing-source-binding",
+                            "reason": (
+                                "Resolved through active versioned binding."
+                            ),
+                        }
                     else:
                         word_entry_id = str(uuid4())
                         stats.inserted += 1
                         target = inserts
-                    decision_payload = {
-                        "action": decision.action,
-                        "method": decision.method,
-                        "reason": decision.reason,
-                    }
-                elif active_bindings:
-                    binding = active_bindings[artifact.source_entry_key]
-                    word_entry_id = binding["word_entry_id"]
-                    stats.matched += 1
-                    if (
-                        stored_raw_fingerprint(source_rows[word_entry_id])
-                        != stored_raw_fingerprint(artifact.payload)
-                    ):
-                        stats.changed += 1
-                    target = updates
-                    decision_payload = {
-                        "action": "bind-existing",
-                        "method": "existing-source-binding",
-                        "reason": "Resolved through active versioned binding.",
-                    }
-                else:
-                    word_entry_id = str(uuid4())
-                    stats.inserted += 1
-                    target = inserts
-                    decision_payload = {
-                        "action": "insert-new",
-                        "method": "empty-dictionary-initial-import",
-                        "reason": "Target dictionary contained no source rows.",
-                    }
-
-                row = _artifact_row(
-                    artifact,
-                    word_entry_id=word_entry_id,
-                    dictionary_id=dictionary_id,
-                    language_code=language_code,
-                )
-                target.append(row)
-                resolved.append(
-                    (artifact, row, decision_payload)
-                )
+                        decision_payload = {
+                            "action": "insert-new",
+                            "method": "empty-dictionary-initial-import",
+                            "reason": (
+                                "Target dictionary contained no source rows."
+                            ),
+                        }
 
-            _bulk_update_entries(cursor, updates)
-            _bulk_insert_entries(cursor, inserts)
+                    row = _artifact_row(
+                        artifact,
+                        word_entry_id=word_entry_id,
+                        dictionary_id=dictionary_id,
+                        language_code=language_code,
+                    )
+                    resolved.append(
+                        (artifact, row, decision_payload)
+                    )
+                    if unchanged and derived_columns[word_entry_id] == tuple(
+                        row[column] for column in _DERIVED_COLUMNS
+                    ):
+                        untouched_keys.append(artifact.source_entry_key)
+                        continue
+                    target.append(row)
+                    written.append(
+                        (artifact, row, decision_payload)
+                    )
 
-            psycopg2.extras.execute_values(
-                cursor,
-                """
-                insert into private.source_entry_bindings (
-                    dictionary_id,
-                    identity_scheme_version,
-                    source_entry_key,
-                    source_group_key,
-                    sense_ordinal,
-                    word_entry_id,
-                    binding_state,
-                    first_seen_run_id,
-                    last_seen_run_id,
-                    manifest_checksum,
-                    content_fingerprint_version,
-                    content_fingerprint,
-                    identity_evidence,
-                    reconciliation_decision
-                )
-                values %s
-                on conflict (
-                    dictionary_id,
-                    identity_scheme_version,
-                    source_entry_key
+                _bulk_update_entries(cursor, updates, bulk_load)
+                _bulk_insert_entries(cursor, inserts, bulk_load)
+                _upsert_bindings(
+                    cursor,
+                    [
+                        (
+                            dictionary_id,
+                            artifact.identity_scheme_version,
+                            artifact.source_entry_key,
+                            artifact.source_group_key,
+                            artifact.sense_ordinal,
+                            row["id"],
+                            "active",
+                            run_id,
+                            run_id,
+                            manifest.manifest_sha256,
+                            artifact.fingerprint_version,
+                            artifact.content_fingerprint,
+                            _binding_identity_evidence(artifact),
+                            decision_payload,
+                        )
+                        for artifact, row, decision_payload in written
+                    ],
+                    bulk_load,
                 )
-                do update set
-                    source_group_key = excluded.source_group_key,
-                    sense_ordinal = excluded.sense_ordinal,
-                    word_entry_id = excluded.word_entry_id,
-                    binding_state = 'active',
-                    last_seen_run_id = excluded.last_seen_run_id,
-                    manifest_checksum = excluded.manifest_checksum,
-                    content_fingerprint_version =
-                        excluded.content_fingerprint_version,
-                    content_fingerprint = excluded.content_fingerprint,
-                    identity_evidence = excluded.identity_evidence,
-                    reconciliation_decision =
-                        excluded.reconciliation_decision,
-                    updated_at = now()
-                """,
-                [
-                    (
-                        dictionary_id,
-                        artifact.identity_scheme_version,
-                        artifact.source_entry_key,
-                        artifact.source_group_key,
-                        artifact.sense_ordinal,
-                        row["id"],
-                        "active",
-                        run_id,
-                        run_id,
-                        manifest.manifest_sha256,
-                        artifact.fingerprint_version,
-                        artifact.content_fingerprint,
-                        psycopg2.extras.Json(
-                            artifact.payload["_source"].get(
-                                "identity_evidence",
-                                {},
-                            )
-                            | {
-                                "source_index": artifact.source_index,
-                                "pos_evidence": artifact.payload[
-                                    "_source"
-                                ].get("pos_evidence", {}),
-                            }
+                if untouched_keys:
+                    cursor.execute(
+                        """
+                        update private.source_entry_bindings
+                        set last_seen_run_id = %s,
+                            manifest_checksum = %s,
+                            updated_at = now()
+                        where dictionary_id = %s
+                          and identity_scheme_version = %s
+                          and source_entry_key = any(%s::text[])
+                        """,
+                        (
+                            run_id,
+                            manifest.manifest_sha256,
+                            dictionary_id,
+                            manifest.identity_scheme_version,
+                            untouched_keys,
                         ),
-                        psycopg2.extras.Json(decision_payload),
                     )
-                    for artifact, row, decision_payload in resolved
-                ],
-                page_size=500,
-            )
+                stats.untouched += len(untouched_keys)
 
-            psycopg2.extras.execute_values(
-                cursor,
-                """
-                select private.reconcile_platform_v2_content_nodes(
-                    source.entry_id::uuid,
-                    source.source_revision,
-                    source.nodes::jsonb
-                )
-                from (values %s) as source (
-                    entry_id,
-                    source_revision,
-                    nodes
+                timer.start("content_nodes")
+                psycopg2.extras.execute_values(
+                    cursor,
+                    """
+                    select private.reconcile_platform_v2_content_nodes(
+                        source.entry_id::uuid,
+                        source.source_revision,
+                        source.nodes::jsonb
+                    )
+                    from (values %s) as source (
+                        entry_id,
+                        source_revision,
+                        nodes
+                    )
+                    """,
+                    [
+                        (
+                            row["id"],
+                            manifest.manifest_sha256,
+                            psycopg2.extras.Json(
+                                artifact.content_node_columns.rows()
+                            ),
+                        )
+                        for artifact, row, _ in written
+                    ],
+                    page_size=500,
                 )
-                """,
-                [
-                    (
-                        row["id"],
-                        manifest.manifest_sha256,
-                        psycopg2.extras.Json(
-                            platform_v2_content_node_inputs(
-                                artifact.payload
-                            )
-                        ),
+
+                if refresh_search_documents:
+                    timer.start("search_refresh")
+                    refresh_dictionary_search_documents(
+                        cursor,
+                        [row["id"] for _, row, _ in written],
                     )
-                    for artifact, row, _ in resolved
-                ],
-                page_size=500,
-            )
 
+                if resumable:
+                    timer.start("checkpoint")
+                    checkpoint["batches"] = batch_number
+                    _record_checkpoint(cursor, run_id, stats, checkpoint)
+                    conn.commit()
+                    stats.batches += 1
+
+            timer.start("nt2_sync")
             nt2_rows = [
                 (list_id, row["id"], artifact.source_index)
                 for artifact, row, _ in resolved
                 if row["is_nt2_2000"]
             ]
+            nt2_rows += _committed_nt2_rows(
+                cursor,
+                list_id,
+                dictionary_id,
+                manifest.identity_scheme_version,
+                [
+                    artifact
+                    for batch in batches[:committed]
+                    for artifact in batch
+                ],
+            )
             nt2_word_ids = [word_id for _, word_id, _ in nt2_rows]
             cursor.execute(
                 """
@@ -848,13 +1563,9 @@ def import_source_manifest(
                     page_size=500,
                 )
 
-            if refresh_search_documents:
-                refresh_dictionary_search_documents(
-                    cursor,
-                    [row["id"] for _, row, _ in resolved],
-                )
-
+            timer.stop()
             stats.processed = len(manifest.artifacts)
+            stats.phases = timer.as_dict()
             cursor.execute(
                 """
                 update private.dictionary_import_runs
@@ -865,14 +1576,7 @@ def import_source_manifest(
                 """,
                 (
                     psycopg2.extras.Json(
-                        {
-                            "matched": stats.matched,
-                            "new": stats.inserted,
-                            "changed": stats.changed,
-                            "retired": stats.retired,
-                            "ambiguous": stats.ambiguous,
-                            "rejected": stats.rejected,
-                        }
+                        _run_counts(stats) | {"phases": stats.phases}
                     ),
                     run_id,
                 ),
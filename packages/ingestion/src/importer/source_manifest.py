@@ -1,17 +1,29 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 import hashlib
 import json
+import mmap
+import os
 from pathlib import Path
+import threading
 from typing import Any
 import unicodedata
 
 from jsonschema import Draft202012Validator
 
+from importer.canonical_json import canonical_json
+from importer.compiled_schema import Check, UnsupportedSchemaError, compile_schema
+from importer.hashing import file_sha256
+
 
 ARTIFACT_FINGERPRINT_VERSION = "vandale-semantic-v1"
+DEFAULT_PAYLOAD_CACHE_SIZE = 256
+MANIFEST_CACHE_VERSION = "source-manifest-cache-v1"
+MANIFEST_CACHE_DIR_ENV = "INGESTION_MANIFEST_CACHE_DIR"
 NL_SCHEMA_PATH = (
     Path(__file__).resolve().parents[4]
     / "packages"
@@ -22,18 +34,8 @@ NL_SCHEMA_PATH = (
 )
 
 
-def _canonical_json(value: Any) -> bytes:
-    return json.dumps(
-        value,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
-
-
-def semantic_content_fingerprint(payload: dict[str, Any]) -> str:
-    semantic = deepcopy(payload)
-    for field in (
+_SEMANTIC_EXCLUDED_KEYS = frozenset(
+    {
         "_raw_html",
         "_metadata",
         "_source",
@@ -41,22 +43,102 @@ def semantic_content_fingerprint(payload: dict[str, Any]) -> str:
         "part_of_speech_evidence",
         "audio_links",
         "images",
-    ):
-        semantic.pop(field, None)
-    return hashlib.sha256(_canonical_json(semantic)).hexdigest()
+    }
+)
+_ORDINAL_EXCLUDED_KEYS = _SEMANTIC_EXCLUDED_KEYS | {"meaning_id"}
+_STORED_RAW_EXCLUDED_KEYS = frozenset({"_raw_html"})
+
+
+def _fingerprint_without(
+    payload: dict[str, Any],
+    excluded: frozenset[str],
+) -> str:
+    # A shallow view is enough: nested values are encoded, never mutated.
+    kept = {key: value for key, value in payload.items() if key not in excluded}
+    return hashlib.sha256(canonical_json(kept)).hexdigest()
+
+
+def semantic_content_fingerprint(payload: dict[str, Any]) -> str:
+    return _fingerprint_without(payload, _SEMANTIC_EXCLUDED_KEYS)
+
+
+def ordinal_independent_fingerprint(payload: dict[str, Any]) -> str:
+    """Semantic fingerprint that ignores which sense ordinal the entry has."""
+    return _fingerprint_without(payload, _ORDINAL_EXCLUDED_KEYS)
 
 
 def stored_raw_fingerprint(payload: dict[str, Any]) -> str:
-    stored = deepcopy(payload)
-    stored.pop("_raw_html", None)
-    return hashlib.sha256(_canonical_json(stored)).hexdigest()
+    return _fingerprint_without(payload, _STORED_RAW_EXCLUDED_KEYS)
+
+
+@dataclass(frozen=True)
+class ContentNodeColumns:
+    """Content node inputs of one payload, one tuple per node field.
+
+    The compact form kept per artifact; ``rows()`` rebuilds the node objects
+    the reconcile function takes, and ``report_atoms()`` the comparison set
+    the no-op check uses.
+    """
+
+    input_keys: tuple[str, ...]
+    kinds: tuple[str, ...]
+    source_paths: tuple[str, ...]
+    source_text_fingerprints: tuple[str, ...]
+    source_texts: tuple[str, ...]
+    parent_input_keys: tuple[str | None, ...]
+
+    def __len__(self) -> int:
+        return len(self.input_keys)
+
+    def rows(self) -> list[dict[str, str]]:
+        rows = []
+        for input_key, kind, source_path, fingerprint, text, parent in zip(
+            self.input_keys,
+            self.kinds,
+            self.source_paths,
+            self.source_text_fingerprints,
+            self.source_texts,
+            self.parent_input_keys,
+        ):
+            node = {
+                "inputKey": input_key,
+                "kind": kind,
+                "sourcePath": source_path,
+                "sourceTextFingerprint": fingerprint,
+                "sourceText": text,
+            }
+            if parent is not None:
+                node["parentInputKey"] = parent
+            rows.append(node)
+        return rows
+
+    def report_atoms(self) -> list[tuple[str, str, str, int]]:
+        """Return (kind, fingerprint, text, source_order) per node, 1-based."""
+        return list(
+            zip(
+                self.kinds,
+                self.source_text_fingerprints,
+                self.source_texts,
+                range(1, len(self) + 1),
+            )
+        )
 
 
 def platform_v2_content_node_inputs(
     payload: dict[str, Any],
-) -> list[dict[str, str]]:
-    """Build semantic node evidence without treating array position as identity."""
-    nodes: list[dict[str, str]] = []
+    *,
+    columnar: bool = False,
+) -> list[dict[str, str]] | ContentNodeColumns:
+    """Build semantic node evidence without treating array position as identity.
+
+    ``columnar=True`` returns the same nodes as ``ContentNodeColumns``.
+    """
+    input_keys: list[str] = []
+    kinds: list[str] = []
+    source_paths: list[str] = []
+    fingerprints: list[str] = []
+    source_texts: list[str] = []
+    parent_input_keys: list[str | None] = []
 
     def append_node(
         *,
@@ -69,28 +151,20 @@ def platform_v2_content_node_inputs(
         if not isinstance(text, str) or not text.strip():
             return
         normalized_text = text.strip()
-        canonical_source_text = unicodedata.normalize("NFC", normalized_text)
-        node = {
-            "inputKey": input_key,
-            "kind": kind,
-            "sourcePath": source_path,
-            "sourceTextFingerprint": hashlib.sha256(
-                _canonical_json(
-                    {
-                        "kind": kind,
-                        "text": normalized_text,
-                    }
-                )
-            ).hexdigest(),
-            "sourceText": canonical_source_text,
-        }
-        if parent_input_key is not None:
-            node["parentInputKey"] = parent_input_key
-        nodes.append(node)
+        input_keys.append(input_key)
+        kinds.append(kind)
+        source_paths.append(source_path)
+        fingerprints.append(
+            hashlib.sha256(
+                canonical_json({"kind": kind, "text": normalized_text})
+            ).hexdigest()
+        )
+        source_texts.append(unicodedata.normalize("NFC", normalized_text))
+        parent_input_keys.append(parent_input_key)
 
     meanings = payload.get("meanings")
     if not isinstance(meanings, list):
-        return nodes
+        meanings = []
 
     for meaning_index, meaning in enumerate(meanings):
         if not isinstance(meaning, dict):
@@ -171,11 +245,57 @@ def platform_v2_content_node_inputs(
             text=meaning.get("note"),
         )
 
-    return nodes
+    columns = ContentNodeColumns(
+        input_keys=tuple(input_keys),
+        kinds=tuple(kinds),
+        source_paths=tuple(source_paths),
+        source_text_fingerprints=tuple(fingerprints),
+        source_texts=tuple(source_texts),
+        parent_input_keys=tuple(parent_input_keys),
+    )
+    return columns if columnar else columns.rows()
+
+
+class _PayloadCache:
+    """Decode artifact payloads on demand and keep the most recent ones.
+
+    Bytes are re-checked against the manifest checksum on every decode, so a
+    file edited after the manifest was loaded is refused rather than used.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._payloads: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, artifact: SourceArtifact) -> dict[str, Any]:
+        with self._lock:
+            payload = self._payloads.get(artifact.artifact_path)
+            if payload is not None:
+                self._payloads.move_to_end(artifact.artifact_path)
+                return payload
+
+        data = artifact.read_bytes()
+        if hashlib.sha256(data).hexdigest() != artifact.content_sha256:
+            raise ValueError(
+                f"artifact changed after manifest load: {artifact.artifact_path}"
+            )
+        payload = _load_payload(data, artifact.artifact_path)
+        if self.maxsize > 0:
+            with self._lock:
+                self._payloads[artifact.artifact_path] = payload
+                if len(self._payloads) > self.maxsize:
+                    self._payloads.popitem(last=False)
+        return payload
 
 
 @dataclass(frozen=True)
 class SourceArtifact:
+    # For packed manifests ``path`` is the pack and the artifact's bytes are
+    # the ``pack_length`` bytes starting at ``pack_offset``. ``payload`` is
+    # None for manifests loaded with lazy payloads; use ``load_payload()``
+    # where either mode is possible. ``file_stat`` is the size and mtime of
+    # an unpacked artifact's file as it was just before verification read it.
     path: Path
     artifact_path: str
     content_sha256: str
@@ -187,7 +307,46 @@ class SourceArtifact:
     normalized_pos_status: str
     content_fingerprint: str
     fingerprint_version: str
-    payload: dict[str, Any]
+    payload: dict[str, Any] | None
+    pack_offset: int | None = None
+    pack_length: int | None = None
+    payload_cache: _PayloadCache | None = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+    file_stat: list[int] | None = field(default=None, compare=False, repr=False)
+
+    @cached_property
+    def stored_raw_fingerprint(self) -> str:
+        return stored_raw_fingerprint(self.load_payload())
+
+    @cached_property
+    def ordinal_independent_fingerprint(self) -> str:
+        return ordinal_independent_fingerprint(self.load_payload())
+
+    @cached_property
+    def content_node_columns(self) -> ContentNodeColumns:
+        return platform_v2_content_node_inputs(
+            self.load_payload(),
+            columnar=True,
+        )
+
+    def load_payload(self) -> dict[str, Any]:
+        """Return the decoded payload, reading it now if it was not kept."""
+        if self.payload is not None:
+            return self.payload
+        if self.payload_cache is None:
+            raise ValueError(f"{self.artifact_path} has no payload source")
+        return self.payload_cache.load(self)
+
+    def read_bytes(self) -> bytes:
+        """Return the stored artifact bytes, from its own file or its pack span."""
+        if self.pack_offset is None:
+            return self.path.read_bytes()
+        with open(self.path, "rb") as pack:
+            pack.seek(self.pack_offset)
+            return pack.read(self.pack_length)
 
 
 @dataclass(frozen=True)
@@ -201,40 +360,128 @@ class SourceManifest:
     artifacts: tuple[SourceArtifact, ...]
 
 
-def _safe_artifact_path(root: Path, artifact_path: str) -> Path:
+def _safe_artifact_path(
+    root: Path,
+    artifact_path: str,
+    resolved_root: Path | None = None,
+) -> Path:
     relative = Path(artifact_path)
     if relative.is_absolute() or ".." in relative.parts:
         raise ValueError(f"unsafe artifact path: {artifact_path}")
-    resolved_root = root.resolve()
-    resolved = (root / relative).resolve()
+    if resolved_root is None:
+        resolved_root = root.resolve()
+    resolved = (resolved_root / relative).resolve()
     if resolved.parent != resolved_root:
         raise ValueError(f"unsafe artifact path: {artifact_path}")
     return resolved
 
 
-def _load_payload(path: Path) -> dict[str, Any]:
-    content = json.loads(path.read_text(encoding="utf-8"))
+class _ArtifactReader:
+    """Read artifact bytes from per-file layout or from a single pack file.
+
+    Safe to share between threads: the pack is mapped read-only and spans are
+    sliced out of the mapping, so there is no shared file position to guard
+    and the pack is never read into memory as a whole.
+    """
+
+    def __init__(self, root: Path, pack_name: str | None):
+        self.root = root
+        self.resolved_root = root.resolve()
+        self.pack_path = None
+        self.pack_stat = None
+        self._pack: mmap.mmap | None = None
+        if pack_name is not None:
+            self.pack_path = self.path_for(pack_name)
+            if not self.pack_path.is_file():
+                raise ValueError(f"missing artifact pack: {pack_name}")
+            with open(self.pack_path, "rb") as pack:
+                self.pack_stat = _stat_values(os.fstat(pack.fileno()))
+                # An empty file cannot be mapped; it holds no spans anyway.
+                if self.pack_stat[0]:
+                    self._pack = mmap.mmap(
+                        pack.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+
+    def path_for(self, artifact_path: str) -> Path:
+        return _safe_artifact_path(self.root, artifact_path, self.resolved_root)
+
+    def read(
+        self,
+        artifact_path: str,
+        record: dict[str, Any],
+    ) -> tuple[Path, int | None, int | None, bytes, list[int] | None]:
+        """Return the artifact's location, bytes and pre-read file stat.
+
+        The stat is taken before the bytes are read, so a rewrite racing the
+        read leaves a stale stat that later cache lookups reject. Packed
+        artifacts return None; the pack's stat is ``pack_stat``.
+        """
+        path = self.path_for(artifact_path)
+        if self.pack_path is None:
+            if not path.is_file():
+                raise ValueError(f"missing artifact: {artifact_path}")
+            stat = _stat_fingerprint(path)
+            return path, None, None, path.read_bytes(), stat
+
+        offset = record.get("pack_offset")
+        length = record.get("pack_length")
+        if (
+            not isinstance(offset, int)
+            or not isinstance(length, int)
+            or offset < 0
+            or length < 0
+        ):
+            raise ValueError(f"{artifact_path} has an invalid pack span")
+        data = (
+            self._pack[offset:offset + length] if self._pack is not None else b""
+        )
+        if len(data) != length:
+            raise ValueError(f"missing artifact: {artifact_path}")
+        return self.pack_path, offset, length, data, None
+
+    def close(self) -> None:
+        if self._pack is not None:
+            self._pack.close()
+
+
+def _load_payload(data: bytes, artifact_path: str) -> dict[str, Any]:
+    content = json.loads(data.decode("utf-8"))
     if not isinstance(content, list) or len(content) != 1:
-        raise ValueError(f"{path} must contain exactly one entry")
+        raise ValueError(f"{artifact_path} must contain exactly one entry")
     payload = content[0]
     if not isinstance(payload, dict):
-        raise ValueError(f"{path} entry must be an object")
+        raise ValueError(f"{artifact_path} entry must be an object")
     return payload
 
 
-def _load_schema_validator() -> Draft202012Validator:
+@dataclass(frozen=True)
+class _SchemaValidator:
+    # ``compiled`` is a fast pass/fail predicate built from the same schema;
+    # ``generic`` stays authoritative for failures and is the whole validator
+    # when the schema uses keywords the compiler does not translate.
+    generic: Draft202012Validator
+    compiled: Check | None
+
+
+def _load_schema_validator(compiled: bool = True) -> _SchemaValidator:
     schema = json.loads(NL_SCHEMA_PATH.read_text(encoding="utf-8"))
     Draft202012Validator.check_schema(schema)
-    return Draft202012Validator(schema)
+    try:
+        compiled_check = compile_schema(schema) if compiled else None
+    except UnsupportedSchemaError:
+        compiled_check = None
+    return _SchemaValidator(Draft202012Validator(schema), compiled_check)
 
 
 def _validate_payload(
-    validator: Draft202012Validator,
+    validator: _SchemaValidator,
     payload: dict[str, Any],
     artifact_path: str,
 ) -> None:
+    if validator.compiled is not None and validator.compiled(payload):
+        return
     errors = sorted(
-        validator.iter_errors(payload),
+        validator.generic.iter_errors(payload),
         key=lambda error: tuple(str(part) for part in error.absolute_path),
     )
     if not errors:
@@ -247,95 +494,353 @@ def _validate_payload(
     )
 
 
-def load_source_manifest(data_dir: Path | str) -> SourceManifest:
-    root = Path(data_dir)
-    manifest_path = root / "_manifest.jsonl"
-    summary_path = root / "_manifest.summary.json"
-    if not manifest_path.is_file() or not summary_path.is_file():
-        raise ValueError(f"{root} is missing the required source manifest")
+def _verify_artifact(
+    record: dict[str, Any],
+    artifact_path: str,
+    reader: _ArtifactReader,
+    schema_validator: _SchemaValidator,
+    expected_scheme: str | None,
+) -> SourceArtifact:
+    """Run the checks that need only this artifact's own record and bytes.
+
+    Source ordinals are copied through unchecked: ``_load_artifacts`` checks
+    them after the duplicate source entry key check, as a serial load did.
+    """
+    path, pack_offset, pack_length, data, file_stat = reader.read(
+        artifact_path, record
+    )
+    actual_checksum = hashlib.sha256(data).hexdigest()
+    if actual_checksum != record.get("content_sha256"):
+        raise ValueError(f"artifact checksum mismatch: {artifact_path}")
+
+    payload = _load_payload(data, artifact_path)
+    _validate_payload(schema_validator, payload, artifact_path)
+    source = payload.get("_source")
+    if not isinstance(source, dict):
+        raise ValueError(f"{artifact_path} is missing _source")
+    for field in (
+        "identity_scheme_version",
+        "source_entry_key",
+        "source_group_key",
+    ):
+        if source.get(field) != record.get(field):
+            raise ValueError(f"{artifact_path} {field} does not match manifest")
+    if source.get("identity_scheme_version") != expected_scheme:
+        raise ValueError(f"{artifact_path} identity scheme mismatch")
+
+    return SourceArtifact(
+        path=path,
+        artifact_path=artifact_path,
+        content_sha256=actual_checksum,
+        identity_scheme_version=source["identity_scheme_version"],
+        source_entry_key=source["source_entry_key"],
+        source_group_key=source["source_group_key"],
+        source_index=source.get("source_index"),
+        sense_ordinal=source.get("sense_ordinal"),
+        normalized_pos_status=source.get(
+            "normalized_pos_status",
+            "unresolved",
+        ),
+        content_fingerprint=semantic_content_fingerprint(payload),
+        fingerprint_version=ARTIFACT_FINGERPRINT_VERSION,
+        payload=payload,
+        pack_offset=pack_offset,
+        pack_length=pack_length,
+        file_stat=file_stat,
+    )
 
-    summary = json.loads(summary_path.read_text(encoding="utf-8"))
-    actual_manifest_sha256 = hashlib.sha256(manifest_path.read_bytes()).hexdigest()
-    if summary.get("manifest_sha256") != actual_manifest_sha256:
-        raise ValueError("manifest checksum mismatch")
 
-    records = [
-        json.loads(line)
-        for line in manifest_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
-    if summary.get("artifact_count") != len(records):
-        raise ValueError("manifest artifact count mismatch")
+def _load_artifacts(
+    records: list[dict[str, Any]],
+    reader: _ArtifactReader,
+    expected_scheme: str | None,
+    workers: int = 1,
+    payload_cache: _PayloadCache | None = None,
+) -> list[SourceArtifact]:
+    schema_validator = _load_schema_validator()
+
+    def verify(record: dict[str, Any]) -> SourceArtifact | BaseException | None:
+        artifact_path = record.get("artifact_path")
+        if not isinstance(artifact_path, str):
+            return None
+        try:
+            return _verify_artifact(
+                record,
+                artifact_path,
+                reader,
+                schema_validator,
+                expected_scheme,
+            )
+        except Exception as error:  # re-raised below, in manifest order
+            return error
+
+    executor = None
+    if workers > 1:
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="manifest-artifact",
+        )
+        results = executor.map(verify, records)
+    else:
+        results = map(verify, records)
 
     artifacts = []
-    schema_validator = _load_schema_validator()
     seen_paths = set()
     seen_source_keys = set()
-    expected_scheme = summary.get("identity_scheme_version")
-    for record in records:
-        artifact_path = record.get("artifact_path")
-        if not isinstance(artifact_path, str):
-            raise ValueError("manifest artifact path must be a string")
-        if artifact_path in seen_paths:
-            raise ValueError(f"duplicate artifact path: {artifact_path}")
-        seen_paths.add(artifact_path)
+    try:
+        # Results arrive in manifest order whichever worker produced them, so
+        # the first failing artifact is reported exactly as a serial load would.
+        for record, result in zip(records, results):
+            artifact_path = record.get("artifact_path")
+            if not isinstance(artifact_path, str):
+                raise ValueError("manifest artifact path must be a string")
+            if artifact_path in seen_paths:
+                raise ValueError(f"duplicate artifact path: {artifact_path}")
+            seen_paths.add(artifact_path)
+            if isinstance(result, BaseException):
+                raise result
+
+            source_entry_key = result.source_entry_key
+            if source_entry_key in seen_source_keys:
+                raise ValueError(f"duplicate source entry key: {source_entry_key}")
+            seen_source_keys.add(source_entry_key)
+            if not isinstance(result.source_index, int) or not isinstance(
+                result.sense_ordinal, int
+            ):
+                raise ValueError(f"{artifact_path} has invalid source ordinals")
+            if payload_cache is not None:
+                result = replace(result, payload=None, payload_cache=payload_cache)
+            artifacts.append(result)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    return artifacts
+
+
+def default_manifest_cache_dir() -> Path:
+    """Return where verified manifests are cached unless callers opt out."""
+    configured = os.environ.get(MANIFEST_CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "2000nl" / "source-manifests"
+
+
+def _manifest_cache_key() -> str:
+    # A schema or fingerprint change invalidates every earlier verdict.
+    return hashlib.sha256(
+        "\0".join(
+            (
+                MANIFEST_CACHE_VERSION,
+                ARTIFACT_FINGERPRINT_VERSION,
+                file_sha256(NL_SCHEMA_PATH),
+            )
+        ).encode("utf-8")
+    ).hexdigest()
 
-        path = _safe_artifact_path(root, artifact_path)
-        if not path.is_file():
-            raise ValueError(f"missing artifact: {artifact_path}")
-        actual_checksum = hashlib.sha256(path.read_bytes()).hexdigest()
-        if actual_checksum != record.get("content_sha256"):
-            raise ValueError(f"artifact checksum mismatch: {artifact_path}")
-
-        payload = _load_payload(path)
-        _validate_payload(schema_validator, payload, artifact_path)
-        source = payload.get("_source")
-        if not isinstance(source, dict):
-            raise ValueError(f"{artifact_path} is missing _source")
-        for field in (
-            "identity_scheme_version",
-            "source_entry_key",
-            "source_group_key",
-        ):
-            if source.get(field) != record.get(field):
-                raise ValueError(f"{artifact_path} {field} does not match manifest")
-        if source.get("identity_scheme_version") != expected_scheme:
-            raise ValueError(f"{artifact_path} identity scheme mismatch")
 
-        source_entry_key = source["source_entry_key"]
-        if source_entry_key in seen_source_keys:
-            raise ValueError(f"duplicate source entry key: {source_entry_key}")
-        seen_source_keys.add(source_entry_key)
+def _stat_fingerprint(path: Path) -> list[int]:
+    return _stat_values(path.stat())
+
 
-        source_index = source.get("source_index")
-        sense_ordinal = source.get("sense_ordinal")
-        if not isinstance(source_index, int) or not isinstance(sense_ordinal, int):
-            raise ValueError(f"{artifact_path} has invalid source ordinals")
+def _stat_values(stat: os.stat_result) -> list[int]:
+    return [stat.st_size, stat.st_mtime_ns]
 
+
+def _write_manifest_cache(
+    cache_file: Path,
+    cache_key: str,
+    reader: _ArtifactReader,
+    artifacts: list[SourceArtifact],
+) -> None:
+    entries = []
+    for artifact in artifacts:
+        entries.append(
+            {
+                "artifact_path": artifact.artifact_path,
+                "content_sha256": artifact.content_sha256,
+                "identity_scheme_version": artifact.identity_scheme_version,
+                "source_entry_key": artifact.source_entry_key,
+                "source_group_key": artifact.source_group_key,
+                "source_index": artifact.source_index,
+                "sense_ordinal": artifact.sense_ordinal,
+                "normalized_pos_status": artifact.normalized_pos_status,
+                "content_fingerprint": artifact.content_fingerprint,
+                "fingerprint_version": artifact.fingerprint_version,
+                "pack_offset": artifact.pack_offset,
+                "pack_length": artifact.pack_length,
+                # Stats taken before verification read the bytes, so a
+                # rewrite after verification cannot be recorded as verified.
+                "stat": artifact.file_stat,
+            }
+        )
+    cache = {
+        "cache_key": cache_key,
+        "root": str(reader.resolved_root),
+        "pack_stat": reader.pack_stat,
+        "artifacts": entries,
+    }
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_text(
+        json.dumps(cache, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8",
+    )
+    os.replace(tmp_file, cache_file)
+
+
+def _load_cached_artifacts(
+    cache_file: Path,
+    cache_key: str,
+    records: list[dict[str, Any]],
+    reader: _ArtifactReader,
+    payload_cache: _PayloadCache | None = None,
+) -> list[SourceArtifact] | None:
+    """Rebuild artifacts from a verified-manifest cache, or ``None`` on a miss.
+
+    A hit needs the same manifest checksum (the file name), loader version,
+    data directory, and unchanged size and mtime for every artifact file (or
+    for the pack). Payloads are still read and decoded; checksums, schema
+    validation and fingerprints are taken from the cache.
+    """
+    try:
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    entries = cache.get("artifacts")
+    if (
+        cache.get("cache_key") != cache_key
+        or cache.get("root") != str(reader.resolved_root)
+        or not isinstance(entries, list)
+        or len(entries) != len(records)
+    ):
+        return None
+    if reader.pack_path is not None:
+        if cache.get("pack_stat") != reader.pack_stat:
+            return None
+    elif cache.get("pack_stat") is not None:
+        return None
+
+    artifacts = []
+    for record, entry in zip(records, entries):
+        artifact_path = entry.get("artifact_path")
+        if artifact_path != record.get("artifact_path"):
+            return None
+        # Lazy payloads are read on first use, so a hit reads no artifacts.
+        data = None
+        if reader.pack_path is None:
+            path = reader.path_for(artifact_path)
+            pack_offset = pack_length = None
+            try:
+                if entry.get("stat") != _stat_fingerprint(path):
+                    return None
+                if payload_cache is None:
+                    data = path.read_bytes()
+            except OSError:
+                return None
+        elif payload_cache is not None:
+            path = reader.pack_path
+            pack_offset = entry["pack_offset"]
+            pack_length = entry["pack_length"]
+        else:
+            path, pack_offset, pack_length, data, _ = reader.read(
+                artifact_path, record
+            )
         artifacts.append(
             SourceArtifact(
                 path=path,
                 artifact_path=artifact_path,
-                content_sha256=actual_checksum,
-                identity_scheme_version=source["identity_scheme_version"],
-                source_entry_key=source_entry_key,
-                source_group_key=source["source_group_key"],
-                source_index=source_index,
-                sense_ordinal=sense_ordinal,
-                normalized_pos_status=source.get(
-                    "normalized_pos_status",
-                    "unresolved",
-                ),
-                content_fingerprint=semantic_content_fingerprint(payload),
-                fingerprint_version=ARTIFACT_FINGERPRINT_VERSION,
-                payload=payload,
+                content_sha256=entry["content_sha256"],
+                identity_scheme_version=entry["identity_scheme_version"],
+                source_entry_key=entry["source_entry_key"],
+                source_group_key=entry["source_group_key"],
+                source_index=entry["source_index"],
+                sense_ordinal=entry["sense_ordinal"],
+                normalized_pos_status=entry["normalized_pos_status"],
+                content_fingerprint=entry["content_fingerprint"],
+                fingerprint_version=entry["fingerprint_version"],
+                payload=None if data is None else _load_payload(data, artifact_path),
+                pack_offset=pack_offset,
+                pack_length=pack_length,
+                payload_cache=payload_cache,
             )
         )
+    return artifacts
+
+
+def load_source_manifest(
+    data_dir: Path | str,
+    *,
+    workers: int = 1,
+    cache_dir: Path | str | None = None,
+    verify: bool = False,
+    lazy_payloads: bool = False,
+    payload_cache_size: int = DEFAULT_PAYLOAD_CACHE_SIZE,
+) -> SourceManifest:
+    """Load and verify a source manifest and every artifact it lists.
+
+    With ``workers`` > 1 the per-artifact read, checksum, schema validation
+    and fingerprinting run on a thread pool; cross-artifact checks and error
+    reporting still follow manifest order.
+
+    With ``cache_dir`` a verified load is recorded under the manifest
+    checksum, and a later load of the unchanged corpus (same artifact sizes
+    and mtimes) skips verification. ``verify`` forces full verification and
+    refreshes the cache entry.
+
+    With ``lazy_payloads`` every artifact is still verified, but payloads are
+    dropped afterwards and decoded again by ``SourceArtifact.load_payload()``,
+    keeping the ``payload_cache_size`` most recent ones. Consumers that only
+    need keys and fingerprints then hold no payloads at all.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    root = Path(data_dir)
+    manifest_path = root / "_manifest.jsonl"
+    summary_path = root / "_manifest.summary.json"
+    if not manifest_path.is_file() or not summary_path.is_file():
+        raise ValueError(f"{root} is missing the required source manifest")
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    actual_manifest_sha256 = file_sha256(manifest_path)
+    if summary.get("manifest_sha256") != actual_manifest_sha256:
+        raise ValueError("manifest checksum mismatch")
+
+    with manifest_path.open(encoding="utf-8") as manifest_lines:
+        records = [json.loads(line) for line in manifest_lines if line.strip()]
+    if summary.get("artifact_count") != len(records):
+        raise ValueError("manifest artifact count mismatch")
+
+    cache_file = None
+    if cache_dir is not None:
+        cache_key = _manifest_cache_key()
+        cache_file = Path(cache_dir) / f"{actual_manifest_sha256}.json"
+
+    payload_cache = _PayloadCache(payload_cache_size) if lazy_payloads else None
+    reader = _ArtifactReader(root, summary.get("artifact_pack"))
+    try:
+        artifacts = None
+        if cache_file is not None and not verify:
+            artifacts = _load_cached_artifacts(
+                cache_file, cache_key, records, reader, payload_cache
+            )
+        if artifacts is None:
+            artifacts = _load_artifacts(
+                records,
+                reader,
+                summary.get("identity_scheme_version"),
+                workers,
+                payload_cache,
+            )
+            if cache_file is not None:
+                _write_manifest_cache(cache_file, cache_key, reader, artifacts)
+    finally:
+        reader.close()
 
     return SourceManifest(
         root=root.resolve(),
         artifact_format_version=summary["artifact_format_version"],
-        identity_scheme_version=expected_scheme,
+        identity_scheme_version=summary.get("identity_scheme_version"),
         input_sha256=summary["input_sha256"],
         manifest_sha256=actual_manifest_sha256,
         source_record_count=int(summary["source_record_count"]),
@@ -15,7 +15,9 @@ import pytest
 INGESTION_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(INGESTION_ROOT / "src"))
 
+from importer import source_import  # noqa: E402
 from importer.core import import_entries  # noqa: E402
+from importer.source_manifest import stored_raw_fingerprint  # noqa: E402
 
 
 TEST_DATABASE_URL = os.environ.get("INGESTION_TEST_DATABASE_URL")
@@ -39,6 +41,8 @@ def _write_manifest(
     first_is_nt2: bool = True,
     second_source_index: int = 2,
     swap_group_senses: bool = False,
+    packed: bool = False,
+    first_extra: dict | None = None,
 ) -> None:
     root.mkdir(parents=True, exist_ok=True)
     artifacts = [
@@ -157,30 +161,33 @@ def _write_manifest(
             },
         },
     ]
+    artifacts[0]["payload"].update(first_extra or {})
 
     records = []
+    pack = bytearray()
     for artifact in artifacts:
-        path = root / artifact["filename"]
-        path.write_text(
-            json.dumps(
-                [artifact["payload"]],
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        data = json.dumps(
+            [artifact["payload"]],
+            ensure_ascii=False,
+            indent=2,
+        ).encode("utf-8")
         source = artifact["payload"]["_source"]
-        records.append(
-            {
-                "artifact_path": artifact["filename"],
-                "content_sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
-                "identity_scheme_version": source[
-                    "identity_scheme_version"
-                ],
-                "source_entry_key": source["source_entry_key"],
-                "source_group_key": source["source_group_key"],
-            }
-        )
+        record = {
+            "artifact_path": artifact["filename"],
+            "content_sha256": hashlib.sha256(data).hexdigest(),
+            "identity_scheme_version": source["identity_scheme_version"],
+            "source_entry_key": source["source_entry_key"],
+            "source_group_key": source["source_group_key"],
+        }
+        if packed:
+            record["pack_offset"] = len(pack)
+            record["pack_length"] = len(data)
+            pack.extend(data)
+        else:
+            (root / artifact["filename"]).write_bytes(data)
+        records.append(record)
+    if packed:
+        (root / "_artifacts.pack").write_bytes(pack)
 
     manifest_path = root / "_manifest.jsonl"
     manifest_path.write_text(
@@ -190,19 +197,20 @@ def _write_manifest(
         ),
         encoding="utf-8",
     )
+    summary = {
+        "artifact_count": len(records),
+        "artifact_format_version": "vandale-structured-v2",
+        "identity_scheme_version": "test-provider-v1",
+        "input_sha256": "a" * 64,
+        "manifest_sha256": hashlib.sha256(
+            manifest_path.read_bytes()
+        ).hexdigest(),
+        "source_record_count": len(records),
+    }
+    if packed:
+        summary["artifact_pack"] = "_artifacts.pack"
     (root / "_manifest.summary.json").write_text(
-        json.dumps(
-            {
-                "artifact_count": len(records),
-                "artifact_format_version": "vandale-structured-v2",
-                "identity_scheme_version": "test-provider-v1",
-                "input_sha256": "a" * 64,
-                "manifest_sha256": hashlib.sha256(
-                    manifest_path.read_bytes()
-                ).hexdigest(),
-                "source_record_count": len(records),
-            }
-        ),
+        json.dumps(summary),
         encoding="utf-8",
     )
 
@@ -226,6 +234,20 @@ def test_versioned_source_import_is_stable_and_fails_closed_on_drift(
     )
     assert first.inserted == 4
     assert first.processed == 4
+    assert first.phases["manifest_load"]["rows"] == 4
+    assert first.phases["entry_writes"]["round_trips"] > 0
+    assert first.phases["content_nodes"]["rows"] == 4
+    with psycopg2.connect(database_url) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                select counts
+                from private.dictionary_import_runs
+                where id = %s
+                """,
+                (first.run_id,),
+            )
+            assert cursor.fetchone()[0]["phases"] == first.phases
 
     replay = import_entries(
         data_dir=tmp_path,
@@ -237,6 +259,13 @@ def test_versioned_source_import_is_stable_and_fails_closed_on_drift(
     )
     assert replay.no_op is True
     assert replay.matched == 4
+    assert list(replay.phases) == [
+        "manifest_load",
+        "connect",
+        "schema_check",
+        "noop_check",
+    ]
+    assert replay.phases["noop_check"]["round_trips"] > 0
 
     with psycopg2.connect(database_url) as connection:
         with connection.cursor() as cursor:
@@ -573,3 +602,482 @@ def test_source_import_keeps_report_atoms_verifiable_across_reimport(
     run_import()
     replayed = read_attestation()
     assert replayed == changed
+
+
+def test_packed_manifest_imports_like_the_per_file_layout(
+    tmp_path: Path,
+) -> None:
+    database_url = _require_local_test_database()
+    suffix = uuid4().hex
+    imported_rows = {}
+    for layout in ("files", "packed"):
+        data_dir = tmp_path / layout
+        dictionary_slug = f"pytest-{layout}-{suffix}"
+        _write_manifest(data_dir, packed=layout == "packed")
+        assert (data_dir / "_artifacts.pack").exists() == (layout == "packed")
+
+        def run_import():
+            return import_entries(
+                data_dir=data_dir,
+                database_url=database_url,
+                dictionary_slug=dictionary_slug,
+                dictionary_name=f"Pytest {layout} dictionary",
+                nt2_slug=f"pytest-{layout}-list-{suffix}",
+                nt2_name=f"Pytest {layout} list",
+            )
+
+        assert run_import().inserted == 4
+        assert run_import().no_op is True
+        with psycopg2.connect(database_url) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    select entry.headword, entry.meaning_id, entry.raw
+                    from public.word_entries as entry
+                    join public.dictionaries as dictionary
+                      on dictionary.id = entry.dictionary_id
+                    where dictionary.slug = %s
+                    order by entry.headword, entry.meaning_id
+                    """,
+                    (dictionary_slug,),
+                )
+                imported_rows[layout] = cursor.fetchall()
+
+    assert imported_rows["packed"] == imported_rows["files"]
+
+
+def test_copy_bulk_load_writes_the_same_rows_as_execute_values(
+    tmp_path: Path,
+) -> None:
+    database_url = _require_local_test_database()
+    suffix = uuid4().hex
+    imported = {}
+    entry_write_rows = {}
+    for bulk_load in ("values", "copy"):
+        data_dir = tmp_path / bulk_load
+        dictionary_slug = f"pytest-{bulk_load}-{suffix}"
+
+        def run_import():
+            return import_entries(
+                data_dir=data_dir,
+                database_url=database_url,
+                dictionary_slug=dictionary_slug,
+                dictionary_name=f"Pytest {bulk_load} dictionary",
+                nt2_slug=f"pytest-{bulk_load}-list-{suffix}",
+                nt2_name=f"Pytest {bulk_load} list",
+                bulk_load=bulk_load,
+            )
+
+        _write_manifest(data_dir)
+        inserted = run_import()
+        assert inserted.inserted == 4
+        _write_manifest(data_dir, first_definition="een gewijzigd zitmeubel")
+        updated = run_import()
+        assert (updated.matched, updated.changed) == (4, 1)
+        entry_write_rows[bulk_load] = [
+            inserted.phases["entry_writes"]["rows"],
+            updated.phases["entry_writes"]["rows"],
+        ]
+
+        with psycopg2.connect(database_url) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    select entry.headword, entry.meaning_id,
+                           entry.part_of_speech, entry.gender,
+                           entry.is_nt2_2000, entry.vandale_id, entry.raw,
+                           entry.management_kind, entry.source_lifecycle,
+                           entry.normalized_pos_status,
+                           binding.source_entry_key, binding.binding_state,
+                           binding.content_fingerprint,
+                           binding.identity_evidence,
+                           binding.reconciliation_decision,
+                           binding.first_seen_run_id <> binding.last_seen_run_id
+                    from public.word_entries as entry
+                    join public.dictionaries as dictionary
+                      on dictionary.id = entry.dictionary_id
+                    join private.source_entry_bindings as binding
+                      on binding.word_entry_id = entry.id
+                    where dictionary.slug = %s
+                    order by binding.source_entry_key
+                    """,
+                    (dictionary_slug,),
+                )
+                imported[bulk_load] = cursor.fetchall()
+
+    assert len(imported["copy"]) == 4
+    assert imported["copy"] == imported["values"]
+    assert entry_write_rows["copy"] == entry_write_rows["values"]
+
+
+def test_delta_writes_rewrite_only_the_changed_entry(tmp_path: Path) -> None:
+    database_url = _require_local_test_database()
+    suffix = uuid4().hex
+    dictionary_slug = f"pytest-delta-{suffix}"
+
+    def run_import(**options):
+        return import_entries(
+            data_dir=tmp_path,
+            database_url=database_url,
+            dictionary_slug=dictionary_slug,
+            dictionary_name="Pytest delta dictionary",
+            nt2_slug=f"pytest-delta-list-{suffix}",
+            nt2_name="Pytest delta list",
+            **options,
+        )
+
+    def snapshot():
+        with psycopg2.connect(database_url) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    select binding.source_entry_key, entry.xmin::text,
+                           entry.raw, binding.last_seen_run_id::text,
+                           binding.manifest_checksum,
+                           binding.reconciliation_decision
+                    from public.word_entries as entry
+                    join public.dictionaries as dictionary
+                      on dictionary.id = entry.dictionary_id
+                    join private.source_entry_bindings as binding
+                      on binding.word_entry_id = entry.id
+                    where dictionary.slug = %s
+                    order by binding.source_entry_key
+                    """,
+                    (dictionary_slug,),
+                )
+                return cursor.fetchall()
+
+    _write_manifest(tmp_path)
+    assert run_import(delta_writes=True).inserted == 4
+    before = snapshot()
+
+    _write_manifest(tmp_path, first_definition="een gewijzigd zitmeubel")
+    delta = run_import(delta_writes=True)
+    assert (delta.matched, delta.changed, delta.untouched) == (4, 1, 3)
+    assert delta.phases["content_nodes"]["rows"] == 1
+    after = snapshot()
+
+    rewritten = [
+        (old[0], old[1] != new[1], old[5] != new[5])
+        for old, new in zip(before, after)
+    ]
+    assert sum(entry_changed for _, entry_changed, _ in rewritten) == 1
+    assert sum(decision_changed for _, _, decision_changed in rewritten) == 1
+    assert {row[3] for row in after} == {delta.run_id}
+    assert len({row[4] for row in after}) == 1
+    assert run_import(delta_writes=True).no_op is True
+
+    _write_manifest(tmp_path, first_definition="een ander zitmeubel")
+    full = run_import()
+    assert (full.changed, full.untouched) == (1, 0)
+    assert full.phases["content_nodes"]["rows"] == 4
+
+
+def test_raw_fingerprint_column_is_rechecked_when_floats_respell(
+    tmp_path: Path,
+) -> None:
+    database_url = _require_local_test_database()
+    suffix = uuid4().hex
+    dictionary_slug = f"pytest-raw-fingerprint-{suffix}"
+
+    def run_import():
+        return import_entries(
+            data_dir=tmp_path,
+            database_url=database_url,
+            dictionary_slug=dictionary_slug,
+            dictionary_name="Pytest raw fingerprint dictionary",
+            nt2_slug=f"pytest-raw-fingerprint-list-{suffix}",
+            nt2_name="Pytest raw fingerprint list",
+        )
+
+    def execute(statement):
+        with psycopg2.connect(database_url) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(statement, (dictionary_slug,))
+                return cursor.rowcount
+
+    # jsonb prints these as 0.00001 and 0.00000015.
+    _write_manifest(tmp_path, first_extra={"frequency": [1e-05, 1.5e-07]})
+    assert run_import().inserted == 4
+    replay = run_import()
+    assert replay.no_op is True
+    assert replay.phases["noop_check"]["round_trips"] == 4
+
+    # What the migration 126 backfill computes for the same rows.
+    assert execute(
+        """
+        update public.word_entries
+        set raw_fingerprint = private.word_entry_raw_fingerprint(raw)
+        where dictionary_id = (
+            select id from public.dictionaries where slug = %s
+        )
+        """
+    ) == 4
+    backfilled = run_import()
+    assert backfilled.no_op is True
+    assert backfilled.phases["noop_check"]["round_trips"] == 5
+
+    assert execute(
+        """
+        update public.word_entries
+        set raw = jsonb_set(raw, '{meanings,0,definition}', '"tampered"')
+        where dictionary_id = (
+            select id from public.dictionaries where slug = %s
+        )
+          and raw ->> 'headword' = 'stam'
+          and meaning_id = 1
+        """
+    ) == 1
+    with pytest.raises(RuntimeError, match="stored source content drifted"):
+        run_import()
+
+
+def test_raw_fingerprint_trigger_only_fingerprints_source_objects(
+    tmp_path: Path,
+) -> None:
+    database_url = _require_local_test_database()
+    suffix = uuid4().hex
+    dictionary_slug = f"pytest-fingerprint-trigger-{suffix}"
+    user_id = str(uuid4())
+
+    _write_manifest(tmp_path)
+    import_entries(
+        data_dir=tmp_path,
+        database_url=database_url,
+        dictionary_slug=dictionary_slug,
+        dictionary_name="Pytest fingerprint trigger dictionary",
+        nt2_slug=f"pytest-fingerprint-trigger-list-{suffix}",
+        nt2_name="Pytest fingerprint trigger list",
+    )
+
+    with psycopg2.connect(database_url) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                insert into auth.users (id, email)
+                values (%s, %s)
+                """,
+                (user_id, f"{user_id}@test.local"),
+            )
+            cursor.execute(
+                """
+                insert into public.dictionaries (
+                    language_code, slug, name, kind, visibility,
+                    owner_user_id, is_editable
+                )
+                values ('nl', %s, 'Pytest user dictionary', 'user',
+                        'private', %s, true)
+                returning id
+                """,
+                (f"pytest-user-{suffix}", user_id),
+            )
+            user_dictionary_id = cursor.fetchone()[0]
+            # User entries are never fingerprinted, whatever raw holds.
+            cursor.execute(
+                """
+                insert into public.word_entries (
+                    language_code, dictionary_id, headword, meaning_id, raw
+                )
+                values ('nl', %s, 'huis', 1, '"vrije tekst"'::jsonb)
+                returning raw_fingerprint
+                """,
+                (user_dictionary_id,),
+            )
+            assert cursor.fetchone() == (None,)
+
+            cursor.execute(
+                """
+                update public.word_entries as entry
+                set raw = '["geen object"]'::jsonb
+                from public.dictionaries as dictionary
+                where dictionary.id = entry.dictionary_id
+                  and dictionary.slug = %s
+                  and entry.headword = 'stam'
+                  and entry.meaning_id = 1
+                returning entry.raw_fingerprint
+                """,
+                (dictionary_slug,),
+            )
+            assert cursor.fetchall() == [(None,)]
+            cursor.execute(
+                """
+                update public.word_entries as entry
+                set raw = '{"headword": "stam"}'::jsonb
+                from public.dictionaries as dictionary
+                where dictionary.id = entry.dictionary_id
+                  and dictionary.slug = %s
+                  and entry.headword = 'stam'
+                  and entry.meaning_id = 1
+                returning entry.raw_fingerprint
+                """,
+                (dictionary_slug,),
+            )
+            assert cursor.fetchall() == [
+                (stored_raw_fingerprint({"headword": "stam"}),)
+            ]
+            connection.rollback()
+
+
+def test_resumable_import_continues_after_the_last_committed_batch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    database_url = _require_local_test_database()
+    suffix = uuid4().hex
+    dictionary_slug = f"pytest-resumable-{suffix}"
+
+    def run_import(**options):
+        return import_entries(
+            data_dir=tmp_path,
+            database_url=database_url,
+            dictionary_slug=dictionary_slug,
+            dictionary_name="Pytest resumable dictionary",
+            nt2_slug=f"pytest-resumable-list-{suffix}",
+            nt2_name="Pytest resumable list",
+            **options,
+        )
+
+    def fetch(statement):
+        with psycopg2.connect(database_url) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(statement, (dictionary_slug,))
+                return cursor.fetchall()
+
+    record_checkpoint = source_import._record_checkpoint
+
+    def fail_second_batch(cursor, run_id, stats, checkpoint):
+        if checkpoint["batches"] == 2:
+            raise RuntimeError("simulated crash")
+        record_checkpoint(cursor, run_id, stats, checkpoint)
+
+    # Batch size 1 still keeps both senses of source group a3 together.
+    _write_manifest(tmp_path)
+    monkeypatch.setattr(
+        source_import,
+        "_record_checkpoint",
+        fail_second_batch,
+    )
+    with pytest.raises(RuntimeError, match="simulated crash"):
+        run_import(resumable=True, batch_size=1)
+    monkeypatch.undo()
+
+    [(run_id, status, checkpoint)] = fetch(
+        """
+        select run.id::text, run.status, run.counts -> 'checkpoint'
+        from private.dictionary_import_runs as run
+        join public.dictionaries as dictionary
+          on dictionary.id = run.dictionary_id
+        where dictionary.slug = %s
+        """
+    )
+    assert status == "running"
+    assert checkpoint == {"mode": "empty", "batch_size": 1, "batches": 1}
+    committed_keys = """
+        select binding.source_entry_key
+        from private.source_entry_bindings as binding
+        join public.dictionaries as dictionary
+          on dictionary.id = binding.dictionary_id
+        where dictionary.slug = %s
+        order by binding.source_entry_key
+    """
+    assert fetch(committed_keys) == [("test:article:a1:1",)]
+    with pytest.raises(RuntimeError, match=f"{run_id} is unfinished"):
+        run_import()
+
+    resumed = run_import(resumable=True, batch_size=50)
+    assert resumed.run_id == run_id
+    assert (resumed.resumed_batches, resumed.batches) == (1, 2)
+    assert (resumed.inserted, resumed.nt2_linked) == (4, 2)
+    assert len(fetch(committed_keys)) == 4
+    assert fetch(
+        """
+        select run.status, run.counts ? 'checkpoint'
+        from private.dictionary_import_runs as run
+        join public.dictionaries as dictionary
+          on dictionary.id = run.dictionary_id
+        where dictionary.slug = %s
+        """
+    ) == [("completed", False)]
+    assert run_import(resumable=True).no_op is True
+
+    _write_manifest(tmp_path, first_definition="een gewijzigd zitmeubel")
+    changed = run_import(resumable=True, batch_size=2)
+    assert (changed.matched, changed.changed, changed.batches) == (4, 1, 2)
+    assert changed.nt2_skipped == 2
+
+
+def test_resumable_repair_crashed_before_finalizing_is_not_a_no_op(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    database_url = _require_local_test_database()
+    suffix = uuid4().hex
+    dictionary_slug = f"pytest-resumable-repair-{suffix}"
+
+    def run_import(**options):
+        return import_entries(
+            data_dir=tmp_path,
+            database_url=database_url,
+            dictionary_slug=dictionary_slug,
+            dictionary_name="Pytest resumable repair dictionary",
+            nt2_slug=f"pytest-resumable-repair-list-{suffix}",
+            nt2_name="Pytest resumable repair list",
+            **options,
+        )
+
+    def run_statuses():
+        with psycopg2.connect(database_url) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    select run.status
+                    from private.dictionary_import_runs as run
+                    join public.dictionaries as dictionary
+                      on dictionary.id = run.dictionary_id
+                    where dictionary.slug = %s
+                    order by run.started_at
+                    """,
+                    (dictionary_slug,),
+                )
+                return [row[0] for row in cursor.fetchall()]
+
+    def fail_finalization(*args):
+        raise RuntimeError("simulated crash")
+
+    _write_manifest(tmp_path)
+    run_import()
+    with psycopg2.connect(database_url) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                update private.platform_v2_content_nodes as node
+                set canonical_source_text = null
+                from private.source_entry_bindings as binding
+                join public.dictionaries as dictionary
+                  on dictionary.id = binding.dictionary_id
+                where node.entry_id = binding.word_entry_id
+                  and dictionary.slug = %s
+                  and binding.source_entry_key = 'test:article:a1:1'
+                  and node.binding_state = 'active'
+                """,
+                (dictionary_slug,),
+            )
+            assert cursor.rowcount == 1
+
+    # Every batch commits and repairs the node; the crash hits the final
+    # NT2 sync, so the completed manifest matches again.
+    monkeypatch.setattr(
+        source_import,
+        "_committed_nt2_rows",
+        fail_finalization,
+    )
+    with pytest.raises(RuntimeError, match="simulated crash"):
+        run_import(resumable=True, batch_size=2)
+    monkeypatch.undo()
+    assert run_statuses() == ["completed", "running"]
+
+    resumed = run_import(resumable=True)
+    assert resumed.no_op is False
+    assert (resumed.resumed_batches, resumed.batches) == (2, 0)
+    assert run_statuses() == ["completed", "completed"]
+    assert run_import().no_op is True
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+INGESTION_ROOT = REPO_ROOT / "packages" / "ingestion"
+SCRAPER_ROOT = REPO_ROOT / "packages" / "scraper"
+FIXTURE_ARTICLES = SCRAPER_ROOT / "tests" / "fixtures" / "vandale_articles.json"
+LEGACY_WORDS = INGESTION_ROOT / "tests" / "fixtures" / "legacy_words"
+sys.path.insert(0, str(INGESTION_ROOT / "src"))
+sys.path.append(str(INGESTION_ROOT / "scripts"))
+sys.path.append(str(SCRAPER_ROOT))
+
+from importer import canonical_json as canonical_json_module  # noqa: E402
+from importer.canonical_json import (  # noqa: E402
+    available_canonical_json_backends,
+    canonical_json_encoder,
+)
+from importer.source_manifest import (  # noqa: E402
+    load_source_manifest,
+    platform_v2_content_node_inputs,
+    semantic_content_fingerprint,
+    stored_raw_fingerprint,
+)
+import process_raw_words  # noqa: E402
+
+
+# Digest of every fingerprint over the fixture corpus, recorded with the
+# json.dumps encoder the importer used before the encoder became pluggable.
+# A change here invalidates stored source_entry_bindings fingerprints.
+GOLDEN_CORPUS_DIGEST = (
+    "a0f00f3fe2bb48be69eeb96892e8b4b79619021ba123fc6baf429e64ca81999a"
+)
+EDGE_VALUES = [
+    "\x00\x1f\x7f\b\f\n\r\t\"\\/",
+    "  é😀",
+    {"b": 1, "a": 2, "é": 3, "z": 4, "😀": 5, "￿": 6},
+    [0.1, -0.0, 1.0, 1e15, 1e16, 1.5e300, 1e-4, 1e-5, 1e-6, 1.5e-7, 1e-300],
+    {"f2e": 123456789.123, "x": [1e22]},
+    ["1e5", "0.00001", 2**63, -(2**63), 2**64],
+    {1: "non-string key"},
+    [True, False, None, [], {}],
+]
+
+
+def _corpus_digest(tmp_path: Path) -> str:
+    output_dir = tmp_path / "processed"
+    process_raw_words.process_words(FIXTURE_ARTICLES, output_dir)
+    manifest = load_source_manifest(output_dir)
+
+    digest = hashlib.sha256()
+    for artifact in sorted(
+        manifest.artifacts,
+        key=lambda artifact: artifact.source_entry_key,
+    ):
+        node_inputs = platform_v2_content_node_inputs(artifact.payload)
+        for value in (
+            artifact.source_entry_key,
+            artifact.content_fingerprint,
+            artifact.stored_raw_fingerprint,
+            artifact.ordinal_independent_fingerprint,
+            json.dumps(node_inputs, sort_keys=True),
+        ):
+            digest.update(value.encode("utf-8") + b"\n")
+    for path in sorted(LEGACY_WORDS.glob("*.json")):
+        for payload in json.loads(path.read_text(encoding="utf-8")):
+            digest.update(semantic_content_fingerprint(payload).encode("ascii"))
+            digest.update(stored_raw_fingerprint(payload).encode("ascii"))
+    return digest.hexdigest()
+
+
+@pytest.mark.parametrize("backend", available_canonical_json_backends())
+def test_fixture_fingerprints_match_the_golden_digest(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    backend: str,
+) -> None:
+    encoder = canonical_json_encoder(backend)
+    monkeypatch.setattr("importer.source_manifest.canonical_json", encoder)
+    monkeypatch.setattr(process_raw_words, "canonical_json", encoder)
+
+    assert _corpus_digest(tmp_path) == GOLDEN_CORPUS_DIGEST
+
+
+@pytest.mark.parametrize("value", EDGE_VALUES)
+def test_backends_encode_identical_bytes(value) -> None:
+    expected = canonical_json_encoder("stdlib")(value)
+
+    for backend in available_canonical_json_backends():
+        assert canonical_json_encoder(backend)(value) == expected
+
+
+def test_unknown_or_missing_backend_is_rejected(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with pytest.raises(ValueError, match="Unknown canonical JSON backend"):
+        canonical_json_encoder("simplejson")
+
+    monkeypatch.setattr(canonical_json_module, "orjson", None)
+    assert available_canonical_json_backends() == ("stdlib",)
+    assert canonical_json_encoder() is canonical_json_module._stdlib_canonical_json
+    with pytest.raises(ValueError, match="not installed"):
+        canonical_json_encoder("orjson")
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from copy import deepcopy
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+
+INGESTION_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(INGESTION_ROOT / "src"))
+
+from importer.compiled_schema import (  # noqa: E402
+    UnsupportedSchemaError,
+    compile_schema,
+)
+from importer.source_manifest import (  # noqa: E402
+    _load_schema_validator,
+    _validate_payload,
+)
+
+
+LEGACY_WORDS = INGESTION_ROOT / "tests" / "fixtures" / "legacy_words"
+REPLACEMENTS = (None, True, 0, 1, 1.0, 2.5, "", "x", [], [1], {}, {"x": 1})
+STRUCTURED_ENTRY = {
+    "headword": "voorbeeld",
+    "part_of_speech_evidence": {
+        "normalized_pos_status": "known",
+        "source": "headword_html",
+        "raw_value": "zn",
+    },
+    "verb_forms": ["voorbeelden"],
+    "alternate_headwords": ["voorbeelden", {"headword": "voorbeeldje"}],
+    "cross_reference": None,
+    "meanings": [
+        {
+            "definition": "een definitie",
+            "examples": ["een zin"],
+            "idioms": [
+                "een uitdrukking",
+                {"expression": "bij wijze van", "examples": ["zo"]},
+            ],
+            "grammar": {"plural": ["voorbeelden"], "countable": True},
+            "cross_references": [{"headword": "model", "meaning_id": 1}],
+        }
+    ],
+    "audio_links": {"nl": "https://example.test/nl.mp3", "be": None},
+    "reference_tables": [
+        {"title": "Vormen", "rows": [{"label": "meervoud", "value": "-en"}]}
+    ],
+    "source_identity": {"provider_article_id": "a123", "homograph_number": 2},
+    "_source": {
+        "identity_scheme_version": "vandale-provider-article-v1",
+        "identity_evidence": {"provider_article_id": "a123"},
+        "provider_article_id": "a123",
+        "normalized_pos_status": "known",
+        "pos_evidence": {
+            "normalized_pos_status": "known",
+            "source": "headword_html",
+            "raw_value": "zn",
+        },
+        "source_group_key": "fnt:v1:opaque",
+        "source_entry_key": "fnt:v1:opaque:1",
+        "source_index": 42,
+        "sense_ordinal": 1,
+    },
+    "_metadata": {"index": 42},
+    "meaning_id": 1,
+}
+
+
+def _valid_payloads() -> list[dict]:
+    payloads = [STRUCTURED_ENTRY]
+    for path in sorted(LEGACY_WORDS.glob("*.json")):
+        payloads.extend(json.loads(path.read_text(encoding="utf-8")))
+    return payloads
+
+
+def _paths(value, prefix=()):
+    yield prefix
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _paths(item, prefix + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _paths(item, prefix + (index,))
+
+
+def _mutations(payload: dict):
+    """Replace and drop every node of ``payload`` in turn."""
+    for path in _paths(payload):
+        if not path:
+            continue
+        for replacement in REPLACEMENTS:
+            mutated = deepcopy(payload)
+            parent = mutated
+            for part in path[:-1]:
+                parent = parent[part]
+            parent[path[-1]] = deepcopy(replacement)
+            yield mutated
+        mutated = deepcopy(payload)
+        parent = mutated
+        for part in path[:-1]:
+            parent = parent[part]
+        if isinstance(parent, dict):
+            del parent[path[-1]]
+            yield mutated
+
+
+def _schema_error(validator, payload) -> str | None:
+    try:
+        _validate_payload(validator, payload, "artifact.json")
+    except ValueError as error:
+        return str(error)
+    return None
+
+
+def test_compiled_validator_matches_generic_verdicts_and_locations() -> None:
+    fast = _load_schema_validator()
+    generic = _load_schema_validator(compiled=False)
+    assert fast.compiled is not None
+    assert generic.compiled is None
+
+    checked = invalid = 0
+    for payload in _valid_payloads():
+        assert fast.compiled(payload)
+        for mutated in _mutations(payload):
+            verdict = generic.generic.is_valid(mutated)
+            assert fast.compiled(mutated) is verdict, mutated
+            assert _schema_error(fast, mutated) == _schema_error(generic, mutated)
+            checked += 1
+            invalid += not verdict
+
+    assert invalid > 100
+    assert checked - invalid > 100
+
+
+def test_compile_schema_rejects_keywords_it_does_not_translate() -> None:
+    with pytest.raises(UnsupportedSchemaError, match="pattern"):
+        compile_schema({"type": "string", "pattern": "^a"})
+    with pytest.raises(UnsupportedSchemaError, match=r"\$ref"):
+        compile_schema({"$ref": "https://example.test/other.json"})
+
+    check = compile_schema(
+        {
+            "$defs": {"node": {"type": "object", "properties": {"next": {"$ref": "#"}}}},
+            "$ref": "#/$defs/node",
+        }
+    )
+    assert check({"next": {"next": {}}})
+    assert not check({"next": {"next": 1}})
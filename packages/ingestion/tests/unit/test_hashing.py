@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+import sys
+
+
+INGESTION_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(INGESTION_ROOT / "src"))
+
+from importer.hashing import file_sha256  # noqa: E402
+
+
+def test_file_sha256_matches_a_whole_file_digest(tmp_path: Path) -> None:
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    large = tmp_path / "word_list.json"
+    # Several digest buffers long, with a ragged tail.
+    large.write_bytes(b"[" + b'{"headword":"voorbeeld"},' * 50_000 + b"{}]")
+
+    for path in (empty, large):
+        assert file_sha256(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert file_sha256(str(path)) == file_sha256(path)
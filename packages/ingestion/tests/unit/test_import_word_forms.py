@@ -47,7 +47,7 @@ def test_collect_source_forms_keeps_colliding_natural_keys_separate(
 
     monkeypatch.setattr(
         "import_word_forms.load_source_manifest",
-        lambda _data_dir: Manifest(),
+        lambda _data_dir, **_options: Manifest(),
     )
 
     scheme, manifest_checksum, forms = collect_source_forms(tmp_path)
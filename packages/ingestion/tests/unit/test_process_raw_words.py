@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+from copy import deepcopy
+import hashlib
 import json
 import os
 from pathlib import Path
 import subprocess
 import sys
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[4]
 PROCESS_SCRIPT = REPO_ROOT / "packages/ingestion/scripts/process_raw_words.py"
 SCRAPER_ROOT = REPO_ROOT / "packages/scraper"
+FIXTURE_ARTICLES = SCRAPER_ROOT / "tests/fixtures/vandale_articles.json"
+sys.path.append(str(PROCESS_SCRIPT.parent))
+
+import process_raw_words  # noqa: E402
+from importer.source_manifest import load_source_manifest  # noqa: E402
 
 
 def _named_article(article_id: str, headword: str, definition: str) -> str:
@@ -29,6 +38,36 @@ def _article(article_id: str, definition: str) -> str:
     return _named_article(article_id, "aan·pas·sen", definition)
 
 
+def _run_fixture_corpus(
+    tmp_path: Path,
+    name: str,
+    *arguments: str,
+    input_file: Path = FIXTURE_ARTICLES,
+) -> dict:
+    output_dir = tmp_path / name
+    subprocess.run(
+        [
+            sys.executable,
+            str(PROCESS_SCRIPT),
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(output_dir),
+            *arguments,
+        ],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(SCRAPER_ROOT)},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return {
+        path.name: path.read_bytes()
+        for path in sorted(output_dir.iterdir())
+        if path.name != "_parse_cache.jsonl"
+    }
+
+
 def test_cli_keeps_same_headword_homographs_as_separate_artifacts(
     tmp_path: Path,
 ) -> None:
@@ -146,7 +185,9 @@ def test_cli_writes_deterministic_source_manifest(tmp_path: Path) -> None:
             "source_group_key": records[0]["source_group_key"],
         }
     ]
-    assert len(records[0]["content_sha256"]) == 64
+    assert records[0]["content_sha256"] == hashlib.sha256(
+        (data_dir / "words_content" / records[0]["artifact_path"]).read_bytes()
+    ).hexdigest()
     assert records[0]["source_entry_key"] == (
         f"{records[0]['source_group_key']}:1"
     )
@@ -356,3 +397,236 @@ def test_cli_promotes_only_resolvable_pointer_only_meanings(
     assert literal["meanings"][0]["definition"] == (
         "een niet-lege definitie met een koppelteken"
     )
+
+
+def test_cli_parser_backends_write_byte_identical_output(
+    tmp_path: Path,
+) -> None:
+    baseline = _run_fixture_corpus(
+        tmp_path, "html-parser", "--parser-backend", "html.parser"
+    )
+    auto = _run_fixture_corpus(tmp_path, "auto", "--parser-backend", "auto")
+
+    assert "_manifest.jsonl" in baseline
+    assert len(baseline) > 20
+    assert auto == baseline
+
+
+def test_cli_parallel_workers_write_byte_identical_output(
+    tmp_path: Path,
+) -> None:
+    serial = _run_fixture_corpus(tmp_path, "serial")
+    parallel = _run_fixture_corpus(tmp_path, "parallel", "--workers", "3")
+
+    assert len(serial) > 20
+    assert parallel == serial
+
+
+def test_cli_incremental_run_matches_a_full_rebuild(tmp_path: Path) -> None:
+    articles = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+    input_file = tmp_path / "word_list.json"
+    input_file.write_text(json.dumps(articles, ensure_ascii=False), "utf-8")
+    _run_fixture_corpus(
+        tmp_path, "incremental", "--incremental", input_file=input_file
+    )
+    output_dir = tmp_path / "incremental"
+    assert (output_dir / "_parse_cache.jsonl").is_file()
+    untouched = next(output_dir.glob(f"{articles[0]['index']:06d}_*.json"))
+    untouched_mtime = untouched.stat().st_mtime_ns
+    removed = next(output_dir.glob(f"{articles[1]['index']:06d}_*.json"))
+
+    changed = articles[2]
+    changed["content"] = changed["content"].replace("in Afrika", "in West-Afrika")
+    del articles[1]
+    input_file.write_text(json.dumps(articles, ensure_ascii=False), "utf-8")
+
+    incremental = _run_fixture_corpus(
+        tmp_path, "incremental", "--incremental", input_file=input_file
+    )
+    rebuilt = _run_fixture_corpus(tmp_path, "rebuilt", input_file=input_file)
+
+    assert incremental == rebuilt
+    assert not (tmp_path / "rebuilt" / "_parse_cache.jsonl").exists()
+    assert not removed.exists()
+    assert untouched.stat().st_mtime_ns == untouched_mtime
+    assert any(
+        "land in West-Afrika" in data.decode("utf-8")
+        for name, data in incremental.items()
+        if name.startswith(f"{changed['index']:06d}_")
+    )
+
+
+def test_cli_incremental_refuses_files_outside_the_manifest(
+    tmp_path: Path,
+) -> None:
+    _run_fixture_corpus(tmp_path, "words_content")
+    stray = tmp_path / "words_content" / "notes.txt"
+    stray.write_text("hand-written", encoding="utf-8")
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(PROCESS_SCRIPT),
+            "--input",
+            str(FIXTURE_ARTICLES),
+            "--output-dir",
+            str(tmp_path / "words_content"),
+            "--incremental",
+        ],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(SCRAPER_ROOT)},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "files outside its manifest: notes.txt" in result.stderr
+    assert stray.exists()
+
+
+def test_cli_incremental_run_recovers_from_an_interrupted_run(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    articles = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+    input_file = tmp_path / "word_list.json"
+    input_file.write_text(json.dumps(articles, ensure_ascii=False), "utf-8")
+    _run_fixture_corpus(tmp_path, "incremental", input_file=input_file)
+    output_dir = tmp_path / "incremental"
+
+    # The new article comes first, so its artifact is written before the
+    # changed article's replacement crashes ahead of its rename.
+    articles.insert(
+        0,
+        {
+            "headword": "nieuw",
+            "content": _named_article("a999001", "nieuw", "pas toegevoegd"),
+            "dictionaryId": "fnt",
+            "index": 23,
+        },
+    )
+    changed = articles[3]
+    changed["content"] = changed["content"].replace("in Afrika", "in West-Afrika")
+    input_file.write_text(json.dumps(articles, ensure_ascii=False), "utf-8")
+
+    def crash(source, target):
+        raise OSError("simulated crash")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(process_raw_words.os, "replace", crash)
+        with pytest.raises(OSError, match="simulated crash"):
+            process_raw_words.process_words(
+                input_file,
+                output_dir,
+                incremental=True,
+            )
+    assert next(output_dir.glob("000023_*.json")).exists()
+    assert next(output_dir.glob("000003_*.json.tmp")).exists()
+
+    incremental = _run_fixture_corpus(
+        tmp_path, "incremental", "--incremental", input_file=input_file
+    )
+    rebuilt = _run_fixture_corpus(tmp_path, "rebuilt", input_file=input_file)
+
+    assert incremental == rebuilt
+
+
+def test_iter_raw_records_streams_json_arrays_across_read_chunks(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    articles = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+    input_file = tmp_path / "word_list.json"
+    input_file.write_text(
+        json.dumps(articles, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(process_raw_words, "READ_CHUNK_SIZE", 7)
+
+    assert list(process_raw_words.iter_raw_records(input_file)) == articles
+
+    input_file.write_text('[{"index": 1}] []', encoding="utf-8")
+    with pytest.raises(ValueError, match="Unexpected data after the JSON array"):
+        list(process_raw_words.iter_raw_records(input_file))
+
+
+def test_cli_jsonl_input_matches_json_array_input(tmp_path: Path) -> None:
+    articles = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+    input_file = tmp_path / "word_list.jsonl"
+    input_file.write_text(
+        "".join(
+            json.dumps(article, ensure_ascii=False) + "\n"
+            for article in articles
+        ),
+        encoding="utf-8",
+    )
+
+    from_array = _run_fixture_corpus(tmp_path, "array")
+    from_lines = _run_fixture_corpus(tmp_path, "lines", input_file=input_file)
+
+    array_summary = json.loads(from_array.pop("_manifest.summary.json"))
+    lines_summary = json.loads(from_lines.pop("_manifest.summary.json"))
+    assert from_lines == from_array
+    assert array_summary.pop("input_sha256") != lines_summary.pop("input_sha256")
+    assert lines_summary == array_summary
+
+
+def test_split_entry_senses_shares_article_data_without_mutating_it() -> None:
+    parsed = {
+        "headword": "daar",
+        "conjugation_table": {"present": {"ik": "ben"}},
+        "meanings": [
+            {"definition": "daar-", "examples": []},
+            {"definition": "op die plaats", "examples": ["daar staat hij"]},
+        ],
+        "_raw_html": "<span>daar</span>",
+    }
+    original = deepcopy(parsed)
+
+    senses = list(process_raw_words.split_entry_senses(parsed))
+    for _, entry in senses:
+        process_raw_words.promote_resolvable_pointer_only_meaning(
+            entry,
+            {"daar-"},
+        )
+
+    assert parsed == original
+    assert [meaning_id for meaning_id, _ in senses] == [1, 2]
+    assert senses[0][1]["cross_reference"] == "daar-"
+    assert senses[0][1]["meanings"] == []
+    assert senses[1][1]["meanings"] == [parsed["meanings"][1]]
+    assert senses[1][1]["meanings"][0] is parsed["meanings"][1]
+    assert all(
+        entry["conjugation_table"] is parsed["conjugation_table"]
+        for _, entry in senses
+    )
+
+
+def test_cli_packed_output_loads_like_per_file_output(tmp_path: Path) -> None:
+    _run_fixture_corpus(tmp_path, "files")
+    packed_files = _run_fixture_corpus(
+        tmp_path, "packed", "--output-format", "packed"
+    )
+
+    assert sorted(packed_files) == [
+        "_artifacts.pack",
+        "_manifest.jsonl",
+        "_manifest.summary.json",
+    ]
+    per_file = load_source_manifest(tmp_path / "files")
+    packed = load_source_manifest(tmp_path / "packed")
+    assert len(packed.artifacts) == len(per_file.artifacts) > 20
+    for packed_artifact, file_artifact in zip(
+        packed.artifacts, per_file.artifacts
+    ):
+        assert packed_artifact.artifact_path == file_artifact.artifact_path
+        assert packed_artifact.content_sha256 == file_artifact.content_sha256
+        assert packed_artifact.payload == file_artifact.payload
+        assert packed_artifact.read_bytes() == file_artifact.read_bytes()
+
+    pack_path = tmp_path / "packed" / "_artifacts.pack"
+    data = bytearray(pack_path.read_bytes())
+    data[packed.artifacts[3].pack_offset + 10] ^= 1
+    pack_path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="artifact checksum mismatch"):
+        load_source_manifest(tmp_path / "packed")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 from pathlib import Path
 import sys
 
@@ -15,67 +16,96 @@ from importer.source_manifest import (  # noqa: E402
     ARTIFACT_FINGERPRINT_VERSION,
     load_source_manifest,
     platform_v2_content_node_inputs,
+    semantic_content_fingerprint,
+    stored_raw_fingerprint,
 )
 
 
-def _write_manifest(root: Path) -> Path:
+def _write_manifest(root: Path, count: int = 1, packed: bool = False) -> Path:
+    """Write ``count`` artifacts and their manifest; return the first artifact.
+
+    ``packed`` stores the artifacts in one ``_artifacts.pack``, and the pack
+    is returned instead.
+    """
     root.mkdir(exist_ok=True)
-    artifact_name = "000042_a123_voorbeeld_zn_1.json"
-    payload = {
-        "headword": "voorbeeld",
-        "part_of_speech": "zn",
-        "meanings": [{"definition": "een illustratie"}],
-        "meaning_id": 1,
-        "_source": {
-            "identity_scheme_version": "vandale-provider-article-v1",
-            "identity_evidence": {
-                "dictionary_id": "fnt",
-                "headword_raw": "voorbeeld",
-                "provider_article_id": "a123",
-            },
-            "provider_article_id": "a123",
-            "normalized_pos_status": "known",
-            "pos_evidence": {
+    records = []
+    pack = bytearray()
+    for number in range(count):
+        article_id = f"a{123 + number}"
+        suffix = "" if number == 0 else f"-{number}"
+        artifact_name = f"{42 + number:06d}_{article_id}_voorbeeld_zn_1.json"
+        payload = {
+            "headword": "voorbeeld",
+            "part_of_speech": "zn",
+            "meanings": [{"definition": f"een illustratie{suffix}"}],
+            "meaning_id": 1,
+            "_source": {
+                "identity_scheme_version": "vandale-provider-article-v1",
+                "identity_evidence": {
+                    "dictionary_id": "fnt",
+                    "headword_raw": "voorbeeld",
+                    "provider_article_id": article_id,
+                },
+                "provider_article_id": article_id,
                 "normalized_pos_status": "known",
-                "source": "headword_html",
-                "raw_value": "zn",
+                "pos_evidence": {
+                    "normalized_pos_status": "known",
+                    "source": "headword_html",
+                    "raw_value": "zn",
+                },
+                "source_group_key": (
+                    f"fnt:vandale-provider-article-v1:opaque{suffix}"
+                ),
+                "source_entry_key": (
+                    f"fnt:vandale-provider-article-v1:opaque{suffix}:1"
+                ),
+                "source_index": 42 + number,
+                "sense_ordinal": 1,
             },
-            "source_group_key": "fnt:vandale-provider-article-v1:opaque",
-            "source_entry_key": "fnt:vandale-provider-article-v1:opaque:1",
-            "source_index": 42,
-            "sense_ordinal": 1,
-        },
-    }
-    artifact_path = root / artifact_name
-    artifact_path.write_text(
-        json.dumps([payload], ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    record = {
-        "artifact_path": artifact_name,
-        "content_sha256": hashlib.sha256(artifact_path.read_bytes()).hexdigest(),
-        "identity_scheme_version": "vandale-provider-article-v1",
-        "source_entry_key": payload["_source"]["source_entry_key"],
-        "source_group_key": payload["_source"]["source_group_key"],
-    }
+        }
+        data = json.dumps([payload], ensure_ascii=False, indent=2).encode(
+            "utf-8"
+        )
+        record = {
+            "artifact_path": artifact_name,
+            "content_sha256": hashlib.sha256(data).hexdigest(),
+            "identity_scheme_version": "vandale-provider-article-v1",
+            "source_entry_key": payload["_source"]["source_entry_key"],
+            "source_group_key": payload["_source"]["source_group_key"],
+        }
+        if packed:
+            record["pack_offset"] = len(pack)
+            record["pack_length"] = len(data)
+            pack.extend(data)
+        else:
+            (root / artifact_name).write_bytes(data)
+        records.append(record)
     manifest_path = root / "_manifest.jsonl"
     manifest_path.write_text(
-        json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n",
+        "".join(
+            json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n"
+            for record in records
+        ),
         encoding="utf-8",
     )
     summary = {
-        "artifact_count": 1,
+        "artifact_count": count,
         "artifact_format_version": "vandale-structured-v2",
         "identity_scheme_version": "vandale-provider-article-v1",
         "input_sha256": "a" * 64,
         "manifest_sha256": hashlib.sha256(manifest_path.read_bytes()).hexdigest(),
-        "source_record_count": 1,
+        "source_record_count": count,
     }
+    if packed:
+        (root / "_artifacts.pack").write_bytes(pack)
+        summary["artifact_pack"] = "_artifacts.pack"
     (root / "_manifest.summary.json").write_text(
         json.dumps(summary),
         encoding="utf-8",
     )
-    return artifact_path
+    if packed:
+        return root / "_artifacts.pack"
+    return root / records[0]["artifact_path"]
 
 
 def _refresh_manifest_checksums(root: Path, artifact_path: Path) -> None:
@@ -110,6 +140,69 @@ def test_loads_and_verifies_a_source_manifest(tmp_path: Path) -> None:
     assert len(artifact.content_fingerprint) == 64
 
 
+def test_import_rows_come_from_the_loaded_payload(tmp_path: Path) -> None:
+    from importer.source_import import _artifact_row
+
+    artifact_path = _write_manifest(tmp_path)
+    artifact = load_source_manifest(tmp_path).artifacts[0]
+    artifact_path.unlink()
+
+    row = _artifact_row(
+        artifact,
+        word_entry_id="entry-1",
+        dictionary_id="dictionary-1",
+        language_code="nl",
+    )
+
+    assert row["headword"] == "voorbeeld"
+    assert row["meaning_id"] == 1
+    assert row["normalized_pos_status"] == "known"
+    assert row["raw"]["_source"] == artifact.payload["_source"]
+
+
+def test_fingerprints_drop_top_level_keys_without_copying(
+    tmp_path: Path,
+) -> None:
+    def reference(payload: dict, dropped: tuple[str, ...]) -> str:
+        kept = {key: value for key, value in payload.items() if key not in dropped}
+        canonical = json.dumps(
+            kept,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    artifact_path = _write_manifest(tmp_path)
+    payload = json.loads(artifact_path.read_text(encoding="utf-8"))[0]
+    payload["_raw_html"] = "<div>voorbeeld</div>"
+    before = json.dumps(payload, sort_keys=True)
+
+    assert stored_raw_fingerprint(payload) == reference(payload, ("_raw_html",))
+    assert semantic_content_fingerprint(payload) == reference(
+        payload,
+        (
+            "_raw_html",
+            "_metadata",
+            "_source",
+            "source_identity",
+            "part_of_speech_evidence",
+            "audio_links",
+            "images",
+        ),
+    )
+    assert json.dumps(payload, sort_keys=True) == before
+
+    artifact = load_source_manifest(tmp_path, lazy_payloads=True).artifacts[0]
+    fingerprint = artifact.stored_raw_fingerprint
+    assert fingerprint == stored_raw_fingerprint(
+        json.loads(artifact_path.read_text(encoding="utf-8"))[0]
+    )
+    # Memoized on the artifact: no second read of the payload.
+    artifact_path.unlink()
+    assert artifact.stored_raw_fingerprint == fingerprint
+
+
 def test_rejects_artifact_changed_after_manifest_was_written(
     tmp_path: Path,
 ) -> None:
@@ -201,3 +294,211 @@ def test_content_node_source_text_is_nfc_canonical() -> None:
     )
 
     assert nodes[0]["sourceText"] == "één voorbeeld"
+
+
+def test_content_node_columns_are_computed_once_per_artifact(
+    tmp_path: Path,
+) -> None:
+    artifact_path = _write_manifest(tmp_path)
+    artifact = load_source_manifest(tmp_path, lazy_payloads=True).artifacts[0]
+
+    columns = artifact.content_node_columns
+    assert columns.rows() == platform_v2_content_node_inputs(
+        json.loads(artifact_path.read_text(encoding="utf-8"))[0]
+    )
+    assert columns.report_atoms() == [
+        (
+            "definition",
+            columns.source_text_fingerprints[0],
+            "een illustratie",
+            1,
+        )
+    ]
+    artifact_path.unlink()
+    assert artifact.content_node_columns is columns
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_threaded_manifest_load_matches_serial_load(
+    tmp_path: Path, packed: bool
+) -> None:
+    _write_manifest(tmp_path, count=30, packed=packed)
+
+    serial = load_source_manifest(tmp_path)
+    threaded = load_source_manifest(tmp_path, workers=4)
+
+    assert threaded == serial
+
+
+def test_threaded_manifest_load_reports_first_failure_in_manifest_order(
+    tmp_path: Path,
+) -> None:
+    _write_manifest(tmp_path, count=30)
+    artifacts = load_source_manifest(tmp_path).artifacts
+    # Break two artifacts; the earlier one in the manifest must be reported
+    # whichever worker finishes first.
+    artifacts[-1].path.write_text("[]", encoding="utf-8")
+    artifacts[7].path.write_bytes(artifacts[7].read_bytes() + b" ")
+
+    for workers in (1, 4):
+        with pytest.raises(ValueError) as error:
+            load_source_manifest(tmp_path, workers=workers)
+        assert str(error.value) == (
+            f"artifact checksum mismatch: {artifacts[7].artifact_path}"
+        )
+
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        load_source_manifest(tmp_path, workers=0)
+
+
+def test_duplicate_source_entry_key_is_reported_before_invalid_ordinals(
+    tmp_path: Path,
+) -> None:
+    _write_manifest(tmp_path, count=2)
+    manifest_path = tmp_path / "_manifest.jsonl"
+    records = [
+        json.loads(line)
+        for line in manifest_path.read_text(encoding="utf-8").splitlines()
+    ]
+    # The second artifact repeats the first one's source keys and also has a
+    # float sense ordinal (a schema "integer", but not an int); the duplicate
+    # key is what a serial load reported first.
+    artifact_path = tmp_path / records[1]["artifact_path"]
+    payload = json.loads(artifact_path.read_text(encoding="utf-8"))[0]
+    for field in ("source_entry_key", "source_group_key"):
+        payload["_source"][field] = records[0][field]
+        records[1][field] = records[0][field]
+    payload["_source"]["sense_ordinal"] = 1.0
+    artifact_path.write_text(json.dumps([payload]), encoding="utf-8")
+    records[1]["content_sha256"] = hashlib.sha256(
+        artifact_path.read_bytes()
+    ).hexdigest()
+    manifest_path.write_text(
+        "".join(json.dumps(record) + "\n" for record in records),
+        encoding="utf-8",
+    )
+    summary_path = tmp_path / "_manifest.summary.json"
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary["manifest_sha256"] = hashlib.sha256(
+        manifest_path.read_bytes()
+    ).hexdigest()
+    summary_path.write_text(json.dumps(summary), encoding="utf-8")
+
+    for workers in (1, 4):
+        with pytest.raises(ValueError) as error:
+            load_source_manifest(tmp_path, workers=workers)
+        assert str(error.value) == (
+            f"duplicate source entry key: {records[0]['source_entry_key']}"
+        )
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_manifest_cache_skips_verification_of_an_unchanged_corpus(
+    tmp_path: Path, packed: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import importer.source_manifest as source_manifest
+
+    data_dir = tmp_path / "data"
+    _write_manifest(data_dir, count=8, packed=packed)
+    cache_dir = tmp_path / "cache"
+    verified = load_source_manifest(data_dir, cache_dir=cache_dir)
+    assert [path.name for path in cache_dir.iterdir()] == [
+        f"{verified.manifest_sha256}.json"
+    ]
+
+    def fail_verification(*args, **kwargs):
+        raise AssertionError("artifact was re-verified")
+
+    monkeypatch.setattr(source_manifest, "_verify_artifact", fail_verification)
+    assert load_source_manifest(data_dir, cache_dir=cache_dir) == verified
+    with pytest.raises(AssertionError, match="re-verified"):
+        load_source_manifest(data_dir, cache_dir=cache_dir, verify=True)
+    monkeypatch.undo()
+
+    # A same-size edit is caught through the mtime, which sends the load back
+    # through full verification. The mtime is bumped explicitly so the test
+    # does not depend on the filesystem's timestamp granularity.
+    artifact = verified.artifacts[5]
+    changed = artifact.path
+    stat = changed.stat()
+    data = bytearray(changed.read_bytes())
+    data[(artifact.pack_offset or 0) + 10] ^= 1
+    changed.write_bytes(bytes(data))
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    with pytest.raises(ValueError, match="artifact checksum mismatch"):
+        load_source_manifest(data_dir, cache_dir=cache_dir)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_manifest_cache_records_stats_taken_before_verification(
+    tmp_path: Path, packed: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import importer.source_manifest as source_manifest
+
+    data_dir = tmp_path / "data"
+    _write_manifest(data_dir, count=4, packed=packed)
+    cache_dir = tmp_path / "cache"
+    write_manifest_cache = source_manifest._write_manifest_cache
+
+    # Rewrite an artifact after its bytes were verified but before the cache
+    # is written; the cache must not vouch for the new size and mtime.
+    def rewrite_then_cache(cache_file, cache_key, reader, artifacts):
+        changed = artifacts[2]
+        stat = changed.path.stat()
+        data = bytearray(changed.path.read_bytes())
+        data[(changed.pack_offset or 0) + 10] ^= 1
+        changed.path.write_bytes(bytes(data))
+        os.utime(
+            changed.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000)
+        )
+        write_manifest_cache(cache_file, cache_key, reader, artifacts)
+
+    monkeypatch.setattr(
+        source_manifest, "_write_manifest_cache", rewrite_then_cache
+    )
+    load_source_manifest(data_dir, cache_dir=cache_dir)
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError, match="artifact checksum mismatch"):
+        load_source_manifest(data_dir, cache_dir=cache_dir)
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_lazy_payloads_match_eager_payloads(
+    tmp_path: Path, packed: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import importer.source_manifest as source_manifest
+
+    data_dir = tmp_path / "data"
+    _write_manifest(data_dir, count=8, packed=packed)
+    cache_dir = tmp_path / "cache"
+    eager = load_source_manifest(data_dir, cache_dir=cache_dir)
+    lazy = load_source_manifest(
+        data_dir, lazy_payloads=True, payload_cache_size=4
+    )
+
+    assert all(artifact.payload is None for artifact in lazy.artifacts)
+    assert [artifact.load_payload() for artifact in lazy.artifacts] == [
+        artifact.payload for artifact in eager.artifacts
+    ]
+    payload_cache = lazy.artifacts[0].payload_cache
+    assert len(payload_cache._payloads) == 4
+    assert lazy.artifacts[-1].load_payload() is lazy.artifacts[-1].load_payload()
+
+    # A lazy load from a fresh manifest cache decodes no payloads at all.
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("payload was decoded")
+
+    monkeypatch.setattr(source_manifest, "_load_payload", fail_decode)
+    cached = load_source_manifest(
+        data_dir, cache_dir=cache_dir, lazy_payloads=True
+    )
+    assert [artifact.content_fingerprint for artifact in cached.artifacts] == [
+        artifact.content_fingerprint for artifact in eager.artifacts
+    ]
+    monkeypatch.undo()
+
+    artifact = lazy.artifacts[2]
+    data = bytearray(artifact.path.read_bytes())
+    data[(artifact.pack_offset or 0) + 10] ^= 1
+    artifact.path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="artifact changed after manifest load"):
+        artifact.load_payload()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-entry Van Dale parsing with and without a shared parse context.
+
+The "rebuilt" variant reproduces the old behaviour by building a fresh tree
+every time a step asks for one; the "shared" variant builds each fragment once
+and reuses the headword tree for filename derivation. The "scanning" variant
+shares trees but answers every tag/class lookup with a bs4 tree walk instead
+of the context's one-pass index, isolating what the index saves.
+
+Usage:
+    python packages/scraper/parse_benchmark.py
+    python packages/scraper/parse_benchmark.py --input data/word_list.json --repeat 3
+    python packages/scraper/parse_benchmark.py --backend lxml
+"""
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SCRAPER_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRAPER_ROOT))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from vandale_html_parser import (  # noqa: E402
+    DEFAULT_PARSER_BACKEND,
+    PARSER_BACKENDS,
+    VandaleParseContext,
+    parse_vandale_entry_fixed,
+)
+
+DEFAULT_INPUT = SCRAPER_ROOT / "tests" / "fixtures" / "vandale_articles.json"
+
+
+class ScanningIndex:
+    """Drop-in for the context index that walks the tree on every lookup."""
+
+    def __init__(self, soup):
+        self.soup = soup
+
+    def find_all(self, name, class_=None, within=None):
+        root = self.soup if within is None else within
+        if class_ is None:
+            return root.find_all(name)
+        return root.find_all(name, class_=class_)
+
+    def find(self, name, class_=None, within=None):
+        root = self.soup if within is None else within
+        if class_ is None:
+            return root.find(name)
+        return root.find(name, class_=class_)
+
+
+class ScanningParseContext(VandaleParseContext):
+    """Shared trees, but no tag/class index."""
+
+    @property
+    def index(self):
+        return ScanningIndex(self.soup)
+
+
+class RebuildingParseContext(ScanningParseContext):
+    """Context that rebuilds trees on every access, like the pre-context parser."""
+
+    @property
+    def soup(self):
+        return BeautifulSoup(self.content_html, self.backend)
+
+    @property
+    def headword_soup(self):
+        if not self.headword_html:
+            return None
+        return BeautifulSoup(self.headword_html, self.backend)
+
+
+def _filename_base(context):
+    clean = context.headword_text(("sup",))
+    return re.sub(r"\s*\([^)]*\)\s*$", "", clean).strip()
+
+
+def _parse_rebuilt(record, backend):
+    context = RebuildingParseContext(
+        record["content"], record["headword"], backend
+    )
+    parsed = parse_vandale_entry_fixed(
+        record["content"], record["headword"], context=context
+    )
+    return parsed, _filename_base(context)
+
+
+def _parse_scanning(record, backend):
+    context = ScanningParseContext(record["content"], record["headword"], backend)
+    parsed = parse_vandale_entry_fixed(
+        record["content"], record["headword"], context=context
+    )
+    return parsed, _filename_base(context)
+
+
+def _parse_shared(record, backend):
+    context = VandaleParseContext(record["content"], record["headword"], backend)
+    parsed = parse_vandale_entry_fixed(
+        record["content"], record["headword"], context=context
+    )
+    return parsed, _filename_base(context)
+
+
+def _time_variant(records, parse, backend, repeat):
+    per_entry = []
+    for _ in range(repeat):
+        for record in records:
+            started = time.perf_counter()
+            parse(record, backend)
+            per_entry.append(time.perf_counter() - started)
+    return {
+        "entries": len(per_entry),
+        "mean_us": round(statistics.fmean(per_entry) * 1e6, 1),
+        "median_us": round(statistics.median(per_entry) * 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--backend",
+        choices=PARSER_BACKENDS + ("auto",),
+        default=DEFAULT_PARSER_BACKEND,
+    )
+    args = parser.parse_args()
+
+    records = [
+        record
+        for record in json.loads(args.input.read_text(encoding="utf-8"))
+        if record.get("headword") and record.get("content")
+    ]
+    if not records:
+        raise SystemExit(f"No parseable records in {args.input}")
+
+    for record in records:
+        expected = _parse_shared(record, args.backend)
+        if (
+            _parse_rebuilt(record, args.backend) != expected
+            or _parse_scanning(record, args.backend) != expected
+        ):
+            raise SystemExit(
+                f"Variants disagree for headword {record['headword']!r}"
+            )
+
+    rebuilt = _time_variant(records, _parse_rebuilt, args.backend, args.repeat)
+    scanning = _time_variant(records, _parse_scanning, args.backend, args.repeat)
+    shared = _time_variant(records, _parse_shared, args.backend, args.repeat)
+    report = {
+        "input": str(args.input),
+        "backend": args.backend,
+        "records": len(records),
+        "rebuilt": rebuilt,
+        "scanning": scanning,
+        "shared": shared,
+        "speedup": round(rebuilt["mean_us"] / shared["mean_us"], 2),
+        "index_speedup": round(scanning["mean_us"] / shared["mean_us"], 2),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
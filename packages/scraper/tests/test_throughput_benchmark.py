@@ -0,0 +1,35 @@
+from pathlib import Path
+import json
+import sys
+
+
+SCRAPER_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRAPER_ROOT))
+
+from throughput_benchmark import build_corpus  # noqa: E402
+from vandale_html_parser import parse_vandale_entry_fixed  # noqa: E402
+
+FIXTURE_ARTICLES = SCRAPER_ROOT / "tests" / "fixtures" / "vandale_articles.json"
+
+
+def test_build_corpus_scales_fixtures_with_unique_article_ids() -> None:
+    fixtures = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+    corpus = build_corpus(fixtures, len(fixtures) * 2 + 3)
+
+    assert [record["index"] for record in corpus] == list(range(1, len(corpus) + 1))
+    article_ids = [
+        parse_vandale_entry_fixed(record["content"], record["headword"])[
+            "source_identity"
+        ]["provider_article_id"]
+        for record in corpus
+    ]
+    assert len(set(article_ids)) == len(corpus)
+    assert article_ids[len(fixtures)] == f"{article_ids[0]}_1"
+
+    first_copy = parse_vandale_entry_fixed(
+        corpus[len(fixtures)]["content"], corpus[len(fixtures)]["headword"]
+    )
+    original = parse_vandale_entry_fixed(fixtures[0]["content"], fixtures[0]["headword"])
+    first_copy.pop("source_identity")
+    original.pop("source_identity")
+    assert first_copy == original
@@ -1,11 +1,22 @@
 from pathlib import Path
+import json
 import sys
 
 
 SCRAPER_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(SCRAPER_ROOT))
 
-from vandale_html_parser import parse_vandale_entry_fixed  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+import pytest  # noqa: E402
+from vandale_html_parser import (  # noqa: E402
+    DEFAULT_PARSER_BACKEND,
+    VandaleParseContext,
+    available_parser_backends,
+    parse_vandale_entry_fixed,
+    resolve_parser_backend,
+)
+
+FIXTURE_ARTICLES = SCRAPER_ROOT / "tests" / "fixtures" / "vandale_articles.json"
 
 
 def test_preserves_synonym_as_a_meaning_relation() -> None:
@@ -629,3 +640,132 @@ def test_preserves_provider_article_identity_evidence() -> None:
         "provider_article_id": "a113",
         "homograph_number": 1,
     }
+
+
+def test_headword_text_matches_decomposed_get_text() -> None:
+    headwords = [
+        "aan<sup>1</sup> <i>(bw)</i>",
+        "Nieuw-Zeeland <i>(zn)</i>",
+        "<b>lo</b>pen<sup> 2 </sup><i> (ww) </i>",
+        "bank",
+    ]
+
+    for headword in headwords:
+        context = VandaleParseContext("", headword)
+        for exclude, kwargs in [
+            (["sup"], {}),
+            (["sup", "i"], {"separator": " ", "strip": True}),
+        ]:
+            expected_soup = BeautifulSoup(headword, "html.parser")
+            for unwanted in expected_soup.find_all(exclude):
+                unwanted.decompose()
+
+            assert context.headword_text(exclude, **kwargs) == (
+                expected_soup.get_text(**kwargs)
+            )
+
+
+def test_shared_context_reuses_trees_and_matches_fresh_parse() -> None:
+    articles = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+
+    for article in articles:
+        context = VandaleParseContext(article["content"], article["headword"])
+        soup = context.soup
+        headword_soup = context.headword_soup
+
+        shared = parse_vandale_entry_fixed(
+            article["content"], article["headword"], context=context
+        )
+
+        assert context.soup is soup
+        assert context.headword_soup is headword_soup
+        assert shared == parse_vandale_entry_fixed(
+            article["content"], article["headword"]
+        )
+
+
+def test_shared_context_rejects_html_or_backend_it_was_not_built_from() -> None:
+    first, second = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))[:2]
+    context = VandaleParseContext(first["content"], first["headword"])
+
+    with pytest.raises(ValueError, match="must match the context's HTML"):
+        parse_vandale_entry_fixed(
+            second["content"], first["headword"], context=context
+        )
+    with pytest.raises(ValueError, match="must match the context's HTML"):
+        parse_vandale_entry_fixed(
+            first["content"], second["headword"], context=context
+        )
+
+    other_backends = [
+        backend
+        for backend in available_parser_backends()
+        if backend != context.backend
+    ]
+    for backend in other_backends:
+        with pytest.raises(ValueError, match="does not match the context's"):
+            parse_vandale_entry_fixed(
+                first["content"], first["headword"], context=context, backend=backend
+            )
+
+    assert parse_vandale_entry_fixed(
+        first["content"],
+        first["headword"],
+        context=context,
+        backend=DEFAULT_PARSER_BACKEND,
+    ) == parse_vandale_entry_fixed(first["content"], first["headword"])
+
+def test_index_lookups_match_tree_scans() -> None:
+    articles = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+
+    for article in articles:
+        context = VandaleParseContext(article["content"], article["headword"])
+        index = context.index
+        scopes = [None] + context.soup.find_all("span", class_=["f3u", "f1m", "f0c"])
+        classes = {
+            (tag.name, class_name)
+            for tag in context.soup.find_all(True)
+            for class_name in tag.get("class") or ()
+        }
+
+        for within in scopes:
+            root = context.soup if within is None else within
+            for name, class_name in classes:
+                indexed = index.find_all(name, class_name, within=within)
+                scanned = root.find_all(name, class_=class_name)
+                assert list(map(id, indexed)) == list(map(id, scanned))
+                assert index.find(name, class_name, within=within) is root.find(
+                    name, class_=class_name
+                )
+            assert list(map(id, index.find_all("img", within=within))) == (
+                list(map(id, root.find_all("img")))
+            )
+
+
+@pytest.mark.parametrize("backend", available_parser_backends())
+def test_backends_produce_byte_identical_entries(backend: str) -> None:
+    articles = json.loads(FIXTURE_ARTICLES.read_text(encoding="utf-8"))
+
+    for article in articles:
+        expected = parse_vandale_entry_fixed(
+            article["content"],
+            article["headword"],
+            backend=DEFAULT_PARSER_BACKEND,
+        )
+        actual = parse_vandale_entry_fixed(
+            article["content"],
+            article["headword"],
+            backend=backend,
+        )
+
+        assert json.dumps(actual, ensure_ascii=False, indent=2) == json.dumps(
+            expected, ensure_ascii=False, indent=2
+        ), article["headword"]
+
+
+def test_resolve_parser_backend_rejects_unknown_backend() -> None:
+    assert resolve_parser_backend(None) == DEFAULT_PARSER_BACKEND
+    assert resolve_parser_backend("auto") in available_parser_backends()
+
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        resolve_parser_backend("html5lib")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Measure Van Dale parse throughput on a synthetic corpus scaled to N articles.
+
+The corpus cycles through the fixture articles, giving every copy its own
+provider article id and source index so the full pipeline accepts it. Two
+phases are reported, each in a fresh interpreter so peak RSS is per phase:
+
+- "parse": ``parse_vandale_entry_fixed`` per article (entries/sec, p50/p99).
+- "pipeline": ``process_words`` from raw word list to artifacts and manifest
+  (entries/sec over the whole run).
+
+Usage:
+    python packages/scraper/throughput_benchmark.py --articles 2000
+    python packages/scraper/throughput_benchmark.py --articles 5000 --workers 4 \\
+        --output /tmp/parse-throughput.json
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import json
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRAPER_ROOT = Path(__file__).resolve().parent
+REPO_ROOT = SCRAPER_ROOT.parents[1]
+INGESTION_SCRIPTS = REPO_ROOT / "packages" / "ingestion" / "scripts"
+sys.path.insert(0, str(SCRAPER_ROOT))
+
+from vandale_html_parser import (  # noqa: E402
+    DEFAULT_PARSER_BACKEND,
+    PARSER_BACKENDS,
+    VandaleParseContext,
+    parse_vandale_entry_fixed,
+    resolve_parser_backend,
+)
+
+DEFAULT_INPUT = SCRAPER_ROOT / "tests" / "fixtures" / "vandale_articles.json"
+PHASES = ("parse", "pipeline")
+
+_ARTICLE_ID_RE = re.compile(r'(<span id=")([^"]+)(" class="f1y")')
+
+
+def build_corpus(records, articles):
+    """Return ``articles`` raw word-list records cycled from ``records``.
+
+    Copy ``k`` of an article gets the provider id suffix ``_k`` so source
+    entry keys stay unique; indexes run 1..N like a scraped word list.
+    """
+    records = [
+        record for record in records if record.get("headword") and record.get("content")
+    ]
+    if not records:
+        raise ValueError("No parseable records to build a corpus from")
+    corpus = []
+    for position in range(articles):
+        record = records[position % len(records)]
+        copy_number = position // len(records)
+        content = record["content"]
+        if copy_number:
+            content = _ARTICLE_ID_RE.sub(
+                lambda match: f"{match[1]}{match[2]}_{copy_number}{match[3]}",
+                content,
+                count=1,
+            )
+        corpus.append({**record, "content": content, "index": position + 1})
+    return corpus
+
+
+def _peak_rss_kib():
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1024 if sys.platform == "darwin" else 1
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale
+    return max(own, children)
+
+
+def _percentile(sorted_values, fraction):
+    position = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[position]
+
+
+def _run_parse_phase(corpus, backend):
+    per_entry = []
+    started = time.perf_counter()
+    for record in corpus:
+        entry_started = time.perf_counter()
+        context = VandaleParseContext(record["content"], record["headword"], backend)
+        parse_vandale_entry_fixed(
+            record["content"], record["headword"], context=context
+        )
+        per_entry.append(time.perf_counter() - entry_started)
+    elapsed = time.perf_counter() - started
+    per_entry.sort()
+    return {
+        "entries": len(per_entry),
+        "seconds": round(elapsed, 3),
+        "entries_per_sec": round(len(per_entry) / elapsed, 1),
+        "mean_us": round(statistics.fmean(per_entry) * 1e6, 1),
+        "p50_us": round(_percentile(per_entry, 0.50) * 1e6, 1),
+        "p99_us": round(_percentile(per_entry, 0.99) * 1e6, 1),
+        "peak_rss_kib": _peak_rss_kib(),
+    }
+
+
+def _run_pipeline_phase(corpus, backend, workers):
+    sys.path.insert(0, str(INGESTION_SCRIPTS))
+    from process_raw_words import process_words
+
+    with tempfile.TemporaryDirectory(prefix="parse-throughput-") as scratch:
+        input_file = Path(scratch) / "word_list.json"
+        input_file.write_text(json.dumps(corpus, ensure_ascii=False), encoding="utf-8")
+        output_dir = Path(scratch) / "processed"
+        started = time.perf_counter()
+        process_words(input_file, output_dir, backend, workers=workers)
+        elapsed = time.perf_counter() - started
+        artifacts = sum(
+            1 for path in output_dir.glob("*.json") if not path.name.startswith("_")
+        )
+    return {
+        "entries": len(corpus),
+        "artifacts": artifacts,
+        "workers": workers,
+        "seconds": round(elapsed, 3),
+        "entries_per_sec": round(len(corpus) / elapsed, 1),
+        "peak_rss_kib": _peak_rss_kib(),
+    }
+
+
+def _run_phase(phase, corpus, backend, workers):
+    if phase == "parse":
+        return _run_parse_phase(corpus, backend)
+    # process_words prints a run summary; keep stdout for the JSON report.
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        return _run_pipeline_phase(corpus, backend, workers)
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument(
+        "--backend",
+        choices=PARSER_BACKENDS + ("auto",),
+        default=DEFAULT_PARSER_BACKEND,
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=list(PHASES))
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+    if args.articles < 1:
+        parser.error("--articles must be at least 1")
+
+    backend = resolve_parser_backend(args.backend)
+    corpus = build_corpus(
+        json.loads(args.input.read_text(encoding="utf-8")), args.articles
+    )
+
+    report = {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "backend": backend,
+        "input": str(args.input),
+        "articles": len(corpus),
+    }
+    spawn = multiprocessing.get_context("spawn")
+    for phase in args.phases:
+        # A fresh interpreter per phase keeps ru_maxrss from carrying over.
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+            report[phase] = executor.submit(
+                _run_phase, phase, corpus, backend, args.workers
+            ).result()
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,159 @@
 """
 Fixed parser with proper idiom/expression handling.
 """
+from bisect import bisect_left
+from functools import cached_property, lru_cache
 import json
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
 import re
 
+# Tree builders the parser is verified against; lxml is optional and only
+# used when installed. "auto" prefers lxml and falls back to html.parser.
+PARSER_BACKENDS = ("html.parser", "lxml")
+DEFAULT_PARSER_BACKEND = "html.parser"
+
+# Patterns applied to every entry (or every span of one), compiled once.
+_WHITESPACE_RE = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCTUATION_RE = re.compile(r"\s+([,.;:])")
+_PARENTHESIZED_RE = re.compile(r"\(([^)]+)\)")
+_ARTICLE_POS_LABEL_RE = re.compile(
+    r"\((ww|znw?|zn|bw|bn|vz|werkwoord|zelfstandig naamwoord|bijvoeglijk naamwoord|bijwoord|voorzetsel)\)",
+    re.IGNORECASE,
+)
+_CONJUGATION_AUXILIARY_RE = re.compile(r"\b(heeft|hebben|is|zijn)\b", re.IGNORECASE)
+_INLINE_CONTEXT_RE = re.compile(r"^\(([^()]*)\)\s*(.+)$")
+
+
+def available_parser_backends():
+    """Return the installed tree builders, in ``PARSER_BACKENDS`` order."""
+    return tuple(
+        backend
+        for backend in PARSER_BACKENDS
+        if builder_registry.lookup(backend) is not None
+    )
+
+
+def resolve_parser_backend(backend=None):
+    """Map a backend name (or ``"auto"``) to an installed tree builder."""
+    backend = backend or DEFAULT_PARSER_BACKEND
+    available = available_parser_backends()
+    if backend == "auto":
+        return available[-1]
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend {backend!r}; "
+            f"expected one of {', '.join(PARSER_BACKENDS + ('auto',))}"
+        )
+    if backend not in available:
+        raise ValueError(f"Parser backend {backend!r} is not installed")
+    return backend
+
+
+class _TagIndex:
+    """Tags of one tree bucketed by name and by (name, class) in a single pass.
+
+    Buckets keep document order, so ``find``/``find_all`` return what the
+    matching bs4 calls would; ``within`` limits a lookup to a tag's
+    descendants. The tree must not be edited after indexing.
+    """
+
+    def __init__(self, soup):
+        self._positions = {}
+        self._subtree_ends = []
+        self._by_name = {}
+        self._by_class = {}
+        stack = [iter(soup.children)]
+        open_positions = []
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                if open_positions:
+                    self._subtree_ends[open_positions.pop()] = len(
+                        self._subtree_ends
+                    )
+                continue
+            if child.name is None:
+                continue
+            position = len(self._subtree_ends)
+            self._positions[id(child)] = position
+            self._subtree_ends.append(position + 1)
+            self._by_name.setdefault(child.name, []).append((position, child))
+            for class_name in dict.fromkeys(child.get("class") or ()):
+                self._by_class.setdefault((child.name, class_name), []).append(
+                    (position, child)
+                )
+            open_positions.append(position)
+            stack.append(iter(child.children))
+
+    def find_all(self, name, class_=None, within=None):
+        bucket = (
+            self._by_name.get(name, ())
+            if class_ is None
+            else self._by_class.get((name, class_), ())
+        )
+        if within is None:
+            return [tag for _, tag in bucket]
+        start = self._positions[id(within)]
+        end = self._subtree_ends[start]
+        first = bisect_left(bucket, start + 1, key=lambda item: item[0])
+        last = bisect_left(bucket, end, lo=first, key=lambda item: item[0])
+        return [tag for _, tag in bucket[first:last]]
+
+    def find(self, name, class_=None, within=None):
+        matches = self.find_all(name, class_, within)
+        return matches[0] if matches else None
+
+
+class VandaleParseContext:
+    """Build each HTML fragment's tree once and share it across extraction steps.
+
+    The article tree is read-only for the parser: steps that need to edit a
+    subtree work on a copy, and headword text is read without decomposing tags
+    so the same headword tree can serve the parser and filename derivation.
+    """
+
+    def __init__(self, content_html, headword_html=None, backend=None):
+        self.content_html = content_html
+        self.headword_html = headword_html
+        self.backend = resolve_parser_backend(backend)
+
+    @cached_property
+    def soup(self):
+        return BeautifulSoup(self.content_html, self.backend)
+
+    @cached_property
+    def index(self):
+        """Name/class lookup table over ``soup``, built on first use."""
+        return _TagIndex(self.soup)
+
+    @cached_property
+    def headword_soup(self):
+        if not self.headword_html:
+            return None
+        return BeautifulSoup(self.headword_html, self.backend)
+
+    def headword_text(self, exclude=(), separator="", strip=False):
+        """Return headword text as ``get_text`` would after removing ``exclude`` tags."""
+        headword_soup = self.headword_soup
+        if headword_soup is None:
+            return ""
+        parts = []
+        for string in headword_soup.strings:
+            if exclude and string.find_parent(list(exclude)) is not None:
+                continue
+            if strip:
+                string = string.strip()
+                if not string:
+                    continue
+            parts.append(string)
+        return separator.join(parts)
+
 
 def _clean_text(value: str) -> str:
-    value = re.sub(r"\s+", " ", value or "")
-    return re.sub(r"\s+([,.;:])", r"\1", value).strip()
+    value = _WHITESPACE_RE.sub(" ", value or "")
+    return _SPACE_BEFORE_PUNCTUATION_RE.sub(r"\1", value).strip()
 
 
 def _extract_direct_synonyms(f1m_span):
@@ -267,6 +412,7 @@ def _remove_leading_parentheticals(f1m_span):
             return
 
 
+@lru_cache(maxsize=1024)
 def _normalize_part_of_speech(raw: str) -> str:
     """
     Map various Dutch part‑of‑speech labels/abbreviations to short codes.
@@ -459,9 +605,35 @@ def parse_reference_tables(soup):
 
 
 
-def parse_vandale_entry_fixed(content_html, headword_html=None):
-    """Parse Van Dale HTML with all features."""
-    soup = BeautifulSoup(content_html, "html.parser")
+def parse_vandale_entry_fixed(
+    content_html, headword_html=None, context=None, backend=None
+):
+    """Parse Van Dale HTML with all features.
+
+    Pass a ``VandaleParseContext`` to reuse its trees for later steps such as
+    filename derivation; otherwise a private one is built for this call with
+    the requested tree-builder ``backend``. With a context, the parse always
+    reads the context's trees, so ``content_html`` and ``headword_html`` must
+    equal the HTML it was built from, and ``backend``, when given, must
+    resolve to its backend; a mismatch raises ``ValueError``.
+    """
+    if context is None:
+        context = VandaleParseContext(content_html, headword_html, backend)
+    elif (
+        content_html != context.content_html
+        or headword_html != context.headword_html
+    ):
+        raise ValueError(
+            "content_html and headword_html must match the context's HTML"
+        )
+    elif backend is not None and resolve_parser_backend(backend) != context.backend:
+        raise ValueError(
+            f"Parser backend {backend!r} does not match the context's "
+            f"{context.backend!r}"
+        )
+    soup = context.soup
+    index = context.index
+    headword_soup = context.headword_soup
     
     entry = {
         "headword": "",
@@ -487,18 +659,20 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
     }
 
     source_identity = {}
-    article_span = soup.find("span", class_="f1y", id=True)
+    article_span = next(
+        (span for span in index.find_all("span", "f1y") if span.get("id") is not None),
+        None,
+    )
     if article_span and article_span.get("id"):
         source_identity["provider_article_id"] = article_span["id"]
 
     homograph_number = None
-    if headword_html:
-        headword_identity_soup = BeautifulSoup(headword_html, "html.parser")
-        superscript = headword_identity_soup.find("sup")
+    if headword_soup is not None:
+        superscript = headword_soup.find("sup")
         if superscript and superscript.get_text(strip=True).isdigit():
             homograph_number = int(superscript.get_text(strip=True))
     if homograph_number is None:
-        number_span = soup.find("span", class_="f1p")
+        number_span = index.find("span", "f1p")
         if number_span and number_span.get_text(strip=True).isdigit():
             homograph_number = int(number_span.get_text(strip=True))
     if homograph_number is not None:
@@ -507,18 +681,18 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
         entry["source_identity"] = source_identity
     
     # NT2-2000 marker
-    marker = soup.find('span', class_='f3j')
+    marker = index.find("span", "f3j")
     if marker and marker.get_text(strip=True) == '•':
         entry["is_nt2_2000"] = True
     
     # Gender
-    gender_span = soup.find("span", class_="f2f")
+    gender_span = index.find("span", "f2f")
     if gender_span:
         entry["gender"] = gender_span.get_text(strip=True)
     
     # Headword and pronunciation
     # Headword and pronunciation
-    headword_span = soup.find("span", class_="f2h")
+    headword_span = index.find("span", "f2h")
     if headword_span:
         text_parts = []
         syllables = []
@@ -592,7 +766,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
             entry["pronunciation_with_stress"] = "·".join(stressed_repr)
 
     # Capture additional gendered headwords listed in the headword block (e.g. de ... , de ...)
-    headword_block = soup.find("span", class_="f3v")
+    headword_block = index.find("span", "f3v")
     if headword_block:
         variants = []
         current_variant = None
@@ -674,13 +848,12 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
 
     # 0) Prefer explicit POS from the separate headword HTML, if provided by the API
     #    e.g. "bestaan<sup>2</sup> <i>(ww)</i>" or "... <i>(zn)</i>"
-    if headword_html:
-        hw_soup = BeautifulSoup(headword_html, "html.parser")
-        i_tag = hw_soup.find("i")
+    if headword_soup is not None:
+        i_tag = headword_soup.find("i")
         if i_tag:
             txt = i_tag.get_text(" ", strip=True)
             if txt:
-                m = re.search(r"\(([^)]+)\)", txt)
+                m = _PARENTHESIZED_RE.search(txt)
                 pos_text = (m.group(1).strip() if m else txt.strip())
                 pos_evidence_source = "headword_html"
                 pos_evidence_raw = pos_text
@@ -689,13 +862,13 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
     # 1) Look for dedicated POS span(s) in the article HTML.
     # Restrict to known POS keywords to avoid picking up usage labels (e.g. percentages).
     if not pos_text:
-        for span in soup.find_all("span", class_="f1k"):
+        for span in index.find_all("span", "f1k"):
             text = span.get_text(" ", strip=True)
             if not text:
                 continue
 
             # Most entries put POS inside parentheses, e.g. "(zn.)", "(werkwoord)"
-            m = re.search(r"\(([^)]+)\)", text)
+            m = _PARENTHESIZED_RE.search(text)
             candidate = m.group(1).strip() if m else text.strip()
             normalized = _normalize_part_of_speech(candidate)
             if normalized:
@@ -707,11 +880,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
 
     # 2) Very conservative fallback on raw HTML: only match known POS codes/labels
     if not pos_text:
-        m = re.search(
-            r"\((ww|znw?|zn|bw|bn|vz|werkwoord|zelfstandig naamwoord|bijvoeglijk naamwoord|bijwoord|voorzetsel)\)",
-            content_html,
-            re.IGNORECASE,
-        )
+        m = _ARTICLE_POS_LABEL_RE.search(context.content_html)
         if m:
             pos_text = m.group(1).strip()
             pos_evidence_source = "article_html_label"
@@ -720,7 +889,9 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
 
     # 3) Heuristic: Check for "werkwoordrijtje" link
     if not pos_text:
-        if soup.find("a", class_="f3g", string="werkwoordrijtje"):
+        if any(
+            link.string == "werkwoordrijtje" for link in index.find_all("a", "f3g")
+        ):
             pos_text = "ww"
             pos_evidence_source = "conjugation_table_heuristic"
             pos_evidence_raw = "ww"
@@ -728,17 +899,13 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
     # 4) Some newer provider articles omit the POS label but retain a
     # conjugation group such as "(accepteerde, heeft geaccepteerd)".
     if not pos_text:
-        source_headword_block = soup.find("span", class_="f3v")
+        source_headword_block = index.find("span", "f3v")
         source_headword_text = (
             source_headword_block.get_text(" ", strip=True)
             if source_headword_block
             else ""
         )
-        if re.search(
-            r"\b(heeft|hebben|is|zijn)\b",
-            source_headword_text,
-            re.IGNORECASE,
-        ):
+        if _CONJUGATION_AUXILIARY_RE.search(source_headword_text):
             pos_text = "ww"
             pos_evidence_source = "conjugation_heuristic"
             pos_evidence_raw = "ww"
@@ -754,20 +921,15 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
     if not entry["part_of_speech"]:
         if any(
             span.get_text(" ", strip=True).lower() == "meervoud"
-            for span in soup.find_all("span", class_="f1k")
+            for span in index.find_all("span", "f1k")
         ):
             entry["part_of_speech"] = "zn"
             pos_evidence_source = "plural_marker_heuristic"
             pos_evidence_raw = "meervoud"
 
-    source_headword = ""
-    if headword_html:
-        source_headword_soup = BeautifulSoup(headword_html, "html.parser")
-        for unwanted in source_headword_soup.find_all(["sup", "i"]):
-            unwanted.decompose()
-        source_headword = _clean_text(
-            source_headword_soup.get_text(" ", strip=True)
-        )
+    source_headword = _clean_text(
+        context.headword_text(("sup", "i"), " ", strip=True)
+    )
     
     # 6) Heuristic: Check for prefix/suffix based on hyphen
     if not entry["part_of_speech"]:
@@ -835,7 +997,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
     
     # Cross-reference detection (e.g., "zie aanzien")
     # Look for <span class="f1v">zie</span> followed by a link
-    zie_spans = soup.find_all('span', class_='f1v')
+    zie_spans = index.find_all("span", "f1v")
     for zie_span in zie_spans:
         zie_text = zie_span.get_text(strip=True).lower()
         if zie_text in ['zie', 'see']:
@@ -848,7 +1010,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
                     break
     
     # Plural and diminutive (for nouns)
-    form_spans = soup.find_all("span", class_="f1v")
+    form_spans = index.find_all("span", "f1v")
     for span in form_spans:
         text = span.get_text()
         
@@ -909,7 +1071,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
     # These often appear right after the headword/pronunciation, before any f1v labels
     if entry["part_of_speech"] == "ww":
         # Limit scope to the headword block (f3v) to avoid capturing examples in meanings (f3u)
-        headword_block = soup.find("span", class_="f3v")
+        headword_block = index.find("span", "f3v")
         if headword_block:
             # Find the opening parenthesis and collect f1k spans until we hit an f1v label or semicolon
             filtered_f1k = []
@@ -952,7 +1114,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
 
     # Strategy 2: Old logic (fallback)
     if entry["part_of_speech"] == "ww" and not entry["verb_forms"] and headword_span:
-        verb_spans = headword_span.find_all("span", class_="f1k")
+        verb_spans = index.find_all("span", "f1k", within=headword_span)
         verb_parts = []
         for vf in verb_spans:
             text = vf.get_text(strip=True)
@@ -970,7 +1132,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
             entry["conjugation_table"] = conjugation
     
     # Meanings
-    meaning_blocks = soup.find_all("span", class_="f3u")
+    meaning_blocks = index.find_all("span", "f3u")
     
     for block in meaning_blocks:
         meaning = {
@@ -982,12 +1144,12 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
         
         # Main definition - extract from f1m span to include links and reference numbers
         # but exclude the examples section (f2s spans) and idiom blocks
-        f1m_span = block.find("span", class_="f1m")
+        f1m_span = index.find("span", "f1m", within=block)
         if f1m_span:
             # Check if there's a main definition (f3i NOT inside an idiom block)
             # Idiom blocks are marked with f0c or f1f classes
             main_def_span = None
-            for f3i in f1m_span.find_all("span", class_="f3i"):
+            for f3i in index.find_all("span", "f3i", within=f1m_span):
                 # Check if this f3i is inside an idiom block
                 is_in_idiom = False
                 for parent in f3i.parents:
@@ -1020,7 +1182,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
             note_text = _clean_text(
                 " ".join(
                     note.get_text(" ", strip=True)
-                    for note in f1m_span.find_all("span", class_="f3e")
+                    for note in index.find_all("span", "f3e", within=f1m_span)
                 )
             )
             if note_text:
@@ -1103,10 +1265,13 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
         
         # Context (bracketed text) - extract from f0j spans that contain brackets
         # Look for pattern: <span class="f0j"><span class="f1l">[</span>...<span class="f1l">]</span></span>
-        f0j_spans = block.find_all("span", class_="f0j")
+        f0j_spans = index.find_all("span", "f0j", within=block)
         for f0j in f0j_spans:
             # Check if this span contains brackets
-            f1l_texts = [s.get_text(strip=True) for s in f0j.find_all("span", class_="f1l")]
+            f1l_texts = [
+                s.get_text(strip=True)
+                for s in index.find_all("span", "f1l", within=f0j)
+            ]
             if '[' in f1l_texts and ']' in f1l_texts:
                 # This is a bracketed context - extract the content between brackets
                 context_text = f0j.get_text(" ", strip=True)
@@ -1116,17 +1281,14 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
                     meaning["context"] = context_text
                     break
 
-        inline_context = re.match(
-            r"^\(([^()]*)\)\s*(.+)$",
-            meaning["definition"],
-        )
+        inline_context = _INLINE_CONTEXT_RE.match(meaning["definition"])
         if inline_context and inline_context.group(1).rstrip().endswith(":"):
             if not meaning["context"]:
                 meaning["context"] = inline_context.group(1).rstrip(": ").strip()
             meaning["definition"] = inline_context.group(2).strip()
         
         # Regular examples
-        example_spans = block.find_all("span", class_="f2s")
+        example_spans = index.find_all("span", "f2s", within=block)
         for ex_span in example_spans:
             if ex_span.find_parent("span", class_=["f0c", "f1f"]):
                 continue
@@ -1135,23 +1297,23 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
                 meaning["examples"].append(example_text)
         
         # Idioms/expressions (nested in class f0c or f1f)
-        idiom_blocks = block.find_all("span", class_="f0c")
+        idiom_blocks = index.find_all("span", "f0c", within=block)
         for idiom_block in idiom_blocks:
             idiom = {}
             
             # Idiom text
-            idiom_span = idiom_block.find("span", class_="f3i")
+            idiom_span = index.find("span", "f3i", within=idiom_block)
             if idiom_span:
                 idiom["expression"] = idiom_span.get_text(strip=True)
             
             # Explanation
-            expl_span = idiom_block.find("span", class_="f3n")
+            expl_span = index.find("span", "f3n", within=idiom_block)
             if expl_span:
                 idiom["explanation"] = expl_span.get_text(strip=True)
 
             idiom_examples = [
                 example.get_text(strip=True)
-                for example in idiom_block.find_all("span", class_="f2s")
+                for example in index.find_all("span", "f2s", within=idiom_block)
                 if example.get_text(strip=True)
             ]
             if idiom_examples:
@@ -1165,7 +1327,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
             entry["meanings"].append(meaning)
     
     # Audio
-    audio_links = soup.find_all("a", class_="audiofile")
+    audio_links = index.find_all("a", "audiofile")
     for link in audio_links:
         href = link.get("href", "")
         if "/nl/" in href:
@@ -1174,7 +1336,7 @@ def parse_vandale_entry_fixed(content_html, headword_html=None):
             entry["audio_links"]["be"] = href
     
     # Images
-    images = soup.find_all("img")
+    images = index.find_all("img")
     for img in images:
         src = img.get('src', '')
         if src and 'http' in src: